@@ -75,6 +75,8 @@ class DataWriter(abc.ABC):
             return ParquetDataWriter  # type: ignore
         elif file_format == "arrow":
             return ArrowWriter # type: ignore
+        elif file_format == "msgpack":
+            return MsgpackWriter
         else:
             raise ValueError(file_format)
 
@@ -125,6 +127,37 @@ class JsonlListPUAEncodeWriter(JsonlWriter):
         )
 
 
+class MsgpackWriter(DataWriter):
+    """Writes python objects into binary msgpack stream preserving their types. Used to pass data from extract to normalize"""
+
+    def __init__(self, f: IO[Any], caps: DestinationCapabilitiesContext = None) -> None:
+        super().__init__(f, caps)
+        from dlt.common.libs.msgpack import typed_packer
+
+        self._packer = typed_packer()
+
+    def write_header(self, columns_schema: TTableSchemaColumns) -> None:
+        pass
+
+    def write_data(self, rows: Sequence[Any]) -> None:
+        super().write_data(rows)
+        # write all rows as one list so reader gets the same chunks as with puae-jsonl
+        self._f.write(self._packer.pack(list(rows)))
+
+    def write_footer(self) -> None:
+        pass
+
+    @classmethod
+    def data_format(cls) -> TFileFormatSpec:
+        return TFileFormatSpec(
+            "msgpack",
+            file_extension="msgpack",
+            is_binary_format=True,
+            supports_schema_changes=True,
+            supports_compression=False,
+        )
+
+
 class InsertValuesWriter(DataWriter):
 
     def __init__(self, f: IO[Any], caps: DestinationCapabilitiesContext = None) -> None:
@@ -247,6 +247,14 @@ class JobClientBase(ABC):
         """Finds and restores already started loading job identified by `file_path` if destination supports it."""
         pass
 
+    def poll_jobs(self, jobs: Sequence[LoadJob]) -> List[TLoadJobState]:
+        """Returns current states of running `jobs` in the same order. Destinations may override it to get the states in a single batch call.
+
+        Overriding implementations are called within the client context. The default implementation polls each job with `LoadJob.state()`
+        and the loader calls `LoadJob.state()` directly instead, without opening the client.
+        """
+        return [job.state() for job in jobs]
+
     def should_truncate_table_before_load(self, table: TTableSchema) -> bool:
         return table["write_disposition"] == "replace"
 
@@ -0,0 +1,103 @@
+from datetime import date, datetime, time  # noqa: I251
+from enum import Enum
+from typing import IO, Any, Callable, Dict, Iterator, Union
+from uuid import UUID
+from hexbytes import HexBytes
+
+from dlt.common.arithmetics import Decimal
+from dlt.common.exceptions import MissingDependencyException
+from dlt.common.json import custom_encode, _datetime_decoder
+from dlt.common import pendulum
+from dlt.common.wei import Wei
+
+try:
+    import msgpack
+except ModuleNotFoundError:
+    raise MissingDependencyException("DLT msgpack Helpers", ["msgpack"], "DLT Helpers for binary msgpack intermediate files.")
+
+
+# use msgpack extension types to preserve python types that are not natively supported
+_DECIMAL = 1
+_DATETIME = 2
+_DATE = 3
+_TIME = 4
+_UUIDT = 5
+_HEXBYTES = 6
+_WEI = 7
+
+# define decoder for each extension type
+DECODERS: Dict[int, Callable[[bytes], Any]] = {
+    _DECIMAL: lambda b: Decimal(b.decode("ascii")),
+    _DATETIME: lambda b: _datetime_decoder(b.decode("ascii")),
+    _DATE: lambda b: pendulum.Date.fromisoformat(b.decode("ascii")),  # type: ignore[attr-defined]
+    _TIME: lambda b: pendulum.Time.fromisoformat(b.decode("ascii")),  # type: ignore[attr-defined]
+    _UUIDT: lambda b: UUID(bytes=b),
+    _HEXBYTES: HexBytes,
+    _WEI: lambda b: Wei(b.decode("ascii")),
+}
+
+
+def custom_ext_encode(obj: Any) -> Any:
+    """Encodes types not supported by msgpack. Typed values are stored as extension types, other values are converted like in json."""
+    # wei is subclass of decimal and must be checked first
+    if isinstance(obj, Wei):
+        return msgpack.ExtType(_WEI, str(obj).encode("ascii"))
+    elif isinstance(obj, Decimal):
+        return msgpack.ExtType(_DECIMAL, str(obj).encode("ascii"))
+    # this works both for standard datetime and pendulum
+    elif isinstance(obj, datetime):
+        return msgpack.ExtType(_DATETIME, obj.isoformat().encode("ascii"))
+    elif isinstance(obj, date):
+        return msgpack.ExtType(_DATE, obj.isoformat().encode("ascii"))
+    elif isinstance(obj, time):
+        return msgpack.ExtType(_TIME, obj.isoformat().encode("ascii"))
+    elif isinstance(obj, UUID):
+        return msgpack.ExtType(_UUIDT, obj.bytes)
+    elif isinstance(obj, HexBytes):
+        return msgpack.ExtType(_HEXBYTES, bytes(obj))
+    elif isinstance(obj, Enum):
+        # Enum value is just int or str
+        return obj.value
+    # packer uses strict types so subclasses of built in types and tuples end up here
+    elif isinstance(obj, dict):
+        return dict(obj)
+    elif isinstance(obj, (list, tuple)):
+        return list(obj)
+    elif isinstance(obj, str):
+        return str(obj)
+    elif isinstance(obj, bool):
+        return bool(obj)
+    elif isinstance(obj, int):
+        return int(obj)
+    elif isinstance(obj, float):
+        return float(obj)
+    elif isinstance(obj, (bytes, bytearray)):
+        return bytes(obj)
+    # dataclasses, named tuples and pydantic models are converted like in json
+    return custom_encode(obj)
+
+
+def custom_ext_decode(code: int, data: bytes) -> Any:
+    decoder = DECODERS.get(code)
+    if decoder is None:
+        return msgpack.ExtType(code, data)
+    return decoder(data)
+
+
+def typed_packer() -> "msgpack.Packer":
+    """Creates a packer that preserves python types. Packer is not thread safe and should not be shared between writers"""
+    return msgpack.Packer(default=custom_ext_encode, use_bin_type=True, strict_types=True, autoreset=True)
+
+
+def typed_dumpb(obj: Any) -> bytes:
+    return typed_packer().pack(obj)
+
+
+def typed_loadb(s: Union[bytes, bytearray, memoryview]) -> Any:
+    return msgpack.unpackb(s, ext_hook=custom_ext_decode, raw=False, strict_map_key=False)
+
+
+def typed_load_stream(fp: IO[bytes]) -> Iterator[Any]:
+    """Yields subsequent objects packed into a binary stream `fp`"""
+    unpacker = msgpack.Unpacker(fp, ext_hook=custom_ext_decode, raw=False, strict_map_key=False, max_buffer_size=0)
+    yield from unpacker
@@ -25,6 +25,7 @@ TColumnHint = Literal["not_null", "partition", "cluster", "primary_key", "foreig
 """Known hints of a column used to declare hint regexes."""
 TWriteDisposition = Literal["skip", "append", "replace", "merge"]
 TTableFormat = Literal["iceberg"]
+TMergeStrategy = Literal["delete-insert", "upsert"]
 TTypeDetections = Literal["timestamp", "iso_timestamp", "iso_date", "large_integer", "hexbytes_to_text", "wei_to_double"]
 TTypeDetectionFunc = Callable[[Type[Any], Any], Optional[TDataType]]
 TColumnNames = Union[str, Sequence[str]]
@@ -88,6 +89,7 @@ class TTableSchema(TypedDict, total=False):
     columns: TTableSchemaColumns
     resource: Optional[str]
     table_format: Optional[TTableFormat]
+    merge_strategy: Optional[TMergeStrategy]
 
 
 class TPartialTableSchema(TTableSchema):
@@ -15,7 +15,7 @@ from dlt.common.typing import DictStrAny, REPattern, is_dict_generic_type
 from dlt.common.validation import TCustomValidator, validate_dict, validate_dict_ignoring_xkeys
 from dlt.common.schema import detections
 from dlt.common.schema.typing import (COLUMN_HINTS, SCHEMA_ENGINE_VERSION, LOADS_TABLE_NAME, SIMPLE_REGEX_PREFIX, VERSION_TABLE_NAME, TColumnName, TPartialTableSchema, TSchemaTables, TSchemaUpdate,
-                                      TSimpleRegex, TStoredSchema, TTableSchema, TTableSchemaColumns, TColumnSchemaBase, TColumnSchema, TColumnProp, TTableFormat,
+                                      TSimpleRegex, TStoredSchema, TTableSchema, TTableSchemaColumns, TColumnSchemaBase, TColumnSchema, TColumnProp, TTableFormat, TMergeStrategy,
                                       TColumnHint, TTypeDetectionFunc, TTypeDetections, TWriteDisposition)
 from dlt.common.schema.exceptions import (CannotCoerceColumnException, ParentTableNotFoundException, SchemaEngineNoUpgradePathException, SchemaException,
                                           TablePropertiesConflictException, InvalidSchemaName, UnknownTableException)
@@ -518,6 +518,10 @@ def get_table_format(tables: TSchemaTables, table_name: str) -> TTableFormat:
     return cast(TTableFormat, get_inherited_table_hint(tables, table_name, "table_format", allow_none=True))
 
 
+def get_merge_strategy(tables: TSchemaTables, table_name: str) -> TMergeStrategy:
+    return cast(TMergeStrategy, get_inherited_table_hint(tables, table_name, "merge_strategy", allow_none=True))
+
+
 def table_schema_has_type(table: TTableSchema, _typ: TDataType) -> bool:
     """Checks if `table` schema contains column with type _typ"""
     return any(c.get("data_type") == _typ for c in table["columns"].values())
@@ -649,7 +653,8 @@ def new_table(
     columns: Sequence[TColumnSchema] = None,
     validate_schema: bool = False,
     resource: str = None,
-    table_format: TTableFormat = None
+    table_format: TTableFormat = None,
+    merge_strategy: TMergeStrategy = None
 ) -> TTableSchema:
 
     table: TTableSchema = {
@@ -666,6 +671,8 @@ def new_table(
         table["resource"] = resource or table_name
         if table_format:
             table["table_format"] = table_format
+        if merge_strategy:
+            table["merge_strategy"] = merge_strategy
     if validate_schema:
         validate_dict_ignoring_xkeys(
             spec=TColumnSchema,
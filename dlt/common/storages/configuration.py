@@ -38,9 +38,11 @@ class NormalizeStorageConfiguration(BaseConfiguration):
 class LoadStorageConfiguration(BaseConfiguration):
     load_volume_path: str = None  # path to volume where files to be loaded to analytical storage are stored
     delete_completed_jobs: bool = False  # if set to true the folder with completed jobs will be deleted
+    use_jobs_journal: bool = False  # if set to true job state changes are appended to a journal in the package instead of moving job files between folders
+    fsync_jobs_journal: bool = True  # flushes the jobs journal to disk on each job state change
 
     if TYPE_CHECKING:
-        def __init__(self, load_volume_path: str = None, delete_completed_jobs: bool = None) -> None:
+        def __init__(self, load_volume_path: str = None, delete_completed_jobs: bool = None, use_jobs_journal: bool = None, fsync_jobs_journal: bool = None) -> None:
             ...
 
 
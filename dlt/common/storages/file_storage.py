@@ -1,12 +1,14 @@
 import gzip
+import mmap
 import os
 import re
 import stat
 import errno
 import tempfile
 import shutil
+import contextlib
 import pathvalidate
-from typing import IO, Any, Optional, List, cast, overload
+from typing import IO, Any, Iterator, Optional, List, Union, cast, overload
 from dlt.common.typing import AnyFun
 
 from dlt.common.utils import encoding_for_mode, uniq_id
@@ -28,6 +30,17 @@ class FileStorage:
     def save(self, relative_path: str, data: Any) -> str:
         return self.save_atomic(self.storage_path, relative_path, data, file_type=self.file_type)
 
+    def append(self, relative_path: str, data: Any, fsync: bool = False) -> str:
+        """Appends `data` to a file at `relative_path`, creating it if needed. If `fsync` is set, data is flushed to the disk before returning"""
+        mode = "a" + self.file_type
+        file_path = self.make_full_path(relative_path)
+        with open(file_path, mode=mode, encoding=encoding_for_mode(mode)) as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        return file_path
+
     @staticmethod
     def save_atomic(storage_path: str, relative_path: str, data: Any, file_type: str = "t") -> str:
         mode = "w" + file_type
@@ -124,6 +137,15 @@ class FileStorage:
     def has_folder(self, relative_path: str) -> bool:
         return os.path.isdir(self.make_full_path(relative_path))
 
+    def get_folder_size(self, relative_path: str) -> int:
+        """Returns total size of files in `relative_path` folder, including subfolders. Returns 0 if folder does not exist"""
+        size = 0
+        for root, _, files in os.walk(self.make_full_path(relative_path)):
+            for file in files:
+                with contextlib.suppress(FileNotFoundError):
+                    size += os.path.getsize(os.path.join(root, file))
+        return size
+
     def list_folder_files(self, relative_path: str, to_root: bool = True) -> List[str]:
         """List all files in `relative_path` folder
 
@@ -312,6 +334,41 @@ class FileStorage:
             return open(path, origmode, encoding=encoding, **kwargs)
 
 
+    @staticmethod
+    @contextlib.contextmanager
+    def open_mmap_ro(path: str) -> Iterator[Union[mmap.mmap, bytes]]:
+        """Memory maps a file under `path` for reading. Compressed files cannot be mapped, use `is_gzipped` to check the file first.
+
+        The returned buffer supports `find` and zero-copy slicing via `memoryview`. Empty files are returned as empty bytes as they cannot be mapped.
+        Note that slices of the buffer that outlive the context will keep the mapping open until they are collected.
+        """
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                yield b""
+                return
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                yield mm
+            finally:
+                # mapping with exported buffers cannot be closed, in that case it is closed when collected
+                with contextlib.suppress(BufferError):
+                    mm.close()
+
+    @staticmethod
+    def iter_mmap_lines(buffer: Union[mmap.mmap, bytes]) -> Iterator[memoryview]:
+        """Yields lines (without new line character) from a mapped `buffer` as memoryviews, without copying the data"""
+        view = memoryview(buffer)
+        try:
+            start, size = 0, len(buffer)
+            while start < size:
+                end = buffer.find(b"\n", start)
+                if end == -1:
+                    end = size
+                yield view[start:end]
+                start = end + 1
+        finally:
+            view.release()
+
     @staticmethod
     def is_gzipped(path: str) -> bool:
         """Checks if file under path is gzipped by reading a header"""
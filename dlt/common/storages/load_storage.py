@@ -1,14 +1,17 @@
 import contextlib
 from copy import deepcopy
+import gzip
 import os
+import shutil
+import threading
 import datetime  # noqa: 251
 import humanize
 from os.path import join
 from pathlib import Path
 from pendulum.datetime import DateTime
-from typing import Dict, Iterable, List, NamedTuple, Literal, Optional, Sequence, Set, get_args, cast
+from typing import Any, Dict, Iterable, List, NamedTuple, Literal, Optional, Sequence, Set, Tuple, get_args, cast
 
-from dlt.common import json, pendulum
+from dlt.common import json, logger, pendulum
 from dlt.common.configuration import known_sections
 from dlt.common.configuration.inject import with_config
 from dlt.common.typing import DictStrAny, StrAny
@@ -22,7 +25,7 @@ from dlt.common.storages.configuration import LoadStorageConfiguration
 from dlt.common.storages.versioned_storage import VersionedStorage
 from dlt.common.storages.data_item_storage import DataItemStorage
 from dlt.common.storages.exceptions import JobWithUnsupportedWriterException, LoadPackageNotFound
-from dlt.common.utils import flatten_list_or_items
+from dlt.common.utils import flatten_list_or_items, uniq_id
 
 
 # folders to manage load jobs in a single load package
@@ -123,6 +126,87 @@ class LoadPackageInfo(NamedTuple):
         return self.asstr(verbosity=0)
 
 
+class LoadPackageJobIndex:
+    """In-memory index of job files in a normalized load package, updated on each job state change instead of listing the package folders.
+
+       Jobs are moved from the loader worker threads so the index must be accessed under the `lock`
+    """
+
+    def __init__(self, jobs: Dict[TJobState, Sequence[str]], journaled: bool) -> None:
+        self.lock = threading.RLock()
+        self.journaled = journaled
+        self.jobs: Dict[TJobState, Dict[str, str]] = {state: {} for state in WORKING_FOLDERS}
+        self.failed_messages: Dict[str, str] = {}
+        # size and modification time of job files, those do not change when job file is moved
+        self.stats: Dict[str, Tuple[int, float]] = {}
+        # job file names per table and state so table chain completion is checked without listing all jobs
+        self.table_jobs: Dict[str, Dict[TJobState, Set[str]]] = {}
+        # timestamps before which retried new jobs must not be started
+        self.not_before: Dict[str, float] = {}
+        self._exception_files: Set[str] = set()
+        for state, files in jobs.items():
+            for file in files:
+                if file.endswith(".exception"):
+                    self._exception_files.add(file)
+                else:
+                    self.add_job(state, file)
+
+    def pending_exception_files(self) -> List[str]:
+        """Returns exception files of failed jobs that were found when building the index and their messages are not yet read"""
+        files, self._exception_files = list(self._exception_files), set()
+        return files
+
+    def add_job(self, state: TJobState, file_path: str) -> None:
+        with self.lock:
+            file_name = FileStorage.get_file_name_from_file_path(file_path)
+            self.jobs[state][file_name] = file_path
+            self._get_table_jobs(file_name)[state].add(file_name)
+
+    def move_job(self, file_name: str, dest_state: TJobState, file_path: str) -> None:
+        with self.lock:
+            table_jobs = self._get_table_jobs(file_name)
+            for state, jobs in self.jobs.items():
+                if jobs.pop(file_name, None) is not None:
+                    table_jobs[state].discard(file_name)
+                    break
+            self.not_before.pop(file_name, None)
+            new_file_name = FileStorage.get_file_name_from_file_path(file_path)
+            if new_file_name != file_name and file_name in self.stats:
+                self.stats[new_file_name] = self.stats.pop(file_name)
+            self.jobs[dest_state][new_file_name] = file_path
+            table_jobs[dest_state].add(new_file_name)
+
+    def count_table_jobs(self, table_name: str, state: TJobState, exclude_job_id: str = None) -> int:
+        """Counts jobs of `table_name` in `state`, not including a job with `exclude_job_id`"""
+        with self.lock:
+            if (table_jobs := self.table_jobs.get(table_name)) is None:
+                return 0
+            job_ids = table_jobs[state]
+            return len(job_ids) - int(exclude_job_id in job_ids)
+
+    def _get_table_jobs(self, file_name: str) -> Dict[TJobState, Set[str]]:
+        # table name is the first part of the job file name
+        table_name = file_name.split(".", 1)[0]
+        if (table_jobs := self.table_jobs.get(table_name)) is None:
+            table_jobs = self.table_jobs[table_name] = {state: set() for state in WORKING_FOLDERS}
+        return table_jobs
+
+    def find_job(self, file_name: str) -> str:
+        with self.lock:
+            for jobs in self.jobs.values():
+                if file_name in jobs:
+                    return jobs[file_name]
+        raise FileNotFoundError(file_name)
+
+    def list_jobs(self, state: TJobState) -> List[str]:
+        with self.lock:
+            files = list(self.jobs[state].values())
+            if state == LoadStorage.FAILED_JOBS_FOLDER:
+                # exception files are listed with failed jobs, like in the package folder
+                files.extend(self.jobs[state][file_name] + ".exception" for file_name in self.failed_messages if file_name in self.jobs[state])
+        return files
+
+
 class LoadStorage(DataItemStorage, VersionedStorage):
 
     STORAGE_VERSION = "1.0.0"
@@ -136,8 +220,11 @@ class LoadStorage(DataItemStorage, VersionedStorage):
 
     SCHEMA_UPDATES_FILE_NAME = "schema_updates.json"  # updates to the tables in schema created by normalizer
     APPLIED_SCHEMA_UPDATES_FILE_NAME = "applied_" + "schema_updates.json"  # updates applied to the destination
+    CONFIRMED_SCHEMAS_FILE_NAME = "confirmed_schemas.json"  # schema version hashes confirmed at the destination datasets
     SCHEMA_FILE_NAME = "schema.json"  # package schema
     PACKAGE_COMPLETED_FILE_NAME = "package_completed.json"  # completed package marker file, currently only to store data with os.stat
+    JOBS_JOURNAL_FILE_NAME = "jobs_journal.jsonl"  # job state changes, used instead of moving job files if jobs journal is enabled
+    JOBS_MANIFEST_FILE_NAME = "jobs_manifest.json"  # job states compacted from the journal when package is completed
 
     ALL_SUPPORTED_FILE_FORMATS = ALL_SUPPORTED_FILE_FORMATS
 
@@ -155,6 +242,9 @@ class LoadStorage(DataItemStorage, VersionedStorage):
             raise TerminalValueError(preferred_file_format)
         self.supported_file_formats = supported_file_formats
         self.config = config
+        self._jobs_indexes: Dict[str, LoadPackageJobIndex] = {}
+        # confirmed schemas are updated from the threads loading packages in parallel
+        self._confirmed_schemas_lock = threading.Lock()
         super().__init__(
             preferred_file_format,
             LoadStorage.STORAGE_VERSION,
@@ -168,6 +258,7 @@ class LoadStorage(DataItemStorage, VersionedStorage):
         self.storage.create_folder(LoadStorage.NORMALIZED_FOLDER, exists_ok=True)
 
     def create_temp_load_package(self, load_id: str) -> None:
+        self._jobs_indexes.pop(load_id, None)
         # delete previous version
         if self.storage.has_folder(load_id):
             self.storage.delete_folder(load_id, recursively=True)
@@ -210,7 +301,48 @@ class LoadStorage(DataItemStorage, VersionedStorage):
         with self.storage.open_file(join(load_id, LoadStorage.SCHEMA_UPDATES_FILE_NAME), mode="wb") as f:
             json.dump(schema_update, f)
 
+    def compact_temp_load_package(self, load_id: str, max_file_size: int) -> int:
+        """Concatenates new job files of the same table in temporary package `load_id` into files of up to `max_file_size` bytes so fewer, larger jobs are loaded.
+
+           jsonl and insert_values files are concatenated, parquet files are rewritten with all their row groups. Returns the number of job files removed.
+        """
+        new_jobs_folder = join(load_id, LoadStorage.NEW_JOBS_FOLDER)
+        # only files with the same table, format and compatible content may be concatenated
+        groups: Dict[Tuple[str, TLoaderFileFormat, Any], List[Tuple[str, int]]] = {}
+        for file in sorted(self.storage.list_folder_files(new_jobs_folder)):
+            job_info = self.parse_job_file_name(file)
+            if job_info.file_format not in ("jsonl", "insert_values", "parquet"):
+                continue
+            full_path = self.storage.make_full_path(file)
+            file_size = os.path.getsize(full_path)
+            if file_size >= max_file_size:
+                continue
+            group_key = (job_info.table_name, job_info.file_format, self._get_compaction_key(full_path, job_info.file_format))
+            groups.setdefault(group_key, []).append((file, file_size))
+
+        removed_files = 0
+        for (table_name, file_format, _), files in groups.items():
+            # take files in order until the max size is reached
+            packs: List[List[str]] = [[]]
+            pack_size = 0
+            for file, file_size in files:
+                if packs[-1] and pack_size + file_size > max_file_size:
+                    packs.append([])
+                    pack_size = 0
+                packs[-1].append(file)
+                pack_size += file_size
+            for pack in packs:
+                if len(pack) < 2:
+                    continue
+                compacted_file = join(new_jobs_folder, f"{self.build_job_file_name(table_name, uniq_id(), with_extension=False)}.{file_format}")
+                self._concat_job_files(file_format, [self.storage.make_full_path(f) for f in pack], self.storage.make_full_path(compacted_file))
+                for file in pack:
+                    self.storage.delete(file)
+                removed_files += len(pack) - 1
+        return removed_files
+
     def commit_temp_load_package(self, load_id: str) -> None:
+        self._jobs_indexes.pop(load_id, None)
         self.storage.rename_tree(load_id, self.get_normalized_package_path(load_id))
 
     def list_normalized_packages(self) -> Sequence[str]:
@@ -225,29 +357,48 @@ class LoadStorage(DataItemStorage, VersionedStorage):
         # start from the oldest packages
         return sorted(loads)
 
-    def list_new_jobs(self, load_id: str) -> Sequence[str]:
-        new_jobs = self.storage.list_folder_files(self._get_job_folder_path(load_id, LoadStorage.NEW_JOBS_FOLDER))
+    def list_new_jobs(self, load_id: str, largest_first: bool = False, ready_at: float = None) -> Sequence[str]:
+        """Lists new jobs in package `load_id`. With `largest_first` the jobs are ordered by file size descending so the longest running jobs may be started first.
+           With `ready_at` timestamp, retried jobs that must not be started before that time are skipped.
+        """
+        index = self._get_jobs_index(load_id)
+        new_jobs = index.list_jobs(LoadStorage.NEW_JOBS_FOLDER)
+        if ready_at is not None:
+            with index.lock:
+                new_jobs = [j for j in new_jobs if index.not_before.get(FileStorage.get_file_name_from_file_path(j), 0) <= ready_at]
         # make sure all jobs have supported writers
         wrong_job = next((j for j in new_jobs if LoadStorage.parse_job_file_name(j).file_format not in self.supported_file_formats), None)
         if wrong_job is not None:
             raise JobWithUnsupportedWriterException(load_id, self.supported_file_formats, wrong_job)
+        if largest_first:
+            with index.lock:
+                new_jobs.sort(key=lambda j: self._get_indexed_job_stats(index, j)[0], reverse=True)
         return new_jobs
 
     def list_started_jobs(self, load_id: str) -> Sequence[str]:
-        return self.storage.list_folder_files(self._get_job_folder_path(load_id, LoadStorage.STARTED_JOBS_FOLDER))
+        return self._get_jobs_index(load_id).list_jobs(LoadStorage.STARTED_JOBS_FOLDER)
 
     def list_failed_jobs(self, load_id: str) -> Sequence[str]:
-        return self.storage.list_folder_files(self._get_job_folder_path(load_id, LoadStorage.FAILED_JOBS_FOLDER))
+        return self._get_jobs_index(load_id).list_jobs(LoadStorage.FAILED_JOBS_FOLDER)
 
     def list_jobs_for_table(self, load_id: str, table_name: str) -> Sequence[LoadJobInfo]:
-        return [job for job in self.list_all_jobs(load_id) if job.job_file_info.table_name == table_name]
+        if self.storage.has_folder(self.get_normalized_package_path(load_id)):
+            # do not load package schema and updates if just the jobs are needed
+            jobs = flatten_list_or_items(iter(self._list_indexed_jobs_info(load_id).values()))
+        else:
+            jobs = self.list_all_jobs(load_id)
+        return [job for job in jobs if job.job_file_info.table_name == table_name]
+
+    def count_jobs_for_table(self, load_id: str, table_name: str, state: TJobState, exclude_job_id: str = None) -> int:
+        """Counts jobs of `table_name` in `state` in normalized package `load_id` using the in-memory job index. Job with `exclude_job_id` is not counted"""
+        return self._get_jobs_index(load_id).count_table_jobs(table_name, state, exclude_job_id)
 
     def list_all_jobs(self, load_id: str) -> Sequence[LoadJobInfo]:
         info = self.get_load_package_info(load_id)
         return [job for job in flatten_list_or_items(iter(info.jobs.values()))]  # type: ignore
 
     def list_completed_failed_jobs(self, load_id: str) -> Sequence[str]:
-        return self.storage.list_folder_files(self._get_job_folder_completed_path(load_id, LoadStorage.FAILED_JOBS_FOLDER))
+        return self._list_job_files(self.get_completed_package_path(load_id), LoadStorage.FAILED_JOBS_FOLDER)
 
     def list_failed_jobs_in_completed_package(self, load_id: str) -> Sequence[LoadJobInfo]:
         """List all failed jobs and associated error messages for a completed load package with `load_id`"""
@@ -280,15 +431,20 @@ class LoadStorage(DataItemStorage, VersionedStorage):
             applied_update = json.loads(self.storage.load(applied_schema_update_file))
         schema = self._load_schema(join(package_path, LoadStorage.SCHEMA_FILE_NAME))
         # read jobs with all statuses
-        all_jobs: Dict[TJobState, List[LoadJobInfo]] = {}
-        for state in WORKING_FOLDERS:
-            jobs: List[LoadJobInfo] = []
-            with contextlib.suppress(FileNotFoundError):
-                # we ignore if load package lacks one of working folders. completed_jobs may be deleted on archiving
-                for file in self.storage.list_folder_files(join(package_path, state)):
-                    if not file.endswith(".exception"):
-                        jobs.append(self._read_job_file_info(state, file, package_created_at))
-            all_jobs[state] = jobs
+        if package_state == "normalized":
+            all_jobs = self._list_indexed_jobs_info(load_id)
+        else:
+            journaled_jobs = self._replay_jobs_journal(package_path) if self._has_jobs_journal(package_path) else None
+            all_jobs = {}
+            for state in WORKING_FOLDERS:
+                jobs: List[LoadJobInfo] = []
+                with contextlib.suppress(FileNotFoundError):
+                    # we ignore if load package lacks one of working folders. completed_jobs may be deleted on archiving
+                    files = journaled_jobs[state] if journaled_jobs is not None else self.storage.list_folder_files(join(package_path, state))
+                    for file in files:
+                        if not file.endswith(".exception"):
+                            jobs.append(self._read_job_file_info(state, file, package_created_at))
+                all_jobs[state] = jobs
 
         return LoadPackageInfo(load_id, self.storage.make_full_path(package_path), package_state, schema.name, applied_update, package_created_at, all_jobs)
 
@@ -303,6 +459,26 @@ class LoadStorage(DataItemStorage, VersionedStorage):
         else:
             return None
 
+    def get_confirmed_schemas(self) -> Dict[str, str]:
+        """Returns schema version hashes confirmed to be stored in destination datasets, keyed by the destination dataset key"""
+        if not self.storage.has_file(LoadStorage.CONFIRMED_SCHEMAS_FILE_NAME):
+            return {}
+        confirmed_schemas: Dict[str, str] = json.loads(self.storage.load(LoadStorage.CONFIRMED_SCHEMAS_FILE_NAME))
+        return confirmed_schemas
+
+    def confirm_schemas(self, confirmed_schemas: Dict[str, str]) -> None:
+        """Records schema version hashes that were confirmed or applied at the destination datasets"""
+        if not confirmed_schemas:
+            return
+        with self._confirmed_schemas_lock:
+            self.storage.save(LoadStorage.CONFIRMED_SCHEMAS_FILE_NAME, json.dumps({**self.get_confirmed_schemas(), **confirmed_schemas}))
+
+    def forget_confirmed_schemas(self) -> None:
+        """Drops all confirmed schema version hashes so the next load syncs schemas with the destination"""
+        with self._confirmed_schemas_lock:
+            if self.storage.has_file(LoadStorage.CONFIRMED_SCHEMAS_FILE_NAME):
+                self.storage.delete(LoadStorage.CONFIRMED_SCHEMAS_FILE_NAME)
+
     def commit_schema_update(self, load_id: str, applied_update: TSchemaTables) -> None:
         """Marks schema update as processed and stores the update that was applied at the destination"""
         load_path = self.get_normalized_package_path(load_id)
@@ -315,7 +491,9 @@ class LoadStorage(DataItemStorage, VersionedStorage):
 
     def add_new_job(self, load_id: str, job_file_path: str, job_state: TJobState = "new_jobs") -> None:
         """Adds new job by moving the `job_file_path` into `new_jobs` of package `load_id`"""
-        self.storage.atomic_import(job_file_path, self._get_job_folder_path(load_id, job_state))
+        index = self._get_jobs_index(load_id)
+        file_path = self.storage.atomic_import(job_file_path, self._get_job_folder_path(load_id, job_state))
+        index.add_job(job_state, file_path)
 
     def atomic_import(self, external_file_path: str, to_folder: str) -> str:
         """Copies or links a file at `external_file_path` into the `to_folder` effectively importing file into storage"""
@@ -326,33 +504,58 @@ class LoadStorage(DataItemStorage, VersionedStorage):
         return self._move_job(load_id, LoadStorage.NEW_JOBS_FOLDER, LoadStorage.STARTED_JOBS_FOLDER, file_name)
 
     def fail_job(self, load_id: str, file_name: str, failed_message: Optional[str]) -> str:
-        # save the exception to failed jobs
-        if failed_message:
-            self.storage.save(
-                self._get_job_file_path(load_id, LoadStorage.FAILED_JOBS_FOLDER, file_name + ".exception"),
-                failed_message
-            )
-        # move to failed jobs
-        return self._move_job(load_id, LoadStorage.STARTED_JOBS_FOLDER, LoadStorage.FAILED_JOBS_FOLDER, file_name)
-
-    def retry_job(self, load_id: str, file_name: str) -> str:
+        index = self._get_jobs_index(load_id)
+        with index.lock:
+            # save the exception to failed jobs
+            if failed_message:
+                if self._uses_jobs_journal(index):
+                    # job file stays where it is so keep the exception next to it
+                    exception_path = index.find_job(file_name) + ".exception"
+                else:
+                    exception_path = self._get_job_file_path(load_id, LoadStorage.FAILED_JOBS_FOLDER, file_name + ".exception")
+                self.storage.save(exception_path, failed_message)
+                index.failed_messages[file_name] = failed_message
+            # move to failed jobs
+            return self._move_job(load_id, LoadStorage.STARTED_JOBS_FOLDER, LoadStorage.FAILED_JOBS_FOLDER, file_name)
+
+    def retry_job(self, load_id: str, file_name: str, not_before: float = None) -> str:
+        """Moves started job back to new jobs with increased retry count. If `not_before` timestamp is set, the job will not be listed as ready before that time."""
         # when retrying job we must increase the retry count
         source_fn = ParsedLoadJobFileName.parse(file_name)
         dest_fn = ParsedLoadJobFileName(source_fn.table_name, source_fn.file_id, source_fn.retry_count + 1, source_fn.file_format)
-        # move it directly to new file name
-        return self._move_job(load_id, LoadStorage.STARTED_JOBS_FOLDER, LoadStorage.NEW_JOBS_FOLDER, file_name, dest_fn.job_id())
+        index = self._get_jobs_index(load_id)
+        with index.lock:
+            # move it directly to new file name
+            dest_path = self._move_job(load_id, LoadStorage.STARTED_JOBS_FOLDER, LoadStorage.NEW_JOBS_FOLDER, file_name, dest_fn.job_id())
+            if not_before is not None:
+                index.not_before[dest_fn.job_id()] = not_before
+        return dest_path
+
+    def get_job_not_before(self, load_id: str, file_name: str) -> Optional[float]:
+        """Returns timestamp before which a retried new job `file_name` must not be started or None if the job may start right away"""
+        index = self._get_jobs_index(load_id)
+        with index.lock:
+            return index.not_before.get(file_name)
 
     def complete_job(self, load_id: str, file_name: str) -> str:
         return self._move_job(load_id, LoadStorage.STARTED_JOBS_FOLDER, LoadStorage.COMPLETED_JOBS_FOLDER, file_name)
 
     def complete_load_package(self, load_id: str, aborted: bool) -> None:
         load_path = self.get_normalized_package_path(load_id)
-        has_failed_jobs = len(self.list_failed_jobs(load_id)) > 0
+        index = self._get_jobs_index(load_id)
+        has_failed_jobs = len(index.jobs[LoadStorage.FAILED_JOBS_FOLDER]) > 0
         # delete completed jobs
         if self.config.delete_completed_jobs and not has_failed_jobs:
+            if index.journaled:
+                for file in index.list_jobs(LoadStorage.COMPLETED_JOBS_FOLDER):
+                    self.storage.delete(file)
+                index.jobs[LoadStorage.COMPLETED_JOBS_FOLDER].clear()
             self.storage.delete_folder(
                 self._get_job_folder_path(load_id, LoadStorage.COMPLETED_JOBS_FOLDER),
             recursively=True)
+        if index.journaled:
+            self._compact_jobs_journal(load_path, index)
+        del self._jobs_indexes[load_id]
         # save marker file
         completed_state: TLoadPackageState = "aborted" if aborted else "loaded"
         self.storage.save(join(load_path, LoadStorage.PACKAGE_COMPLETED_FILE_NAME), completed_state)
@@ -361,12 +564,14 @@ class LoadStorage(DataItemStorage, VersionedStorage):
         self.storage.rename_tree(load_path, completed_path)
 
     def delete_completed_package(self, load_id: str) -> None:
+        self._jobs_indexes.pop(load_id, None)
         package_path = self.get_completed_package_path(load_id)
         if not self.storage.has_folder(package_path):
             raise LoadPackageNotFound(load_id)
         self.storage.delete_folder(package_path, recursively=True)
 
     def wipe_normalized_packages(self) -> None:
+        self._jobs_indexes.clear()
         self.storage.delete_folder(self.NORMALIZED_FOLDER, recursively=True)
 
     def get_normalized_package_path(self, load_id: str) -> str:
@@ -391,11 +596,212 @@ class LoadStorage(DataItemStorage, VersionedStorage):
         # ensure we move file names, not paths
         assert file_name == FileStorage.get_file_name_from_file_path(file_name)
         load_path = self.get_normalized_package_path(load_id)
-        dest_path = join(load_path, dest_folder, new_file_name or file_name)
-        self.storage.atomic_rename(join(load_path, source_folder, file_name), dest_path)
-        # print(f"{join(load_path, source_folder, file_name)} -> {dest_path}")
+        index = self._get_jobs_index(load_id)
+        # file and index are changed together so other threads see consistent job states
+        with index.lock:
+            if self._uses_jobs_journal(index):
+                dest_path = self._journal_job(load_path, dest_folder, index.find_job(file_name), file_name, new_file_name)
+                index.journaled = True
+            else:
+                dest_path = join(load_path, dest_folder, new_file_name or file_name)
+                self.storage.atomic_rename(join(load_path, source_folder, file_name), dest_path)
+                # print(f"{join(load_path, source_folder, file_name)} -> {dest_path}")
+            index.move_job(file_name, dest_folder, dest_path)
         return self.storage.make_full_path(dest_path)
 
+    def _journal_job(self, package_path: str, dest_folder: TJobState, file_path: str, file_name: str, new_file_name: str = None) -> str:
+        """Records job state change in the jobs journal instead of moving the job file at `file_path`. Returns the job file path."""
+        if new_file_name:
+            # job file name contains the retry count so it must be renamed, but it stays in the same folder
+            new_file_path = join(os.path.dirname(file_path), new_file_name)
+            self.storage.atomic_rename(file_path, new_file_path)
+            file_path = new_file_path
+        entry: DictStrAny = {"file_name": file_name, "state": dest_folder}
+        if new_file_name:
+            entry["new_file_name"] = new_file_name
+        self.storage.append(
+            join(package_path, LoadStorage.JOBS_JOURNAL_FILE_NAME),
+            json.dumps(entry) + "\n",
+            fsync=self.config.fsync_jobs_journal
+        )
+        return file_path
+
+    @staticmethod
+    def _get_compaction_key(file_path: str, file_format: TLoaderFileFormat) -> Any:
+        """Returns a key that is equal for job files that can be concatenated"""
+        if file_format == "parquet":
+            from dlt.common.libs.pyarrow import pyarrow
+
+            return pyarrow.parquet.read_schema(file_path).remove_metadata()
+        is_gzipped = FileStorage.is_gzipped(file_path)
+        if file_format == "insert_values":
+            # INSERT header lists the columns
+            with FileStorage.open_zipsafe_ro(file_path, "r", encoding="utf-8") as f:
+                return is_gzipped, f.readline()
+        return is_gzipped
+
+    @staticmethod
+    def _concat_job_files(file_format: TLoaderFileFormat, file_paths: Sequence[str], dest_path: str) -> None:
+        if file_format == "parquet":
+            from dlt.common.libs.pyarrow import pyarrow
+
+            with pyarrow.parquet.ParquetWriter(dest_path, pyarrow.parquet.read_schema(file_paths[0])) as writer:
+                for file_path in file_paths:
+                    parquet_file = pyarrow.parquet.ParquetFile(file_path)
+                    for row_group in range(parquet_file.num_row_groups):
+                        writer.write_table(parquet_file.read_row_group(row_group))
+        elif file_format == "insert_values":
+            open_f = gzip.open if FileStorage.is_gzipped(file_paths[0]) else open
+            with open_f(dest_path, "wt", encoding="utf-8") as dest_f:
+                has_values = False
+                for idx, file_path in enumerate(file_paths):
+                    with FileStorage.open_zipsafe_ro(file_path, "r", encoding="utf-8") as f:
+                        header, values_mark = f.readline(), f.readline()
+                        if idx == 0:
+                            dest_f.write(header)
+                            dest_f.write(values_mark)
+                        # values end with ";" which is written once after all files
+                        values = f.read().rstrip()
+                        if values.endswith(";"):
+                            values = values[:-1]
+                        # files of tables without rows have no values
+                        if not values:
+                            continue
+                        if has_values:
+                            # separate values of the previous file
+                            dest_f.write(",\n")
+                        dest_f.write(values)
+                        has_values = True
+                if has_values:
+                    dest_f.write(";")
+        else:
+            # gzip members and jsonl lines can be concatenated
+            with open(dest_path, "wb") as dest_f:
+                for file_path in file_paths:
+                    with open(file_path, "rb") as f:
+                        shutil.copyfileobj(f, dest_f)
+
+    def _get_jobs_index(self, load_id: str) -> LoadPackageJobIndex:
+        """Gets job index of normalized package `load_id`, the package folders are listed only when index is created"""
+        if (index := self._jobs_indexes.get(load_id)) is None:
+            package_path = self.get_normalized_package_path(load_id)
+            if journaled := self._has_jobs_journal(package_path):
+                # new entries are appended after the index is created so they cannot be glued to a torn entry
+                self._truncate_torn_jobs_journal(package_path)
+                jobs: Dict[TJobState, Sequence[str]] = self._replay_jobs_journal(package_path)
+            else:
+                jobs = {state: self.storage.list_folder_files(join(package_path, state)) for state in WORKING_FOLDERS}
+            index = LoadPackageJobIndex(jobs, journaled)
+            for exception_file in index.pending_exception_files():
+                index.failed_messages[FileStorage.get_file_name_from_file_path(exception_file[:-len(".exception")])] = self.storage.load(exception_file)
+            self._jobs_indexes[load_id] = index
+        return index
+
+    def _get_indexed_job_stats(self, index: LoadPackageJobIndex, file: str) -> Tuple[int, float]:
+        """Returns size and modification time of job `file`, stats are cached in the `index`"""
+        file_name = FileStorage.get_file_name_from_file_path(file)
+        if (stats := index.stats.get(file_name)) is None:
+            st = os.stat(self.storage.make_full_path(file))
+            stats = index.stats[file_name] = (st.st_size, st.st_mtime)
+        return stats
+
+    def _list_indexed_jobs_info(self, load_id: str) -> Dict[TJobState, List[LoadJobInfo]]:
+        index = self._get_jobs_index(load_id)
+        now_ts = pendulum.now().timestamp()
+        all_jobs: Dict[TJobState, List[LoadJobInfo]] = {}
+        with index.lock:
+            for state, jobs in index.jobs.items():
+                jobs_info: List[LoadJobInfo] = []
+                for file_name, file in jobs.items():
+                    file_size, mtime = self._get_indexed_job_stats(index, file)
+                    jobs_info.append(LoadJobInfo(
+                        state,
+                        self.storage.make_full_path(file),
+                        file_size,
+                        pendulum.from_timestamp(mtime),
+                        now_ts - mtime,
+                        self.parse_job_file_name(file),
+                        index.failed_messages.get(file_name)
+                    ))
+                all_jobs[state] = jobs_info
+        return all_jobs
+
+    def _has_jobs_journal(self, package_path: str) -> bool:
+        return self.storage.has_file(join(package_path, LoadStorage.JOBS_JOURNAL_FILE_NAME)) or \
+            self.storage.has_file(join(package_path, LoadStorage.JOBS_MANIFEST_FILE_NAME))
+
+    def _uses_jobs_journal(self, index: LoadPackageJobIndex) -> bool:
+        # a package that was journaled must be processed with the journal even if it got disabled in config
+        return self.config.use_jobs_journal or index.journaled
+
+    def _list_job_files(self, package_path: str, state: TJobState) -> Sequence[str]:
+        if self._has_jobs_journal(package_path):
+            return self._replay_jobs_journal(package_path)[state]
+        return self.storage.list_folder_files(join(package_path, state))
+
+    def _replay_jobs_journal(self, package_path: str) -> Dict[TJobState, List[str]]:
+        """Rebuilds job states in package at `package_path` from the job files, jobs manifest and jobs journal.
+
+        Jobs without any recorded state change are in the state of the folder they are stored in. Returns job files (and exception files of failed jobs)
+        per state, with paths relative to the storage root, same as listing the working folders of a package that does not use the journal.
+        """
+        locations: Dict[str, str] = {}
+        states: Dict[str, TJobState] = {}
+        exception_files: Set[str] = set()
+        for folder in WORKING_FOLDERS:
+            with contextlib.suppress(FileNotFoundError):
+                for file in self.storage.list_folder_files(join(package_path, folder)):
+                    if file.endswith(".exception"):
+                        exception_files.add(file)
+                    else:
+                        file_name = FileStorage.get_file_name_from_file_path(file)
+                        locations[file_name] = file
+                        states[file_name] = folder
+        manifest_path = join(package_path, LoadStorage.JOBS_MANIFEST_FILE_NAME)
+        if self.storage.has_file(manifest_path):
+            states.update(json.loads(self.storage.load(manifest_path)))
+        journal_path = join(package_path, LoadStorage.JOBS_JOURNAL_FILE_NAME)
+        if self.storage.has_file(journal_path):
+            for line in self.storage.load(journal_path).splitlines():
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # entry may be partially written if process was killed
+                    logger.warning(f"Skipping incomplete entry {line} in jobs journal {journal_path}")
+                    continue
+                if new_file_name := entry.get("new_file_name"):
+                    states.pop(entry["file_name"], None)
+                    states[new_file_name] = entry["state"]
+                else:
+                    states[entry["file_name"]] = entry["state"]
+        # only existing job files are listed
+        jobs: Dict[TJobState, List[str]] = {state: [] for state in WORKING_FOLDERS}
+        for file_name, file in locations.items():
+            state = states[file_name]
+            jobs[state].append(file)
+            if state == LoadStorage.FAILED_JOBS_FOLDER and file + ".exception" in exception_files:
+                jobs[state].append(file + ".exception")
+        return jobs
+
+    def _truncate_torn_jobs_journal(self, package_path: str) -> None:
+        """Removes the last entry of the jobs journal if it was partially written when process was killed"""
+        journal_path = self.storage.make_full_path(join(package_path, LoadStorage.JOBS_JOURNAL_FILE_NAME))
+        if not os.path.isfile(journal_path):
+            return
+        with open(journal_path, "rb+") as f:
+            content = f.read()
+            if content and not content.endswith(b"\n"):
+                logger.warning(f"Removing incomplete last entry from jobs journal {journal_path}")
+                f.truncate(content.rfind(b"\n") + 1)
+
+    def _compact_jobs_journal(self, package_path: str, index: LoadPackageJobIndex) -> None:
+        """Writes current job states into the jobs manifest and removes the journal"""
+        manifest = {file_name: state for state, jobs in index.jobs.items() for file_name in jobs}
+        self.storage.save(join(package_path, LoadStorage.JOBS_MANIFEST_FILE_NAME), json.dumps(manifest))
+        journal_path = join(package_path, LoadStorage.JOBS_JOURNAL_FILE_NAME)
+        if self.storage.has_file(journal_path):
+            self.storage.delete(journal_path)
+
     def _get_job_folder_path(self, load_id: str, folder: TJobState) -> str:
         return join(self.get_normalized_package_path(load_id), folder)
 
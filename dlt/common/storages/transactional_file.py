@@ -59,7 +59,8 @@ class TransactionalFile:
         self.extract_mtime = MTIME_DISPATCH.get(proto, MTIME_DISPATCH["file"])
 
         parsed_path = Path(path)
-        if not parsed_path.is_absolute():
+        # bucket paths start with a bucket name and are never absolute
+        if proto == "file" and not parsed_path.is_absolute():
             raise ValueError(f"{path} is not absolute. Please pass only absolute paths to TransactionalFile")
         self.path = path
         if proto == "file":
@@ -17,7 +17,7 @@ from dlt.common.utils import without_none
 from dlt.common.data_types import TDataType
 from dlt.common.schema import TColumnSchema, Schema, TSchemaTables, TTableSchema
 from dlt.common.schema.typing import TTableSchema, TColumnType, TWriteDisposition, TTableFormat
-from dlt.common.schema.utils import table_schema_has_type, get_table_format
+from dlt.common.schema.utils import table_schema_has_type, get_table_format, get_merge_strategy
 from dlt.common.destination import DestinationCapabilitiesContext
 from dlt.common.destination.reference import LoadJob, FollowupJob
 from dlt.common.destination.reference import TLoadJobState, NewLoadJob, SupportsStagingDestination
@@ -356,6 +356,11 @@ class AthenaClient(SqlJobClientWithStaging, SupportsStagingDestination):
                 file_path,
                 "Athena cannot load TIME columns from parquet tables. Please convert `datetime.time` objects in your data to `str` or `datetime.datetime`."
             )
+        if table["write_disposition"] == "merge" and get_merge_strategy(self.schema.tables, table["name"]) == "upsert":
+            raise LoadJobTerminalException(
+                file_path,
+                "Athena does not support upsert merge strategy because merge falls back to append. Use delete-insert merge strategy instead."
+            )
         job = super().start_file_load(table, file_path, load_id)
         if not job:
             job = DoNothingFollowupJob(file_path) if self._is_iceberg_table(self.get_load_table(table["name"])) else DoNothingJob(file_path)
@@ -33,6 +33,7 @@ def capabilities() -> DestinationCapabilitiesContext:
     caps.max_text_data_type_length = 10 * 1024 * 1024
     caps.is_max_text_data_type_length_in_bytes = True
     caps.supports_ddl_transactions = False
+    caps.supports_merge_statement = True
 
     return caps
 
@@ -1,11 +1,11 @@
 import os
 from pathlib import Path
-from typing import ClassVar, Dict, Optional, Sequence, Tuple, List, cast, Type, Any
+from typing import ClassVar, Dict, Iterable, Optional, Sequence, Tuple, List, cast, Type, Any
 import google.cloud.bigquery as bigquery  # noqa: I250
 from google.cloud import exceptions as gcp_exceptions
 from google.api_core import exceptions as api_core_exceptions
 
-from dlt.common import json, logger
+from dlt.common import json, logger, pendulum
 from dlt.common.destination import DestinationCapabilitiesContext
 from dlt.common.destination.reference import FollowupJob, NewLoadJob, TLoadJobState, LoadJob, SupportsStagingDestination
 from dlt.common.data_types import TDataType
@@ -202,6 +202,42 @@ class BigQueryClient(SqlJobClientWithStaging, SupportsStagingDestination):
                     raise DestinationTransientException(gace)
         return job
 
+    def poll_jobs(self, jobs: Sequence[LoadJob]) -> List[TLoadJobState]:
+        """Gets the states of all running BigQuery load jobs by listing the jobs created in the time window of the polled jobs instead of reloading each job separately"""
+        bq_jobs = {job.bq_load_job.job_id: job for job in jobs if isinstance(job, BigQueryLoadJob) and job.bq_load_job.created is not None}
+        # listing pays off only for many jobs
+        if len(bq_jobs) < 2:
+            return super().poll_jobs(jobs)
+        states: Dict[str, TLoadJobState] = {}
+        created = [job.bq_load_job.created for job in bq_jobs.values()]
+        try:
+            # list only the jobs created between the first and the last polled job, creation time has millisecond precision
+            listed_jobs = self.sql_client.native_connection.list_jobs(
+                min_creation_time=min(created),
+                max_creation_time=max(created) + pendulum.duration(milliseconds=1),
+                retry=bigquery.DEFAULT_RETRY.with_deadline(self.config.retry_deadline),
+                timeout=self.config.http_timeout
+            )
+            for listed_job in listed_jobs:
+                if (job := bq_jobs.get(listed_job.job_id)) is None:
+                    continue
+                if listed_job.state == "DONE":
+                    # done job resource is not reloaded when getting the state
+                    job.bq_load_job = cast(bigquery.LoadJob, listed_job)
+                    states[listed_job.job_id] = job.state()
+                else:
+                    states[listed_job.job_id] = "running"
+                if len(states) == len(bq_jobs):
+                    break
+        except api_core_exceptions.GoogleAPICallError as gace:
+            # poll the jobs one by one
+            logger.warning(f"Could not list load jobs, will poll jobs separately: {gace}")
+        # jobs not found on the list are polled separately
+        return [
+            states[job.bq_load_job.job_id] if isinstance(job, BigQueryLoadJob) and job.bq_load_job.job_id in states else job.state()
+            for job in jobs
+        ]
+
     def start_file_load(self, table: TTableSchema, file_path: str, load_id: str) -> LoadJob:
         job = super().start_file_load(table, file_path, load_id)
 
@@ -250,6 +286,10 @@ class BigQueryClient(SqlJobClientWithStaging, SupportsStagingDestination):
         name = self.capabilities.escape_identifier(c["name"])
         return f"{name} {self.type_mapper.to_db_type(c, table_format)} {self._gen_not_null(c.get('nullable', True))}"
 
+    def get_storage_tables(self, table_names: Iterable[str]) -> Dict[str, TTableSchemaColumns]:
+        # table metadata comes from the tables api, one request per table
+        return {table_name: self.get_storage_table(table_name)[1] for table_name in table_names}
+
     def get_storage_table(self, table_name: str) -> Tuple[bool, TTableSchemaColumns]:
         schema_table: TTableSchemaColumns = {}
         try:
@@ -46,6 +46,7 @@ class BigQuerySqlClient(SqlClientBase[bigquery.Client], DBTransaction):
 
     dbapi: ClassVar[DBApi] = bq_dbapi
     capabilities: ClassVar[DestinationCapabilitiesContext] = capabilities()
+    supports_connection_pooling: ClassVar[bool] = True
 
     def __init__(
         self,
@@ -95,6 +96,20 @@ class BigQuerySqlClient(SqlClientBase[bigquery.Client], DBTransaction):
             self._client.close()
             self._client = None
 
+    def attach_native_connection(self, native_connection: bigquery.Client) -> None:
+        self._client = native_connection
+
+    def detach_native_connection(self) -> Optional[bigquery.Client]:
+        # sessions are bound to the client
+        if self._session_query:
+            return None
+        native_connection, self._client = self._client, None
+        return native_connection
+
+    def is_connection_alive(self) -> bool:
+        # http client does not keep the connection state
+        return True
+
     @contextmanager
     @raise_database_error
     def begin_transaction(self) -> Iterator[DBTransaction]:
@@ -1,5 +1,6 @@
 import threading
-from typing import ClassVar, Dict, Optional
+import weakref
+from typing import ClassVar, Dict, List, Optional, Set, Tuple
 
 from dlt.common.destination import DestinationCapabilitiesContext
 from dlt.common.data_types import TDataType
@@ -8,13 +9,12 @@ from dlt.common.schema import TColumnSchema, TColumnHint, Schema
 from dlt.common.destination.reference import LoadJob, FollowupJob, TLoadJobState
 from dlt.common.schema.typing import TTableSchema, TColumnType, TTableFormat
 from dlt.common.storages.file_storage import FileStorage
-from dlt.common.utils import maybe_context
 
 from dlt.destinations.insert_job_client import InsertValuesJobClient
 
 from dlt.destinations.duckdb import capabilities
 from dlt.destinations.duckdb.sql_client import DuckDbSqlClient
-from dlt.destinations.duckdb.configuration import DuckDbClientConfiguration
+from dlt.destinations.duckdb.configuration import DuckDbBaseCredentials, DuckDbClientConfiguration
 from dlt.destinations.type_mapping import TypeMapper
 
 
@@ -22,9 +22,35 @@ HINT_TO_POSTGRES_ATTR: Dict[TColumnHint, str] = {
     "unique": "UNIQUE"
 }
 
-# duckdb cannot load PARQUET to the same table in parallel. so serialize it per table
-PARQUET_TABLE_LOCK = threading.Lock()
-TABLES_LOCKS: Dict[str, threading.Lock] = {}
+# guards creation of parquet batches of a database
+PARQUET_BATCHES_LOCK = threading.Lock()
+# parquet batches per credentials instance, keyed by identity as configspecs are not hashable and dropped together with the credentials
+PARQUET_BATCHES: Dict[int, "ParquetTableBatches"] = {}
+
+
+class ParquetTableBatches:
+    """Parquet files waiting to be ingested into the tables of a single duckdb database.
+
+       duckdb cannot load PARQUET to the same table in parallel so the jobs serialize per table. The job holding the
+       table lock ingests all the files waiting for that table in a single statement.
+    """
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.tables_locks: Dict[str, threading.Lock] = {}
+        self.pending_files: Dict[str, Set[str]] = {}
+        # files that were ingested by the batch of another job
+        self.ingested_files: Set[str] = set()
+
+    @staticmethod
+    def for_credentials(credentials: DuckDbBaseCredentials) -> "ParquetTableBatches":
+        """Gets batches of the database of `credentials`. The credentials are shared by all the clients of a loader"""
+        with PARQUET_BATCHES_LOCK:
+            key = id(credentials)
+            if (batches := PARQUET_BATCHES.get(key)) is None:
+                batches = PARQUET_BATCHES[key] = ParquetTableBatches()
+                # id may be reused when credentials are garbage collected
+                weakref.finalize(credentials, PARQUET_BATCHES.pop, key, None)
+            return batches
 
 
 class DuckDbTypeMapper(TypeMapper):
@@ -109,24 +135,22 @@ class DuckDbCopyJob(LoadJob, FollowupJob):
 
         qualified_table_name = sql_client.make_qualified_table_name(table_name)
         if file_path.endswith("parquet"):
-            source_format = "PARQUET"
-            options = ""
+            batches = ParquetTableBatches.for_credentials(sql_client.credentials)
             # lock when creating a new lock
-            with PARQUET_TABLE_LOCK:
+            with batches.lock:
                 # create or get lock per table name
-                lock: threading.Lock = TABLES_LOCKS.setdefault(qualified_table_name, threading.Lock())
+                lock: threading.Lock = batches.tables_locks.setdefault(qualified_table_name, threading.Lock())
+                batches.pending_files.setdefault(qualified_table_name, set()).add(file_path)
+            with lock:
+                self._ingest_parquet(batches, qualified_table_name, file_path, sql_client)
         elif file_path.endswith("jsonl"):
             # NOTE: loading JSON does not work in practice on duckdb: the missing keys fail the load instead of being interpreted as NULL
             source_format = "JSON"  # newline delimited, compression auto
             options = ", COMPRESSION GZIP" if FileStorage.is_gzipped(file_path) else ""
-            lock = None
-        else:
-            raise ValueError(file_path)
-
-        with maybe_context(lock):
             with sql_client.begin_transaction():
                 sql_client.execute_sql(f"COPY {qualified_table_name} FROM '{file_path}' ( FORMAT {source_format} {options});")
-
+        else:
+            raise ValueError(file_path)
 
     def state(self) -> TLoadJobState:
         return "completed"
@@ -134,6 +158,53 @@ class DuckDbCopyJob(LoadJob, FollowupJob):
     def exception(self) -> str:
         raise NotImplementedError()
 
+    @staticmethod
+    def _ingest_parquet(batches: ParquetTableBatches, qualified_table_name: str, file_path: str, sql_client: DuckDbSqlClient) -> None:
+        """Ingests `file_path` together with all other files waiting for the same table. Must be called under the table lock.
+
+           The files of a batch are ingested in a single transaction so the jobs complete together. If the batch fails, each job ingests its own file to get its own outcome.
+        """
+        with batches.lock:
+            if file_path in batches.ingested_files:
+                # a job that held the lock before ingested this file
+                batches.ingested_files.remove(file_path)
+                return
+            pending = batches.pending_files.pop(qualified_table_name)
+        try:
+            DuckDbCopyJob._insert_parquet_files(qualified_table_name, sorted(pending), sql_client)
+        except Exception:
+            if len(pending) == 1:
+                raise
+            # batch was rolled back, the other jobs will ingest their files when they get the lock
+            with batches.lock:
+                batches.pending_files.setdefault(qualified_table_name, set()).update(pending - {file_path})
+            DuckDbCopyJob._insert_parquet_files(qualified_table_name, [file_path], sql_client)
+        else:
+            with batches.lock:
+                batches.ingested_files.update(pending - {file_path})
+
+    @staticmethod
+    def _insert_parquet_files(qualified_table_name: str, paths: List[str], sql_client: DuckDbSqlClient) -> None:
+        # group files by columns so they can be read as a single relation
+        file_groups: Dict[Tuple[str, ...], List[str]] = {}
+        for path in paths:
+            file_groups.setdefault(DuckDbCopyJob._get_parquet_columns(path), []).append(path)
+        with sql_client.begin_transaction():
+            for columns, group_paths in file_groups.items():
+                column_names = ", ".join(sql_client.capabilities.escape_identifier(c) for c in columns)
+                files = ", ".join(sql_client.capabilities.escape_literal(p) for p in group_paths)
+                # duckdb reads all the files in parallel
+                sql_client.execute_sql(
+                    f"INSERT INTO {qualified_table_name} ({column_names}) SELECT {column_names} FROM read_parquet([{files}]);"
+                )
+
+    @staticmethod
+    def _get_parquet_columns(file_path: str) -> Tuple[str, ...]:
+        from dlt.common.libs.pyarrow import pyarrow
+
+        return tuple(pyarrow.parquet.read_schema(file_path).names)
+
+
 class DuckDbClient(InsertValuesJobClient):
 
     capabilities: ClassVar[DestinationCapabilitiesContext] = capabilities()
@@ -1,7 +1,7 @@
 import duckdb
 
 from contextlib import contextmanager
-from typing import Any, AnyStr, ClassVar, Iterator, Optional, Sequence
+from typing import Any, AnyStr, ClassVar, Hashable, Iterator, Optional, Sequence
 from dlt.common.destination import DestinationCapabilitiesContext
 
 from dlt.destinations.exceptions import DatabaseTerminalException, DatabaseTransientException, DatabaseUndefinedRelation
@@ -33,6 +33,7 @@ class DuckDbSqlClient(SqlClientBase[duckdb.DuckDBPyConnection], DBTransaction):
 
     dbapi: ClassVar[DBApi] = duckdb
     capabilities: ClassVar[DestinationCapabilitiesContext] = capabilities()
+    supports_connection_pooling: ClassVar[bool] = True
 
     def __init__(self, dataset_name: str, credentials: DuckDbBaseCredentials) -> None:
         super().__init__(None, dataset_name)
@@ -64,6 +65,20 @@ class DuckDbSqlClient(SqlClientBase[duckdb.DuckDBPyConnection], DBTransaction):
             self.credentials.return_conn(self._conn)
             self._conn = None
 
+    def attach_native_connection(self, native_connection: duckdb.DuckDBPyConnection) -> None:
+        self._conn = native_connection
+
+    def detach_native_connection(self) -> Optional[duckdb.DuckDBPyConnection]:
+        native_connection, self._conn = self._conn, None
+        return native_connection
+
+    def close_native_connection(self, native_connection: duckdb.DuckDBPyConnection) -> None:
+        self.credentials.return_conn(native_connection)
+
+    def connection_pool_key(self) -> Hashable:
+        # borrowed connections must be returned to the credentials instance that lent them
+        return (type(self), self.fully_qualified_dataset_name(escape=False), id(self.credentials))
+
     @contextmanager
     @raise_database_error
     def begin_transaction(self) -> Iterator[DBTransaction]:
@@ -0,0 +1,84 @@
+import os
+import sqlite3
+import time
+from types import TracebackType
+from typing import List, Optional, Sequence, Type
+
+import numpy as np
+
+from dlt.common.utils import chunks, digest256
+
+
+class EmbeddingCache:
+    """Content addressed cache of embeddings stored in a local sqlite database.
+
+       Embeddings are keyed by a hash of the embedded document and the model name. When `max_items` is exceeded,
+       the least recently used embeddings are evicted on `close`. Many load jobs may share the same database file.
+    """
+    # sqlite limits number of variables in a statement
+    MAX_KEYS_PER_QUERY: int = 500
+
+    def __init__(self, path: str, model_name: str, max_items: int) -> None:
+        self.path = path
+        self.model_name = model_name
+        self.max_items = max_items
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        # several load jobs write at the same time so wait for locks
+        self._conn = sqlite3.connect(path, timeout=60, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, dtype TEXT NOT NULL, embedding BLOB NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS embeddings_accessed_at ON embeddings (accessed_at)")
+
+    def make_key(self, doc: str) -> str:
+        return digest256(f"{self.model_name}\n{doc}")
+
+    def get(self, docs: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """Returns cached embeddings for `docs`, None for documents that are not in cache"""
+        keys = [self.make_key(doc) for doc in docs]
+        found = {}
+        now = time.time()
+        for keys_chunk in chunks(keys, self.MAX_KEYS_PER_QUERY):
+            placeholders = ",".join("?" * len(keys_chunk))
+            rows = self._conn.execute(
+                f"SELECT key, dtype, embedding FROM embeddings WHERE key IN ({placeholders})", keys_chunk
+            ).fetchall()
+            for key, dtype, embedding in rows:
+                found[key] = np.frombuffer(embedding, dtype=dtype)
+            if rows:
+                self._conn.execute(
+                    f"UPDATE embeddings SET accessed_at = ? WHERE key IN ({placeholders})", [now, *keys_chunk]
+                )
+        self._conn.commit()
+        return [found.get(key) for key in keys]
+
+    def put(self, docs: Sequence[str], embeddings: Sequence[np.ndarray]) -> None:
+        now = time.time()
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO embeddings (key, dtype, embedding, accessed_at) VALUES (?, ?, ?, ?)",
+            [
+                (self.make_key(doc), embedding.dtype.str, embedding.tobytes(), now)
+                for doc, embedding in zip(docs, embeddings)
+            ]
+        )
+        self._conn.commit()
+
+    def evict(self) -> None:
+        """Removes least recently used embeddings above `max_items`"""
+        self._conn.execute(
+            "DELETE FROM embeddings WHERE key IN (SELECT key FROM embeddings ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_items,)
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        self.evict()
+        self._conn.close()
+
+    def __enter__(self) -> "EmbeddingCache":
+        return self
+
+    def __exit__(self, exc_type: Type[BaseException], exc_val: BaseException, exc_tb: TracebackType) -> None:
+        self.close()
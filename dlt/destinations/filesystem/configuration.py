@@ -1,8 +1,10 @@
+import posixpath
 from urllib.parse import urlparse
 
 from typing import Final, Type, Optional, Any, TYPE_CHECKING
 
 from dlt.common.configuration import configspec, resolve_type
+from dlt.common.configuration.exceptions import ConfigurationValueError
 from dlt.common.destination.reference import CredentialsConfiguration, DestinationClientStagingConfiguration
 from dlt.common.storages import FilesystemConfiguration
 
@@ -10,6 +12,18 @@ from dlt.common.storages import FilesystemConfiguration
 @configspec
 class FilesystemDestinationClientConfiguration(FilesystemConfiguration, DestinationClientStagingConfiguration): # type: ignore[misc]
     destination_name: Final[str] = "filesystem"  # type: ignore
+    partition_parquet_datasets: bool = False
+    """Write parquet files of tables with `partition` column hints as hive partitioned datasets"""
+    max_rows_per_group: int = 1024 * 1024
+    """Target number of rows in a row group of a partitioned parquet file"""
+    write_table_manifests: bool = False
+    """Maintain per table manifests of data files with row counts and column statistics, updated at the end of each load"""
+
+    def on_resolved(self) -> None:
+        super().on_resolved()
+        # partitions are created as folders below the folder of the file so it must be unique for a table
+        if self.partition_parquet_datasets and "{table_name}" not in posixpath.dirname(self.layout):
+            raise ConfigurationValueError(f"Layout '{self.layout}' must place {{table_name}} in a folder when partition_parquet_datasets is enabled, ie. {{table_name}}/{{load_id}}.{{file_id}}.{{ext}}")
 
     @resolve_type('credentials')
     def resolve_credentials_type(self) -> Type[CredentialsConfiguration]:
@@ -24,5 +38,9 @@ class FilesystemDestinationClientConfiguration(FilesystemConfiguration, Destinat
             dataset_name: str = None,
             default_schema_name: Optional[str] = None,
             bucket_url: str = None,
+            layout: str = None,
+            partition_parquet_datasets: bool = False,
+            max_rows_per_group: int = None,
+            write_table_manifests: bool = False,
         ) -> None:
             ...
@@ -1,13 +1,16 @@
 import posixpath
 import os
 from types import TracebackType
-from typing import ClassVar, List, Type, Iterable, Set, Iterator
+from typing import ClassVar, Dict, List, Optional, Type, Iterable, Set, Iterator, Sequence
 from fsspec import AbstractFileSystem
 from contextlib import contextmanager
 
-from dlt.common import logger
+from dlt.common import json, logger
+from dlt.common.typing import DictStrAny
 from dlt.common.schema import Schema, TSchemaTables, TTableSchema
+from dlt.common.schema.utils import get_columns_names_with_prop
 from dlt.common.storages import FileStorage, LoadStorage, fsspec_from_config
+from dlt.common.storages.transactional_file import TransactionalFile
 from dlt.common.destination import DestinationCapabilitiesContext
 from dlt.common.destination.reference import NewLoadJob, TLoadJobState, LoadJob, JobClientBase, FollowupJob, WithStagingDataset
 
@@ -16,6 +19,7 @@ from dlt.destinations.filesystem import capabilities
 from dlt.destinations.filesystem.configuration import FilesystemDestinationClientConfiguration
 from dlt.destinations.job_impl import NewReferenceJob
 from dlt.destinations import path_utils
+from dlt.destinations.filesystem import manifest
 
 
 class LoadFilesystemJob(LoadJob):
@@ -25,21 +29,40 @@ class LoadFilesystemJob(LoadJob):
             dataset_path: str,
             *,
             config: FilesystemDestinationClientConfiguration,
+            fs_client: AbstractFileSystem,
             schema_name: str,
             load_id: str
     ) -> None:
         file_name = FileStorage.get_file_name_from_file_path(local_path)
         self.config = config
         self.dataset_path = dataset_path
+        self.load_id = load_id
         self.destination_file_name = LoadFilesystemJob.make_destination_filename(config.layout, file_name, schema_name, load_id)
 
         super().__init__(file_name)
-        fs_client, _ = fsspec_from_config(config)
-        self.destination_file_name = LoadFilesystemJob.make_destination_filename(config.layout, file_name, schema_name, load_id)
+        # the filesystem instance of the client is used so no authenticated client is created per job
+        self._write_remote_file(fs_client, local_path)
+        if config.write_table_manifests:
+            self._write_manifest_entries(fs_client, self._make_manifest_entries(local_path))
+
+    def _write_remote_file(self, fs_client: AbstractFileSystem, local_path: str) -> None:
         item = self.make_remote_path()
-        logger.info("PUT file {item}")
+        logger.info(f"PUT file {item}")
         fs_client.put_file(local_path, item)
 
+    def _make_manifest_entries(self, local_path: str) -> List[DictStrAny]:
+        job_info = LoadStorage.parse_job_file_name(self.file_name())
+        file_stats = manifest.get_local_file_stats(local_path, job_info.file_format)
+        return [manifest.new_manifest_entry(
+            job_info.table_name, self.destination_file_name, self.load_id, job_info.file_format, **file_stats
+        )]
+
+    def _write_manifest_entries(self, fs_client: AbstractFileSystem, entries: List[DictStrAny]) -> None:
+        # entries are pending until the load is completed
+        pending_path = manifest.get_pending_path(self.dataset_path, self.load_id)
+        fs_client.makedirs(pending_path, exist_ok=True)
+        fs_client.pipe(posixpath.join(pending_path, self.file_name() + ".json"), json.dumpb(entries))
+
     @staticmethod
     def make_destination_filename(layout: str, file_name: str, schema_name: str, load_id: str) -> str:
         job_info = LoadStorage.parse_job_file_name(file_name)
@@ -60,6 +83,68 @@ class LoadFilesystemJob(LoadJob):
         raise NotImplementedError()
 
 
+class PartitionedParquetFilesystemJob(LoadFilesystemJob):
+    """Writes a parquet file as a hive partitioned dataset in the folder of the destination file.
+
+       Rows are split by the values of `partition_columns` and written in row groups of `config.max_rows_per_group` rows
+       so small row groups written by the normalizer are compacted.
+    """
+    def __init__(
+            self,
+            local_path: str,
+            dataset_path: str,
+            *,
+            config: FilesystemDestinationClientConfiguration,
+            fs_client: AbstractFileSystem,
+            schema_name: str,
+            load_id: str,
+            partition_columns: Sequence[str]
+    ) -> None:
+        self.partition_columns = partition_columns
+        self._written_files: List[DictStrAny] = []
+        super().__init__(local_path, dataset_path, config=config, fs_client=fs_client, schema_name=schema_name, load_id=load_id)
+
+    def _write_remote_file(self, fs_client: AbstractFileSystem, local_path: str) -> None:
+        from dlt.common.libs.pyarrow import pyarrow
+        from pyarrow import dataset
+
+        base_dir = posixpath.join(self.dataset_path, posixpath.dirname(self.destination_file_name))
+        # keep load id and file id in the names of the files so subsequent loads do not overwrite each other
+        file_stem = posixpath.basename(self.destination_file_name).rsplit(".", 1)[0]
+        logger.info(f"WRITE partitioned dataset {base_dir} partitioned by {self.partition_columns}")
+        self._base_dir = base_dir
+        dataset.write_dataset(
+            pyarrow.parquet.read_table(local_path),
+            base_dir,
+            format="parquet",
+            filesystem=fs_client,
+            partitioning=list(self.partition_columns),
+            partitioning_flavor="hive",
+            basename_template=file_stem + ".{i}.parquet",
+            min_rows_per_group=self.config.max_rows_per_group,
+            max_rows_per_group=self.config.max_rows_per_group,
+            existing_data_behavior="overwrite_or_ignore",
+            file_visitor=lambda written_file: self._written_files.append(
+                {"path": written_file.path, "metadata": written_file.metadata}
+            )
+        )
+
+    def _make_manifest_entries(self, local_path: str) -> List[DictStrAny]:
+        job_info = LoadStorage.parse_job_file_name(self.file_name())
+        return [
+            manifest.new_manifest_entry(
+                job_info.table_name,
+                posixpath.relpath(written_file["path"], self.dataset_path),
+                self.load_id,
+                job_info.file_format,
+                written_file["metadata"].num_rows,
+                manifest.get_parquet_metadata_stats(written_file["metadata"]),
+                manifest.get_hive_partition_values(self._base_dir, written_file["path"])
+            )
+            for written_file in self._written_files
+        ]
+
+
 class FollowupFilesystemJob(FollowupJob, LoadFilesystemJob):
     def create_followup_jobs(self, next_state: str) -> List[NewLoadJob]:
         jobs = super().create_followup_jobs(next_state)
@@ -107,8 +192,7 @@ class FilesystemClient(JobClientBase, WithStagingDataset):
     def initialize_storage(self, truncate_tables: Iterable[str] = None) -> None:
         # clean up existing files for tables selected for truncating
         if truncate_tables and self.fs_client.isdir(self.dataset_path):
-            # get all dirs with table data to delete. the table data are guaranteed to be files in those folders
-            # TODO: when we do partitioning it is no longer the case and we may remove folders below instead
+            # get all dirs with table data to delete. the table data are files in those folders or partition folders below
             truncated_dirs = self._get_table_dirs(truncate_tables)
             # print(f"TRUNCATE {truncated_dirs}")
             truncate_prefixes: Set[str] = set()
@@ -123,19 +207,24 @@ class FilesystemClient(JobClientBase, WithStagingDataset):
                 # NOTE: without refresh you get random results here
                 logger.info(f"Will truncate tables in {truncate_dir}")
                 try:
-                    all_files = self.fs_client.ls(truncate_dir, detail=False, refresh=True)
+                    all_files = self.fs_client.ls(truncate_dir, detail=True, refresh=True)
                     logger.info(f"Found {len(all_files)} CANDIDATE files in {truncate_dir}")
                     # print(f"in truncate dir {truncate_dir}: {all_files}")
                     for item in all_files:
                         # check every file against all the prefixes
                         for search_prefix in truncate_prefixes:
-                            if item.startswith(search_prefix):
+                            if item["name"].startswith(search_prefix):
                                 # NOTE: deleting in chunks on s3 does not raise on access denied, file non existing and probably other errors
                                 # logger.info(f"DEL {item}")
                                 # print(f"DEL {item}")
-                                self.fs_client.rm(item)
+                                # partitioned datasets keep files in partition folders
+                                self.fs_client.rm(item["name"], recursive=item["type"] == "directory")
                 except FileNotFoundError:
                     logger.info(f"Directory or path to truncate tables {truncate_dir} does not exist but it should be created previously!")
+            if self.config.write_table_manifests:
+                for table in truncate_tables:
+                    if self.fs_client.isfile(manifest.get_manifest_path(self.dataset_path, table)):
+                        self._update_table_manifest(table, [], replace=True)
 
     def update_stored_schema(self, only_tables: Iterable[str] = None, expected_update: TSchemaTables = None) -> TSchemaTables:
         # create destination dirs for all tables
@@ -158,11 +247,26 @@ class FilesystemClient(JobClientBase, WithStagingDataset):
         return self.fs_client.isdir(self.dataset_path)  # type: ignore[no-any-return]
 
     def start_file_load(self, table: TTableSchema, file_path: str, load_id: str) -> LoadJob:
+        # staging destinations pass a single file to the final destination so they are never partitioned
+        if self.config.partition_parquet_datasets and not self.config.as_staging \
+                and LoadStorage.parse_job_file_name(file_path).file_format == "parquet":
+            partition_columns = get_columns_names_with_prop(table, "partition")
+            if partition_columns:
+                return PartitionedParquetFilesystemJob(
+                    file_path,
+                    self.dataset_path,
+                    config=self.config,
+                    fs_client=self.fs_client,
+                    schema_name=self.schema.name,
+                    load_id=load_id,
+                    partition_columns=partition_columns
+                )
         cls = FollowupFilesystemJob if self.config.as_staging else LoadFilesystemJob
         return cls(
             file_path,
             self.dataset_path,
             config=self.config,
+            fs_client=self.fs_client,
             schema_name=self.schema.name,
             load_id=load_id
         )
@@ -170,7 +274,35 @@ class FilesystemClient(JobClientBase, WithStagingDataset):
     def restore_file_load(self, file_path: str) -> LoadJob:
         return EmptyLoadJob.from_file_path(file_path, "completed")
 
+    def get_table_manifest(self, table_name: str) -> Optional[DictStrAny]:
+        """Returns manifest with files of completed loads of `table_name` or None if table has no manifest"""
+        manifest_path = manifest.get_manifest_path(self.dataset_path, table_name)
+        if not self.fs_client.isfile(manifest_path):
+            return None
+        return manifest.load_manifest(self.fs_client.cat(manifest_path))
+
+    def _update_table_manifest(self, table_name: str, entries: List[DictStrAny], replace: bool = False) -> None:
+        # writers of the same table in other loads are serialized with a lock file
+        manifest_file = TransactionalFile(manifest.get_manifest_path(self.dataset_path, table_name), self.fs_client)
+        with manifest_file.lock():
+            current_manifest = manifest.load_manifest(manifest_file.read())
+            manifest_file.write(manifest.dump_manifest(manifest.merge_manifest(current_manifest, table_name, entries, replace)))
+
+    def _commit_table_manifests(self, load_id: str) -> None:
+        pending_path = manifest.get_pending_path(self.dataset_path, load_id)
+        if not self.fs_client.isdir(pending_path):
+            return
+        entries_by_table: Dict[str, List[DictStrAny]] = {}
+        for entries_file in self.fs_client.ls(pending_path, detail=False, refresh=True):
+            for entry in json.loadb(self.fs_client.cat(entries_file)):
+                entries_by_table.setdefault(entry["table_name"], []).append(entry)
+        for table_name, entries in entries_by_table.items():
+            self._update_table_manifest(table_name, entries)
+        self.fs_client.rm(pending_path, recursive=True)
+
     def complete_load(self, load_id: str) -> None:
+        if self.config.write_table_manifests:
+            self._commit_table_manifests(load_id)
         schema_name = self.schema.name
         table_name = self.schema.loads_table_name
         file_name = f"{schema_name}.{table_name}.{load_id}"
@@ -0,0 +1,121 @@
+"""Per table manifests of data files with row counts and column statistics.
+
+Load jobs compute statistics of the files they write and store them as pending entries of the load package.
+`complete_load` moves pending entries into the table manifests so readers see only completed loads.
+"""
+import posixpath
+from typing import Any, Dict, List, Optional
+
+from dlt.common import json
+from dlt.common.typing import DictStrAny
+from dlt.common.storages import FileStorage
+
+MANIFESTS_FOLDER = "_manifests"
+PENDING_FOLDER = "_pending"
+
+
+def get_manifest_path(dataset_path: str, table_name: str) -> str:
+    return posixpath.join(dataset_path, MANIFESTS_FOLDER, f"{table_name}.json")
+
+
+def get_pending_path(dataset_path: str, load_id: str) -> str:
+    return posixpath.join(dataset_path, MANIFESTS_FOLDER, PENDING_FOLDER, load_id)
+
+
+def new_manifest(table_name: str) -> DictStrAny:
+    return {"table_name": table_name, "version": 0, "files": []}
+
+
+def new_manifest_entry(
+    table_name: str,
+    path: str,
+    load_id: str,
+    file_format: str,
+    row_count: int,
+    stats: Dict[str, DictStrAny] = None,
+    partition_values: Dict[str, str] = None
+) -> DictStrAny:
+    """Creates a manifest entry for a data file with `path` relative to the dataset"""
+    entry: DictStrAny = {
+        "table_name": table_name,
+        "path": path,
+        "load_id": load_id,
+        "file_format": file_format,
+        "row_count": row_count,
+        "stats": stats or {}
+    }
+    if partition_values:
+        entry["partition_values"] = partition_values
+    return entry
+
+
+def get_parquet_metadata_stats(metadata: Any) -> Dict[str, DictStrAny]:
+    """Aggregates min/max statistics of all row groups in `metadata` (`pyarrow.parquet.FileMetaData`) per column"""
+    stats: Dict[str, DictStrAny] = {}
+    skipped = set()
+    for rg_idx in range(metadata.num_row_groups):
+        row_group = metadata.row_group(rg_idx)
+        for col_idx in range(row_group.num_columns):
+            column = row_group.column(col_idx)
+            name = column.path_in_schema
+            if name in skipped:
+                continue
+            # a column without statistics in any of the row groups has unknown min/max
+            if column.statistics is None or not column.statistics.has_min_max:
+                skipped.add(name)
+                stats.pop(name, None)
+                continue
+            col_stats = stats.setdefault(name, {"min": column.statistics.min, "max": column.statistics.max})
+            col_stats["min"] = min(col_stats["min"], column.statistics.min)
+            col_stats["max"] = max(col_stats["max"], column.statistics.max)
+    return stats
+
+
+def get_local_file_stats(local_path: str, file_format: str) -> DictStrAny:
+    """Gets row count and column statistics of a local load job file. Only parquet files contain column statistics."""
+    if file_format == "parquet":
+        from dlt.common.libs.pyarrow import pyarrow
+
+        metadata = pyarrow.parquet.read_metadata(local_path)
+        return {"row_count": metadata.num_rows, "stats": get_parquet_metadata_stats(metadata)}
+    # jsonl and insert_values files have one row per line
+    with FileStorage.open_zipsafe_ro(local_path, "rb") as f:
+        row_count = sum(1 for _ in f)
+    if file_format == "insert_values":
+        # skip the `INSERT INTO` and `VALUES` header lines
+        row_count = max(row_count - 2, 0)
+    return {"row_count": row_count, "stats": {}}
+
+
+def get_hive_partition_values(base_dir: str, file_path: str) -> Dict[str, str]:
+    """Extracts `key=value` segments of hive partitioned `file_path` below `base_dir`"""
+    partition_dir = posixpath.relpath(posixpath.dirname(file_path), base_dir)
+    values: Dict[str, str] = {}
+    for segment in partition_dir.split("/"):
+        if "=" in segment:
+            key, value = segment.split("=", 1)
+            values[key] = value
+    return values
+
+
+def merge_manifest(manifest: Optional[DictStrAny], table_name: str, entries: List[DictStrAny], replace: bool = False) -> DictStrAny:
+    """Appends `entries` to a copy of `manifest` or replaces all its files if `replace` is set and bumps its version"""
+    manifest = dict(manifest or new_manifest(table_name))
+    if replace:
+        manifest["files"] = entries
+    else:
+        # a job retried within the same load replaces its entry
+        new_paths = {entry["path"] for entry in entries}
+        manifest["files"] = [entry for entry in manifest["files"] if entry["path"] not in new_paths] + entries
+    manifest["version"] += 1
+    return manifest
+
+
+def dump_manifest(manifest: DictStrAny) -> bytes:
+    return json.dumpb(manifest, pretty=True)
+
+
+def load_manifest(content: Optional[bytes]) -> Optional[DictStrAny]:
+    if content is None:
+        return None
+    return json.loadb(content)  # type: ignore[no-any-return]
@@ -1,11 +1,12 @@
 import os
 import abc
-from typing import Any, Iterator, List
+import threading
+from queue import Full, Queue
+from typing import Any, Generator, Iterator, List, Tuple
 
 from dlt.common.destination.reference import LoadJob, FollowupJob, TLoadJobState
 from dlt.common.schema.typing import TTableSchema
 from dlt.common.storages import FileStorage
-from dlt.common.utils import chunks
 
 from dlt.destinations.sql_client import SqlClientBase
 from dlt.destinations.job_impl import EmptyLoadJob
@@ -13,12 +14,15 @@ from dlt.destinations.job_client_impl import SqlJobClientWithStaging
 
 
 class InsertValuesLoadJob(LoadJob, FollowupJob):
+    VALUES_MARK = "VALUES\n"
+
     def __init__(self, table_name: str, file_path: str, sql_client: SqlClientBase[Any]) -> None:
         super().__init__(FileStorage.get_file_name_from_file_path(file_path))
         self._sql_client = sql_client
         # insert file content immediately
         with self._sql_client.begin_transaction():
-            for fragments in self._insert(sql_client.make_qualified_table_name(table_name), file_path):
+            # next statement is built while the previous one is executed
+            for fragments in self._prefetch(self._insert(sql_client.make_qualified_table_name(table_name), file_path)):
                 self._sql_client.execute_fragments(fragments)
 
     def state(self) -> TLoadJobState:
@@ -32,16 +36,110 @@ class InsertValuesLoadJob(LoadJob, FollowupJob):
     def _insert(self, qualified_table_name: str, file_path: str) -> Iterator[List[str]]:
         # WARNING: maximum redshift statement is 16MB https://docs.aws.amazon.com/redshift/latest/dg/c_redshift-sql.html
         # the procedure below will split the inserts into max_query_length // 2 packs
+        max_rows = self._sql_client.capabilities.max_rows_per_insert
+        chunk_size = self._sql_client.capabilities.max_query_length // 2
+        # uncompressed files are memory mapped so the chunks are sliced from the page cache instead of being read into python buffers
+        read_chunks = self._read_chunks if FileStorage.is_gzipped(file_path) else self._read_mapped_chunks
+        # statements are passed as fragments so sql client joins them at most once
+        insert_sql: List[str] = []
+
+        for header, content, until_nl in read_chunks(file_path, chunk_size):
+            # if there was anything left, until_nl contains the last line
+            is_eof = len(until_nl) == 0 or until_nl[-1] == ";"
+            if not is_eof:
+                # print(f'replace the "," with " {until_nl} {len(insert_sql)}')
+                until_nl = until_nl[:-1] + ";"
+            insert_header = header.format(qualified_table_name)
+
+            if max_rows is not None:
+                # mssql has a limit of 1000 rows per INSERT, so we need to split into separate statements
+                # Chunk by max_rows - 1 for simplicity because one more row may be added
+                pos = 0
+                while pos < len(content):
+                    end = self._find_nth_line_end(content, pos, max_rows - 1)
+                    insert_sql.extend([insert_header, self.VALUES_MARK])
+                    if end == len(content):
+                        # On the last chunk we need to add the extra row read
+                        insert_sql.extend([content[pos:], until_nl])
+                    else:
+                        # Replace the , with ;
+                        insert_sql.append(content[pos:end].strip()[:-1] + ";\n")
+                    pos = end
+            else:
+                # otherwise write all content in a single INSERT INTO
+                insert_sql.extend([insert_header, self.VALUES_MARK, content, until_nl])
+
+            # actually this may be empty if we were able to read a full file into content
+            if not is_eof:
+                # execute chunk of insert
+                yield insert_sql
+                insert_sql = []
+
+        if insert_sql:
+            yield insert_sql
+
+    @staticmethod
+    def _find_nth_line_end(content: str, pos: int, n: int) -> int:
+        """Returns position after the `n`-th new line in `content` starting at `pos` or the length of `content` if there are fewer lines"""
+        for _ in range(n):
+            pos = content.find("\n", pos) + 1
+            if pos == 0:
+                return len(content)
+        return pos
+
+    @staticmethod
+    def _prefetch(statements: Generator[List[str], None, None]) -> Iterator[List[str]]:
+        """Takes `statements` from a generator running in a background thread, so the next statement is read and built while the current one is executed.
+
+           The database connection is used only by the calling thread.
+        """
+        prefetched: "Queue[Tuple[List[str], BaseException]]" = Queue(maxsize=1)
+        stop = threading.Event()
+
+        def _put(item: Tuple[List[str], BaseException]) -> bool:
+            while not stop.is_set():
+                try:
+                    prefetched.put(item, timeout=0.1)
+                    return True
+                except Full:
+                    pass
+            return False
+
+        def _build() -> None:
+            try:
+                for statement in statements:
+                    if not _put((statement, None)):
+                        return
+                _put((None, None))
+            except BaseException as ex:
+                _put((None, ex))
+
+        builder = threading.Thread(target=_build, daemon=True, name="dlt_insert_values")
+        builder.start()
+        try:
+            while True:
+                statement, ex = prefetched.get()
+                if ex is not None:
+                    raise ex
+                if statement is None:
+                    return
+                yield statement
+        finally:
+            stop.set()
+            builder.join()
+            # builder thread is done so the generator may be closed to release the file
+            statements.close()
+
+    @classmethod
+    def _read_chunks(cls, file_path: str, chunk_size: int) -> Iterator[Tuple[str, str, str]]:
+        """Yields insert header, content chunk of `chunk_size` characters and the remainder of the line where the content chunk ended"""
         with FileStorage.open_zipsafe_ro(file_path, "r", encoding="utf-8") as f:
             header = f.readline()
             values_mark = f.readline()
             # properly formatted file has a values marker at the beginning
-            assert values_mark == "VALUES\n"
-
-            max_rows = self._sql_client.capabilities.max_rows_per_insert
+            assert values_mark == cls.VALUES_MARK
 
-            insert_sql = []
-            while content := f.read(self._sql_client.capabilities.max_query_length // 2):
+            while content := f.read(chunk_size):
                 # read one more line in order to
                 # 1. complete the content which ends at "random" position, not an end line
                 # 2. to modify its ending without a need to re-allocating the 8MB of "content"
@@ -50,43 +148,37 @@ class InsertValuesLoadJob(LoadJob, FollowupJob):
                 # TODO: write test for this case (content ends with ",")
                 if until_nl == "\n":
                     until_nl = f.readline()
-                until_nl = until_nl.strip("\n")
-                # if there was anything left, until_nl contains the last line
-                is_eof = len(until_nl) == 0 or until_nl[-1] == ";"
-                if not is_eof:
-                    # print(f'replace the "," with " {until_nl} {len(insert_sql)}')
-                    until_nl = until_nl[:-1] + ";"
-
-                if max_rows is not None:
-                    # mssql has a limit of 1000 rows per INSERT, so we need to split into separate statements
-                    values_rows = content.splitlines(keepends=True)
-                    len_rows = len(values_rows)
-                    processed = 0
-                    # Chunk by max_rows - 1 for simplicity because one more row may be added
-                    for chunk in chunks(values_rows, max_rows - 1):
-                        processed += len(chunk)
-                        insert_sql.extend([header.format(qualified_table_name), values_mark])
-                        if processed == len_rows:
-                            # On the last chunk we need to add the extra row read
-                            insert_sql.append("".join(chunk) + until_nl)
-                        else:
-                            # Replace the , with ;
-                            insert_sql.append("".join(chunk).strip()[:-1] + ";\n")
-                else:
-                    # otherwise write all content in a single INSERT INTO
-                    insert_sql.extend([header.format(qualified_table_name), values_mark, content])
-
-                    if until_nl:
-                        insert_sql.append(until_nl)
-
-                # actually this may be empty if we were able to read a full file into content
-                if not is_eof:
-                    # execute chunk of insert
-                    yield insert_sql
-                    insert_sql = []
-
-        if insert_sql:
-            yield insert_sql
+                yield header, content, until_nl.strip("\n")
+
+    @classmethod
+    def _read_mapped_chunks(cls, file_path: str, chunk_size: int) -> Iterator[Tuple[str, str, str]]:
+        """Same as `_read_chunks` but slices the chunks from memory mapped, uncompressed file. Note that `chunk_size` is in bytes here."""
+        with FileStorage.open_mmap_ro(file_path) as buffer:
+            size = len(buffer)
+            header_end = buffer.find(b"\n") + 1
+            values_end = buffer.find(b"\n", header_end) + 1
+            header = str(buffer[:header_end], "utf-8")
+            # properly formatted file has a values marker at the beginning
+            assert buffer[header_end:values_end] == cls.VALUES_MARK.encode("utf-8")
+
+            view = memoryview(buffer)
+            try:
+                pos = values_end
+                while pos < size:
+                    content_end = min(pos + chunk_size, size)
+                    # never split utf-8 multi byte character, continuation bytes are 0b10xxxxxx
+                    while content_end < size and view[content_end] & 0xC0 == 0x80:
+                        content_end += 1
+                    # complete the content with the line where it ended, take another line if content ended exactly at a new line
+                    line_end = size
+                    if content_end < size:
+                        nl = buffer.find(b"\n", content_end + 1 if view[content_end] == 0x0A else content_end)
+                        if nl != -1:
+                            line_end = nl + 1
+                    yield header, str(view[pos:content_end], "utf-8"), str(view[content_end:line_end], "utf-8").strip("\n")
+                    pos = line_end
+            finally:
+                view.release()
 
 
 class InsertValuesJobClient(SqlJobClientWithStaging):
@@ -6,7 +6,7 @@ import contextlib
 from copy import copy
 import datetime  # noqa: 251
 from types import TracebackType
-from typing import Any, ClassVar, List, NamedTuple, Optional, Sequence, Tuple, Type, Iterable, Iterator, ContextManager, cast
+from typing import Any, ClassVar, Dict, List, NamedTuple, Optional, Sequence, Tuple, Type, Iterable, Iterator, ContextManager, cast
 import zlib
 import re
 
@@ -16,7 +16,7 @@ from dlt.common.schema.typing import COLUMN_HINTS, TColumnType, TColumnSchemaBas
 from dlt.common.storages import FileStorage
 from dlt.common.schema import TColumnSchema, Schema, TTableSchemaColumns, TSchemaTables
 from dlt.common.destination.reference import StateInfo, StorageSchemaInfo,WithStateSync, DestinationClientConfiguration, DestinationClientDwhConfiguration, DestinationClientDwhWithStagingConfiguration, NewLoadJob, WithStagingDataset, TLoadJobState, LoadJob, JobClientBase, FollowupJob, CredentialsConfiguration
-from dlt.common.utils import concat_strings_with_limit
+from dlt.common.utils import chunks, concat_strings_with_limit
 from dlt.destinations.exceptions import DatabaseUndefinedRelation, DestinationSchemaTampered, DestinationSchemaWillNotUpdate
 from dlt.destinations.job_impl import EmptyLoadJobWithoutFollowup, NewReferenceJob
 from dlt.destinations.sql_jobs import SqlMergeJob, SqlStagingCopyJob
@@ -199,13 +199,23 @@ class SqlJobClientBase(JobClientBase, WithStateSync):
         )
 
     def __enter__(self) -> "SqlJobClientBase":
-        self.sql_client.open_connection()
+        self.sql_client.acquire_connection()
         return self
 
     def __exit__(self, exc_type: Type[BaseException], exc_val: BaseException, exc_tb: TracebackType) -> None:
-        self.sql_client.close_connection()
+        self.sql_client.release_connection()
 
     def get_storage_table(self, table_name: str) -> Tuple[bool, TTableSchemaColumns]:
+        storage_table = self.get_storage_tables([table_name])[table_name]
+        # if no columns we assume that table does not exist
+        return len(storage_table) > 0, storage_table
+
+    def get_storage_tables(self, table_names: Iterable[str]) -> Dict[str, TTableSchemaColumns]:
+        """Retrieves columns of all tables in `table_names` from INFORMATION_SCHEMA in a single query.
+
+        Table names are split into several queries if they exceed `max_query_parameters` of the destination.
+        Returns a dictionary with all requested table names. Tables that do not exist in the storage have no columns.
+        """
 
         def _null_to_bool(v: str) -> bool:
             if v == "NO":
@@ -214,35 +224,44 @@ class SqlJobClientBase(JobClientBase, WithStateSync):
                 return True
             raise ValueError(v)
 
-        fields = ["column_name", "data_type", "is_nullable"]
+        storage_tables: Dict[str, TTableSchemaColumns] = {table_name: {} for table_name in table_names}
+        if not storage_tables:
+            return storage_tables
+
+        fields = ["table_name", "column_name", "data_type", "is_nullable"]
         if self.capabilities.schema_supports_numeric_precision:
             fields += ["numeric_precision", "numeric_scale"]
-        db_params = self.sql_client.make_qualified_table_name(table_name, escape=False).split(".", 3)
-        query = f"""
+        db_params = self.sql_client.fully_qualified_dataset_name(escape=False).split(".", 2)
+        query_prefix = f"""
 SELECT {",".join(fields)}
     FROM INFORMATION_SCHEMA.COLUMNS
 WHERE """
-        if len(db_params) == 3:
-            query += "table_catalog = %s AND "
-        query += "table_schema = %s AND table_name = %s ORDER BY ordinal_position;"
-        rows = self.sql_client.execute_sql(query, *db_params)
-
-        # if no rows we assume that table does not exist
-        schema_table: TTableSchemaColumns = {}
-        if len(rows) == 0:
-            # TODO: additionally check if table exists
-            return False, schema_table
+        if len(db_params) == 2:
+            query_prefix += "table_catalog = %s AND "
+        table_names = list(storage_tables.keys())
+        chunk_size = len(table_names)
+        if self.capabilities.max_query_parameters:
+            chunk_size = min(chunk_size, self.capabilities.max_query_parameters - len(db_params))
+        rows: List[Sequence[Any]] = []
+        for table_names_chunk in chunks(table_names, chunk_size):
+            query = query_prefix + f"table_schema = %s AND table_name IN ({','.join(['%s'] * len(table_names_chunk))}) ORDER BY table_name, ordinal_position;"
+            rows.extend(self.sql_client.execute_sql(query, *db_params, *table_names_chunk) or [])
+
         # TODO: pull more data to infer indexes, PK and uniques attributes/constraints
         for c in rows:
-            numeric_precision = c[3] if self.capabilities.schema_supports_numeric_precision else None
-            numeric_scale = c[4] if self.capabilities.schema_supports_numeric_precision else None
+            schema_table = storage_tables.get(c[0])
+            if schema_table is None:
+                # information schema may not preserve the case of the table name
+                continue
+            numeric_precision = c[4] if self.capabilities.schema_supports_numeric_precision else None
+            numeric_scale = c[5] if self.capabilities.schema_supports_numeric_precision else None
             schema_c: TColumnSchemaBase = {
-                "name": c[0],
-                "nullable": _null_to_bool(c[2]),
-                **self._from_db_type(c[1], numeric_precision, numeric_scale)
+                "name": c[1],
+                "nullable": _null_to_bool(c[3]),
+                **self._from_db_type(c[2], numeric_precision, numeric_scale)
             }
-            schema_table[c[0]] = schema_c  # type: ignore
-        return True, schema_table
+            schema_table[c[1]] = schema_c  # type: ignore
+        return storage_tables
 
     @abstractmethod
     def _from_db_type(self, db_type: str, precision: Optional[int], scale: Optional[int]) -> TColumnType:
@@ -300,8 +319,11 @@ WHERE """
         """
         sql_updates = []
         schema_update: TSchemaTables = {}
-        for table_name in only_tables or self.schema.tables:
-            exists, storage_table = self.get_storage_table(table_name)
+        # get columns of all the tables in a single query
+        storage_tables = self.get_storage_tables(only_tables or self.schema.tables.keys())
+        for table_name, storage_table in storage_tables.items():
+            # if no columns we assume that table does not exist
+            exists = len(storage_table) > 0
             new_columns = self._create_table_update(table_name, storage_table)
             if len(new_columns) > 0:
                 # build and add sql to execute
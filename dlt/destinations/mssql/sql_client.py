@@ -29,6 +29,7 @@ class PyOdbcMsSqlClient(SqlClientBase[pyodbc.Connection], DBTransaction):
 
     dbapi: ClassVar[DBApi] = pyodbc
     capabilities: ClassVar[DestinationCapabilitiesContext] = capabilities()
+    supports_connection_pooling: ClassVar[bool] = True
 
     def __init__(self, dataset_name: str, credentials: MsSqlCredentials) -> None:
         super().__init__(credentials.database, dataset_name)
@@ -51,6 +52,20 @@ class PyOdbcMsSqlClient(SqlClientBase[pyodbc.Connection], DBTransaction):
             self._conn.close()
             self._conn = None
 
+    def attach_native_connection(self, native_connection: pyodbc.Connection) -> None:
+        self._conn = native_connection
+
+    def detach_native_connection(self) -> Optional[pyodbc.Connection]:
+        # do not reuse connections with pending transaction
+        if not self._conn.autocommit:
+            return None
+        native_connection, self._conn = self._conn, None
+        return native_connection
+
+    def is_connection_alive(self) -> bool:
+        # set by the driver when connection is closed
+        return not self._conn.closed
+
     @contextmanager
     def begin_transaction(self) -> Iterator[DBTransaction]:
         try:
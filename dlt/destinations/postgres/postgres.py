@@ -1,11 +1,14 @@
-from typing import ClassVar, Dict, Optional, Sequence, List, Any
+import base64
+from typing import ClassVar, Dict, Iterator, Optional, Sequence, List, Any
 
+from dlt.common import json
 from dlt.common.wei import EVM_DECIMAL_PRECISION
-from dlt.common.destination.reference import NewLoadJob
+from dlt.common.destination.reference import LoadJob, FollowupJob, NewLoadJob, TLoadJobState
 from dlt.common.destination import DestinationCapabilitiesContext
 from dlt.common.data_types import TDataType
 from dlt.common.schema import TColumnSchema, TColumnHint, Schema
 from dlt.common.schema.typing import TTableSchema, TColumnType, TTableFormat
+from dlt.common.storages import FileStorage
 
 from dlt.destinations.sql_jobs import SqlStagingCopyJob, SqlJobParams
 
@@ -94,6 +97,91 @@ class PostgresStagingCopyJob(SqlStagingCopyJob):
         return sql
 
 
+class PostgresCopyLoadJob(LoadJob, FollowupJob):
+    """Streams rows of a `jsonl` file into a table with `COPY ... FROM STDIN` in text format.
+
+       Rows are converted while `COPY` reads the stream so the file is never fully loaded into memory. Complex columns are
+       serialized into json and base64 encoded binary columns are converted into `bytea` hex format.
+    """
+    NULL_MARK = "\\N"
+    TEXT_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+    def __init__(self, table: TTableSchema, file_path: str, sql_client: Psycopg2SqlClient) -> None:
+        super().__init__(FileStorage.get_file_name_from_file_path(file_path))
+        self._sql_client = sql_client
+        escape_identifier = sql_client.capabilities.escape_identifier
+        columns = list(table["columns"].values())
+        column_names = ", ".join(escape_identifier(c["name"]) for c in columns)
+        qualified_table_name = sql_client.make_qualified_table_name(table["name"])
+        # copy file content immediately
+        with FileStorage.open_zipsafe_ro(file_path, "rb") as f:
+            with sql_client.begin_transaction():
+                sql_client.copy_from_stdin(
+                    f"COPY {qualified_table_name} ({column_names}) FROM STDIN",
+                    _LinesStream(self._copy_lines(f, columns))
+                )
+
+    def state(self) -> TLoadJobState:
+        # this job is always done
+        return "completed"
+
+    def exception(self) -> str:
+        # this part of code should be never reached
+        raise NotImplementedError()
+
+    @classmethod
+    def _copy_lines(cls, f: Any, columns: List[TColumnSchema]) -> Iterator[str]:
+        converters = [(c["name"], cls._get_converter(c.get("data_type"))) for c in columns]
+        for line in f:
+            if not line.strip():
+                continue
+            row = json.loadb(line)
+            yield "\t".join(
+                cls.NULL_MARK if (value := row.get(name)) is None else convert(value).translate(cls.TEXT_ESCAPES)
+                for name, convert in converters
+            ) + "\n"
+
+    @staticmethod
+    def _get_converter(data_type: TDataType) -> Any:
+        if data_type == "complex":
+            return json.dumps
+        if data_type == "binary":
+            # jsonl writer encodes bytes with base64
+            return lambda v: "\\x" + base64.b64decode(v).hex()
+        if data_type == "bool":
+            return lambda v: "t" if v else "f"
+        return str
+
+
+class _LinesStream:
+    """Minimal file-like object that `copy_expert` reads the lines produced by a generator from"""
+    def __init__(self, lines: Iterator[str]) -> None:
+        self._lines = lines
+        self._buffer = ""
+
+    def read(self, size: int = -1) -> str:
+        chunks = [self._buffer]
+        buffered = len(self._buffer)
+        while size < 0 or buffered < size:
+            line = next(self._lines, None)
+            if line is None:
+                break
+            chunks.append(line)
+            buffered += len(line)
+        data = "".join(chunks)
+        if size < 0:
+            self._buffer = ""
+            return data
+        self._buffer = data[size:]
+        return data[:size]
+
+    def readline(self, size: int = -1) -> str:
+        if self._buffer:
+            line, self._buffer = self._buffer, ""
+            return line
+        return next(self._lines, "")
+
+
 class PostgresClient(InsertValuesJobClient):
 
     capabilities: ClassVar[DestinationCapabilitiesContext] = capabilities()
@@ -114,6 +202,13 @@ class PostgresClient(InsertValuesJobClient):
         column_name = self.capabilities.escape_identifier(c["name"])
         return f"{column_name} {self.type_mapper.to_db_type(c)} {hints_str} {self._gen_not_null(c.get('nullable', True))}"
 
+    def start_file_load(self, table: TTableSchema, file_path: str, load_id: str) -> LoadJob:
+        job = super().start_file_load(table, file_path, load_id)
+        if not job and file_path.endswith("jsonl"):
+            # this is using sql_client internally and will raise a right exception
+            job = PostgresCopyLoadJob(table, file_path, self.sql_client)
+        return job
+
     def _create_replace_followup_jobs(self, table_chain: Sequence[TTableSchema]) -> List[NewLoadJob]:
         if self.config.replace_strategy == "staging-optimized":
             return [PostgresStagingCopyJob.from_table_chain(table_chain, self.sql_client)]
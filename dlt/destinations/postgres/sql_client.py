@@ -10,7 +10,7 @@ else:
     from psycopg2.sql import SQL, Composed, Composable
 
 from contextlib import contextmanager
-from typing import Any, AnyStr, ClassVar, Iterator, Optional, Sequence
+from typing import IO, Any, AnyStr, ClassVar, Iterator, Optional, Sequence
 
 from dlt.destinations.exceptions import DatabaseTerminalException, DatabaseTransientException, DatabaseUndefinedRelation
 from dlt.destinations.typing import DBApi, DBApiCursor, DBTransaction
@@ -24,6 +24,7 @@ class Psycopg2SqlClient(SqlClientBase["psycopg2.connection"], DBTransaction):
 
     dbapi: ClassVar[DBApi] = psycopg2
     capabilities: ClassVar[DestinationCapabilitiesContext] = capabilities()
+    supports_connection_pooling: ClassVar[bool] = True
 
     def __init__(self, dataset_name: str, credentials: PostgresCredentials) -> None:
         super().__init__(credentials.database, dataset_name)
@@ -45,6 +46,20 @@ class Psycopg2SqlClient(SqlClientBase["psycopg2.connection"], DBTransaction):
             self._conn.close()
             self._conn = None
 
+    def attach_native_connection(self, native_connection: "psycopg2.connection") -> None:
+        self._conn = native_connection
+
+    def detach_native_connection(self) -> Optional["psycopg2.connection"]:
+        # do not reuse connections with pending transaction
+        if not self._conn.autocommit:
+            return None
+        native_connection, self._conn = self._conn, None
+        return native_connection
+
+    def is_connection_alive(self) -> bool:
+        # set by the driver when connection is closed or lost
+        return not self._conn.closed
+
     @contextmanager
     def begin_transaction(self) -> Iterator[DBTransaction]:
         try:
@@ -96,10 +111,19 @@ class Psycopg2SqlClient(SqlClientBase["psycopg2.connection"], DBTransaction):
                 raise outer
 
     def execute_fragments(self, fragments: Sequence[AnyStr], *args: Any, **kwargs: Any) -> Optional[Sequence[Sequence[Any]]]:
+        if len(fragments) == 1:
+            # single statement is passed as is to prevent copying
+            return self.execute_sql(fragments[0], *args, **kwargs)
         # compose the statements using psycopg2 library
         composed =  Composed(sql if isinstance(sql, Composable) else SQL(sql) for sql in fragments)
         return self.execute_sql(composed, *args, **kwargs)
 
+    @raise_database_error
+    def copy_from_stdin(self, sql: str, stream: IO[str]) -> None:
+        """Executes `COPY ... FROM STDIN` statement in `sql`, reading the data from `stream`"""
+        with self._conn.cursor() as curr:
+            curr.copy_expert(sql, stream)
+
     def fully_qualified_dataset_name(self, escape: bool = True) -> str:
         return self.capabilities.escape_identifier(self.dataset_name) if escape else self.dataset_name
 
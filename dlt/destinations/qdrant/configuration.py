@@ -62,6 +62,12 @@ class QdrantClientConfiguration(DestinationClientDwhConfiguration):
     upload_parallelism: int = 1
     # Number of retries for uploading embeddings
     upload_max_retries: int = 3
+    # Number of rows read from a load file, embedded and uploaded at once
+    load_chunk_size: int = 4096
+    # Path to a local sqlite database caching embeddings of documents. Cache is disabled if `None`
+    embedding_cache_path: Optional[str] = None
+    # Maximum number of embeddings in cache, least recently used are removed
+    embedding_cache_max_items: int = 1000000
 
     # Qdrant client options
     options: QdrantClientOptions
@@ -1,3 +1,6 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
+from itertools import islice
 from types import TracebackType
 from typing import ClassVar, Optional, Sequence, List, Dict, Type, Iterable, Any, IO
 
@@ -9,12 +12,14 @@ from dlt.common.destination.reference import TLoadJobState, LoadJob, JobClientBa
 from dlt.common.storages import FileStorage
 
 from dlt.destinations.job_impl import EmptyLoadJob
+from dlt.destinations.embedding_cache import EmbeddingCache
 from dlt.destinations.job_client_impl import StorageSchemaInfo, StateInfo
 
 from dlt.destinations.qdrant import capabilities
 from dlt.destinations.qdrant.configuration import QdrantClientConfiguration
 from dlt.destinations.qdrant.qdrant_adapter import VECTORIZE_HINT
 
+import numpy as np
 from qdrant_client import QdrantClient as QC, models
 from qdrant_client.qdrant_fastembed import uuid
 from qdrant_client.http.exceptions import UnexpectedResponse
@@ -37,27 +42,64 @@ class LoadQdrantJob(LoadJob):
         self.unique_identifiers = self._list_unique_identifiers(table_schema)
         self.config = client_config
 
-        with FileStorage.open_zipsafe_ro(local_path) as f:
-            docs, payloads, ids = [], [], []
-
-            for line in f:
-                data = json.loads(line)
-                point_id = self._generate_uuid(
-                    data, self.unique_identifiers, self.collection_name) if self.unique_identifiers else uuid.uuid4()
-                embedding_doc = self._get_embedding_doc(data)
-                payloads.append(data)
-                ids.append(point_id)
-                docs.append(embedding_doc)
-
+        embedding_cache = EmbeddingCache(
+            self.config.embedding_cache_path, self.config.model, self.config.embedding_cache_max_items
+        ) if self.config.embedding_cache_path else None
+        with FileStorage.open_zipsafe_ro(local_path) as f, embedding_cache or nullcontext():
             embedding_model = db_client._get_or_init_model(
                 db_client.embedding_model_name)
-            embeddings = list(embedding_model.embed(
-                docs, batch_size=self.config.embedding_batch_size, parallel=self.config.embedding_parallelism))
             vector_name = db_client.get_vector_field_name()
-            embeddings = [{vector_name: embedding.tolist()} for embedding in embeddings]
-            assert len(embeddings) == len(payloads) == len(ids)
+            # a chunk is uploaded in the background while the next one is embedded
+            # so at most two chunks are kept in memory
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="dlt_qdrant_upload") as upload_pool:
+                upload: "Future[None]" = None
+                while lines := list(islice(f, self.config.load_chunk_size)):
+                    docs, payloads, ids = [], [], []
+                    for line in lines:
+                        data = json.loads(line)
+                        point_id = self._generate_uuid(
+                            data, self.unique_identifiers, self.collection_name) if self.unique_identifiers else uuid.uuid4()
+                        embedding_doc = self._get_embedding_doc(data)
+                        payloads.append(data)
+                        ids.append(point_id)
+                        docs.append(embedding_doc)
+
+                    embeddings = self._embed_documents(embedding_model, docs, embedding_cache)
+                    assert len(embeddings) == len(payloads) == len(ids)
+
+                    if upload is not None:
+                        upload.result()
+                    # named vectors are passed as numpy array without conversion to lists
+                    upload = upload_pool.submit(
+                        self._upload_data, vectors={vector_name: embeddings}, ids=ids, payloads=payloads)
+                if upload is not None:
+                    upload.result()
+
+    def _embed_documents(self, embedding_model: Any, docs: List[str], embedding_cache: Optional[EmbeddingCache]) -> np.ndarray:
+        """Embeds `docs` with `embedding_model`. Documents found in `embedding_cache` are not embedded again.
+
+        Args:
+            embedding_model (Any): A fastembed model.
+            docs (List[str]): Documents to embed.
+            embedding_cache (Optional[EmbeddingCache]): A cache of embeddings or None if cache is disabled.
 
-            self._upload_data(vectors=embeddings, ids=ids, payloads=payloads)
+        Returns:
+            np.ndarray: An array with embedding of each document in a row.
+        """
+        if embedding_cache is None:
+            return np.stack(list(embedding_model.embed(
+                docs, batch_size=self.config.embedding_batch_size, parallel=self.config.embedding_parallelism)))
+
+        embeddings = embedding_cache.get(docs)
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if missing:
+            missing_docs = [docs[i] for i in missing]
+            missing_embeddings = list(embedding_model.embed(
+                missing_docs, batch_size=self.config.embedding_batch_size, parallel=self.config.embedding_parallelism))
+            embedding_cache.put(missing_docs, missing_embeddings)
+            for i, embedding in zip(missing, missing_embeddings):
+                embeddings[i] = embedding
+        return np.stack(embeddings)
 
     def _get_embedding_doc(self, data: Dict[str, Any]) -> str:
         """Returns a document to generate embeddings for.
@@ -23,6 +23,7 @@ class SnowflakeSqlClient(SqlClientBase[snowflake_lib.SnowflakeConnection], DBTra
 
     dbapi: ClassVar[DBApi] = snowflake_lib
     capabilities: ClassVar[DestinationCapabilitiesContext] = capabilities()
+    supports_connection_pooling: ClassVar[bool] = True
 
     def __init__(self, dataset_name: str, credentials: SnowflakeCredentials) -> None:
         super().__init__(credentials.database, dataset_name)
@@ -47,6 +48,17 @@ class SnowflakeSqlClient(SqlClientBase[snowflake_lib.SnowflakeConnection], DBTra
             self._conn.close()
             self._conn = None
 
+    def attach_native_connection(self, native_connection: snowflake_lib.SnowflakeConnection) -> None:
+        self._conn = native_connection
+
+    def detach_native_connection(self) -> Optional[snowflake_lib.SnowflakeConnection]:
+        native_connection, self._conn = self._conn, None
+        return native_connection
+
+    def is_connection_alive(self) -> bool:
+        # does not query the server
+        return not self._conn.is_closed()
+
     @contextmanager
     def begin_transaction(self) -> Iterator[DBTransaction]:
         try:
@@ -2,9 +2,11 @@ from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from functools import wraps
 import inspect
+import threading
 from types import TracebackType
-from typing import Any, ClassVar, ContextManager, Generic, Iterator, Optional, Sequence, Tuple, Type, AnyStr, List
+from typing import Any, ClassVar, ContextManager, Dict, Generic, Hashable, Iterator, Optional, Sequence, Tuple, Type, AnyStr, List
 
+from dlt.common import logger
 from dlt.common.typing import TFun
 from dlt.common.destination import DestinationCapabilitiesContext
 
@@ -16,12 +18,15 @@ class SqlClientBase(ABC, Generic[TNativeConn]):
 
     dbapi: ClassVar[DBApi] = None
     capabilities: ClassVar[DestinationCapabilitiesContext] = None
+    supports_connection_pooling: ClassVar[bool] = False
+    """Client implements `attach_native_connection` and `detach_native_connection` so its connections may be kept in `SqlConnectionPool`"""
 
     def __init__(self, database_name: str, dataset_name: str) -> None:
         if not dataset_name:
             raise ValueError(dataset_name)
         self.dataset_name = dataset_name
         self.database_name = database_name
+        self.connection_pool: "SqlConnectionPool" = None
 
     @abstractmethod
     def open_connection(self) -> TNativeConn:
@@ -42,12 +47,48 @@ class SqlClientBase(ABC, Generic[TNativeConn]):
         return getattr(self.native_connection, name)
 
     def __enter__(self) -> "SqlClientBase[TNativeConn]":
-        self.open_connection()
+        self.acquire_connection()
         return self
 
     def __exit__(self, exc_type: Type[BaseException], exc_val: BaseException, exc_tb: TracebackType) -> None:
+        self.release_connection()
+
+    def acquire_connection(self) -> TNativeConn:
+        """Takes an open connection from the `connection_pool` if set or opens a new connection"""
+        if self.connection_pool is not None and self.supports_connection_pooling and self.connection_pool.acquire(self):
+            return self.native_connection
+        return self.open_connection()
+
+    def release_connection(self) -> None:
+        """Returns the connection to the `connection_pool` if set so other clients can reuse it, otherwise closes the connection"""
+        if self.connection_pool is not None and self.supports_connection_pooling and self.connection_pool.release(self):
+            return
         self.close_connection()
 
+    def attach_native_connection(self, native_connection: TNativeConn) -> None:
+        """Uses open `native_connection` taken from the connection pool"""
+        raise NotImplementedError()
+
+    def detach_native_connection(self) -> Optional[TNativeConn]:
+        """Disconnects the client from its native connection without closing it so it may be put into the connection pool. Returns None if connection cannot be reused."""
+        raise NotImplementedError()
+
+    def close_native_connection(self, native_connection: TNativeConn) -> None:
+        """Closes idle `native_connection` kept in the connection pool. Does not change the connection used by the client"""
+        native_connection.close()  # type: ignore[attr-defined]
+
+    def is_connection_alive(self) -> bool:
+        """Checks if native connection taken from the connection pool can still be used. Runs a query by default, clients should check a flag of the driver where it exists"""
+        try:
+            self.execute_sql("SELECT 1;")
+            return True
+        except Exception:
+            return False
+
+    def connection_pool_key(self) -> Hashable:
+        """Clients with the same key may exchange connections"""
+        return (type(self), self.fully_qualified_dataset_name(escape=False), repr(getattr(self, "credentials", None)))
+
     @property
     @abstractmethod
     def native_connection(self) -> TNativeConn:
@@ -154,6 +195,66 @@ SELECT 1
             return f"DELETE FROM {qualified_table_name} WHERE 1=1;"
 
 
+class SqlConnectionPool:
+    """Keeps native connections of sql clients open so they are reused across load jobs instead of being opened for each job.
+
+    Connections are exchanged only between clients with the same `connection_pool_key` and are health checked before being reused. All idle connections are
+    closed with `close`. The pool is thread safe, a connection is used by a single client at a time.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._idle: Dict[Hashable, List[Tuple[SqlClientBase[Any], Any]]] = {}
+        self._closed = False
+
+    def acquire(self, client: SqlClientBase[Any]) -> bool:
+        """Attaches an idle, healthy connection to `client`. Returns False if there's no such connection"""
+        key = client.connection_pool_key()
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                if not idle:
+                    return False
+                _, native_connection = idle.pop()
+            client.attach_native_connection(native_connection)
+            if client.is_connection_alive():
+                return True
+            logger.info(f"Pooled connection of {type(client).__name__} for {client.dataset_name} is broken and will be closed")
+            client.detach_native_connection()
+            self._close_native_connection(client, native_connection)
+
+    def release(self, client: SqlClientBase[Any]) -> bool:
+        """Takes the connection from `client` to be reused. Returns False if connection cannot be reused and must be closed by the client"""
+        if not client.native_connection:
+            return False
+        key = client.connection_pool_key()
+        with self._lock:
+            if self._closed:
+                return False
+            native_connection = client.detach_native_connection()
+            if native_connection is None:
+                return False
+            self._idle.setdefault(key, []).append((client, native_connection))
+        return True
+
+    def close(self) -> None:
+        """Closes all idle connections. Connections released afterwards are closed by the clients"""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for client, native_connection in connections:
+                # client that released the connection may be using another one now so it is not touched
+                self._close_native_connection(client, native_connection)
+
+    @staticmethod
+    def _close_native_connection(client: SqlClientBase[Any], native_connection: Any) -> None:
+        try:
+            client.close_native_connection(native_connection)
+        except Exception:
+            logger.exception(f"Could not close pooled connection of {type(client).__name__}")
+
+
 class DBApiCursorImpl(DBApiCursor):
     """A DBApi Cursor wrapper with dataframes reading functionality"""
     def __init__(self, curr: DBApiCursor) -> None:
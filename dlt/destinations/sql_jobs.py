@@ -4,7 +4,7 @@ import yaml
 from dlt.common.runtime.logger import pretty_format_exception
 
 from dlt.common.schema.typing import TTableSchema
-from dlt.common.schema.utils import get_columns_names_with_prop
+from dlt.common.schema.utils import get_columns_names_with_prop, get_merge_strategy
 from dlt.common.storages.load_storage import ParsedLoadJobFileName
 from dlt.common.utils import uniq_id
 from dlt.destinations.exceptions import MergeDispositionException
@@ -80,7 +80,11 @@ class SqlMergeJob(SqlBaseJob):
 
         First we store the root_keys of root table elements to be deleted in the temp table. Then we use the temp table to delete records from root and all child tables in the destination dataset.
         At the end we copy the data from the staging dataset into destination dataset.
+
+        If the root table has the "upsert" `merge_strategy` hint, the root table is merged on primary key with `MERGE` statement (or `UPDATE` followed by `INSERT`) instead, see `gen_upsert_sql`.
         """
+        if get_merge_strategy({table["name"]: table for table in table_chain}, table_chain[0]["name"]) == "upsert":
+            return cls.gen_upsert_sql(table_chain, sql_client)
         return cls.gen_merge_sql(table_chain, sql_client)
 
     @classmethod
@@ -128,6 +132,32 @@ class SqlMergeJob(SqlBaseJob):
         """
         return [cls._to_temp_table(select_statement, temp_table_name)], temp_table_name
 
+    @classmethod
+    def gen_upsert_root_sql(cls, root_table_name: str, source_sql: str, columns: Sequence[str], primary_keys: Sequence[str], key_clause: str, sql_client: SqlClientBase[Any]) -> List[str]:
+        """Generate sql that updates rows in root table matching the rows selected by `source_sql` on primary key and inserts the rest.
+
+           Uses `MERGE` statement if destination supports it, otherwise `UPDATE ... FROM` followed by `INSERT ... WHERE NOT EXISTS`
+        """
+        sql: List[str] = []
+        key_clause = key_clause.format(d="d", s="s")
+        columns_str = ", ".join(columns)
+        # primary key columns are matched so they do not need to be updated
+        update_str = ", ".join(f"{c} = s.{c}" for c in columns if c not in primary_keys)
+        if sql_client.capabilities.supports_merge_statement:
+            merge_sql = f"MERGE INTO {root_table_name} AS d USING ({source_sql}) AS s ON {key_clause}"
+            if update_str:
+                merge_sql += f" WHEN MATCHED THEN UPDATE SET {update_str}"
+            values_str = ", ".join(f"s.{c}" for c in columns)
+            sql.append(f"{merge_sql} WHEN NOT MATCHED THEN INSERT ({columns_str}) VALUES ({values_str});")
+        else:
+            if update_str:
+                sql.append(f"UPDATE {root_table_name} AS d SET {update_str} FROM ({source_sql}) AS s WHERE {key_clause};")
+            sql.append(
+                f"INSERT INTO {root_table_name}({columns_str}) SELECT {columns_str} FROM ({source_sql}) AS s "
+                f"WHERE NOT EXISTS (SELECT 1 FROM {root_table_name} AS d WHERE {key_clause});"
+            )
+        return sql
+
     @classmethod
     def _new_temp_table_name(cls, name_prefix: str) -> str:
         return f"{name_prefix}_{uniq_id()}"
@@ -229,4 +259,86 @@ class SqlMergeJob(SqlBaseJob):
             sql.append(insert_sql)
             # -- DELETE FROM {staging_table_name} WHERE 1=1;
 
-        return sql
\ No newline at end of file
+        return sql
+
+    @classmethod
+    def gen_upsert_sql(cls, table_chain: Sequence[TTableSchema], sql_client: SqlClientBase[Any]) -> List[str]:
+        """Generates sql for "upsert" merge strategy. Root table rows are updated or inserted on primary key, staging data is deduplicated on primary key.
+
+        Updated root rows take `unique` column (ie _dlt_id) from the staging dataset. The `unique` identifiers of the root rows matching the staging data
+        are stored in the temp table before the update and used to delete the child rows of the replaced records before the new child rows are copied from the staging dataset.
+        """
+        sql: List[str] = []
+        root_table = table_chain[0]
+
+        root_table_name = sql_client.make_qualified_table_name(root_table["name"])
+        with sql_client.with_staging_dataset(staging=True):
+            staging_root_table_name = sql_client.make_qualified_table_name(root_table["name"])
+        primary_keys = list(map(sql_client.capabilities.escape_identifier, get_columns_names_with_prop(root_table, "primary_key")))
+        if not primary_keys:
+            raise MergeDispositionException(
+                sql_client.fully_qualified_dataset_name(),
+                staging_root_table_name,
+                [t["name"] for t in table_chain],
+                f"There is no primary key in top table {root_table['name']} which is required by upsert merge strategy."
+            )
+        if get_columns_names_with_prop(root_table, "merge_key"):
+            raise MergeDispositionException(
+                sql_client.fully_qualified_dataset_name(),
+                staging_root_table_name,
+                [t["name"] for t in table_chain],
+                f"Merge key is defined in top table {root_table['name']} but upsert merge strategy supports only primary key. Use delete-insert merge strategy instead."
+            )
+        key_clause = cls._gen_key_table_clauses(primary_keys, [])[0]
+        columns = list(map(sql_client.capabilities.escape_identifier, get_columns_names_with_prop(root_table, "name")))
+        columns_str = ", ".join(columns)
+
+        if len(table_chain) == 1:
+            # deduplicate staging data on primary key
+            source_sql = f"""SELECT {columns_str} FROM (
+                    SELECT ROW_NUMBER() OVER (partition BY {", ".join(primary_keys)} ORDER BY (SELECT NULL)) AS _dlt_dedup_rn, {columns_str}
+                    FROM {staging_root_table_name}
+                ) AS _dlt_dedup_numbered WHERE _dlt_dedup_rn = 1"""
+            sql.extend(cls.gen_upsert_root_sql(root_table_name, source_sql, columns, primary_keys, key_clause, sql_client))
+            return sql
+
+        unique_columns = get_columns_names_with_prop(root_table, "unique")
+        if not unique_columns:
+            raise MergeDispositionException(
+                sql_client.fully_qualified_dataset_name(),
+                staging_root_table_name,
+                [t["name"] for t in table_chain],
+                f"There is no unique column (ie _dlt_id) in top table {root_table['name']} so it is not possible to link child tables to it."
+            )
+        unique_column = sql_client.capabilities.escape_identifier(unique_columns[0])
+        # store identifiers of the root rows that will be updated, their child rows are replaced
+        key_table_clauses = cls.gen_key_table_clauses(root_table_name, staging_root_table_name, [key_clause], for_delete=False)
+        create_delete_temp_table_sql, delete_temp_table_name = cls.gen_delete_temp_table_sql(unique_column, key_table_clauses)
+        sql.extend(create_delete_temp_table_sql)
+        # deduplicated rows are selected once so root and child tables receive the same records
+        create_insert_temp_table_sql, insert_temp_table_name = cls.gen_insert_temp_table_sql(staging_root_table_name, primary_keys, unique_column)
+        sql.extend(create_insert_temp_table_sql)
+        source_sql = f"SELECT {columns_str} FROM {staging_root_table_name} WHERE {unique_column} IN (SELECT * FROM {insert_temp_table_name})"
+        sql.extend(cls.gen_upsert_root_sql(root_table_name, source_sql, columns, primary_keys, key_clause, sql_client))
+
+        for table in table_chain[1:]:
+            table_name = sql_client.make_qualified_table_name(table["name"])
+            with sql_client.with_staging_dataset(staging=True):
+                staging_table_name = sql_client.make_qualified_table_name(table["name"])
+            root_key_columns = get_columns_names_with_prop(table, "root_key")
+            if not root_key_columns:
+                raise MergeDispositionException(
+                    sql_client.fully_qualified_dataset_name(),
+                    staging_root_table_name,
+                    [t["name"] for t in table_chain],
+                    f"There is no root foreign key (ie _dlt_root_id) in child table {table['name']} so it is not possible to refer to top level table {root_table['name']} unique column {unique_column}"
+                )
+            root_key_column = sql_client.capabilities.escape_identifier(root_key_columns[0])
+            # remove child rows of the updated records, their root rows got new unique identifiers
+            sql.append(f"DELETE FROM {table_name} WHERE {root_key_column} IN (SELECT * FROM {delete_temp_table_name});")
+            columns_str = ", ".join(map(sql_client.capabilities.escape_identifier, get_columns_names_with_prop(table, "name")))
+            sql.append(
+                f"INSERT INTO {table_name}({columns_str}) SELECT {columns_str} FROM {staging_table_name} "
+                f"WHERE {root_key_column} IN (SELECT * FROM {insert_temp_table_name});"
+            )
+        return sql
@@ -1,4 +1,6 @@
-from functools import wraps
+import hashlib
+import uuid as uuid_lib
+from functools import lru_cache, wraps
 from types import TracebackType
 from typing import (
     ClassVar,
@@ -22,7 +24,6 @@ from dlt.common.exceptions import (
 
 import weaviate
 from weaviate.gql.get import GetBuilder
-from weaviate.util import generate_uuid5
 
 from dlt.common import json, pendulum, logger
 from dlt.common.typing import StrAny, TFun
@@ -86,6 +87,18 @@ class WeaviateTypeMapper(TypeMapper):
     }
 
 
+@lru_cache(maxsize=None)
+def _uuid5_namespace_hash(namespace: str) -> Any:
+    return hashlib.sha1(uuid_lib.NAMESPACE_DNS.bytes + namespace.encode("utf-8"))
+
+
+def generate_uuid5(identifier: str, namespace: str) -> str:
+    """Generates the same uuid as `weaviate.util.generate_uuid5` but hashes the `namespace` only once"""
+    uuid_hash = _uuid5_namespace_hash(namespace).copy()
+    uuid_hash.update(identifier.encode("utf-8"))
+    return str(uuid_lib.UUID(bytes=uuid_hash.digest()[:16], version=5))
+
+
 def wrap_weaviate_error(f: TFun) -> TFun:
     @wraps(f)
     def _wrap(self: JobClientBase, *args: Any, **kwargs: Any) -> Any:
@@ -159,21 +172,23 @@ class LoadWeaviateJob(LoadJob):
         self.table_name = table_schema["name"]
         self.class_name = class_name
         self.unique_identifiers = self.list_unique_identifiers(table_schema)
+        table_columns = schema.get_table_columns(self.table_name)
         self.complex_indices = [
             i
-            for i, field in schema.get_table_columns(self.table_name).items()
+            for i, field in table_columns.items()
             if field["data_type"] == "complex"
         ]
         self.date_indices = [
             i
-            for i, field in schema.get_table_columns(self.table_name).items()
+            for i, field in table_columns.items()
             if field["data_type"] == "date"
         ]
-        with FileStorage.open_zipsafe_ro(local_path) as f:
+        # parse lines as bytes, without decoding them to str first
+        with FileStorage.open_zipsafe_ro(local_path, "rb") as f:
             self.load_batch(f)
 
     @wrap_weaviate_error
-    def load_batch(self, f: IO[str]) -> None:
+    def load_batch(self, f: IO[bytes]) -> None:
         """Load all the lines from stream `f` in automatic Weaviate batches.
         Weaviate batch supports retries so we do not need to do that.
         """
@@ -201,7 +216,7 @@ class LoadWeaviateJob(LoadJob):
             callback=check_batch_result,
         ) as batch:
             for line in f:
-                data = json.loads(line)
+                data = json.loadb(line)
                 # make complex to strings
                 for key in self.complex_indices:
                     if key in data:
@@ -229,7 +244,7 @@ class LoadWeaviateJob(LoadJob):
         self, data: Dict[str, Any], unique_identifiers: Sequence[str], class_name: str
     ) -> str:
         data_id = "_".join([str(data[key]) for key in unique_identifiers])
-        return generate_uuid5(data_id, class_name)  # type: ignore
+        return generate_uuid5(data_id, class_name)
 
     def state(self) -> TLoadJobState:
         return "completed"
@@ -15,7 +15,7 @@ from dlt.common.exceptions import ArgumentsOverloadException
 from dlt.common.pipeline import PipelineContext
 from dlt.common.source import _SOURCES, SourceInfo
 from dlt.common.schema.schema import Schema
-from dlt.common.schema.typing import TColumnNames, TTableSchemaColumns, TWriteDisposition, TAnySchemaColumns, TTableFormat
+from dlt.common.schema.typing import TColumnNames, TTableSchemaColumns, TWriteDisposition, TAnySchemaColumns, TTableFormat, TMergeStrategy
 from dlt.extract.utils import ensure_table_schema_columns_hint, simulate_func_call, wrap_compat_transformer, wrap_resource_gen
 from dlt.common.storages.exceptions import SchemaNotFoundError
 from dlt.common.storages.schema_storage import SchemaStorage
@@ -207,6 +207,7 @@ def resource(
     primary_key: TTableHintTemplate[TColumnNames] = None,
     merge_key: TTableHintTemplate[TColumnNames] = None,
     table_format: TTableHintTemplate[TTableFormat] = None,
+    merge_strategy: TTableHintTemplate[TMergeStrategy] = None,
     selected: bool = True,
     spec: Type[BaseConfiguration] = None
 ) -> DltResource:
@@ -223,6 +224,7 @@ def resource(
     primary_key: TTableHintTemplate[TColumnNames] = None,
     merge_key: TTableHintTemplate[TColumnNames] = None,
     table_format: TTableHintTemplate[TTableFormat] = None,
+    merge_strategy: TTableHintTemplate[TMergeStrategy] = None,
     selected: bool = True,
     spec: Type[BaseConfiguration] = None
 ) -> Callable[[Callable[TResourceFunParams, Any]], DltResource]:
@@ -239,6 +241,7 @@ def resource(
     primary_key: TTableHintTemplate[TColumnNames] = None,
     merge_key: TTableHintTemplate[TColumnNames] = None,
     table_format: TTableHintTemplate[TTableFormat] = None,
+    merge_strategy: TTableHintTemplate[TMergeStrategy] = None,
     selected: bool = True,
     spec: Type[BaseConfiguration] = None,
     standalone: Literal[True] = True
@@ -257,6 +260,7 @@ def resource(
     primary_key: TTableHintTemplate[TColumnNames] = None,
     merge_key: TTableHintTemplate[TColumnNames] = None,
     table_format: TTableHintTemplate[TTableFormat] = None,
+    merge_strategy: TTableHintTemplate[TMergeStrategy] = None,
     selected: bool = True,
     spec: Type[BaseConfiguration] = None
 ) -> DltResource:
@@ -273,6 +277,7 @@ def resource(
     primary_key: TTableHintTemplate[TColumnNames] = None,
     merge_key: TTableHintTemplate[TColumnNames] = None,
     table_format: TTableHintTemplate[TTableFormat] = None,
+    merge_strategy: TTableHintTemplate[TMergeStrategy] = None,
     selected: bool = True,
     spec: Type[BaseConfiguration] = None,
     standalone: bool = False,
@@ -324,6 +329,8 @@ def resource(
 
         table_format (Literal["iceberg"], optional): Defines the storage format of the table. Currently only "iceberg" is supported on Athena, other destinations ignore this hint.
 
+        merge_strategy (Literal["delete-insert", "upsert"], optional): Selects how the "merge" write disposition is executed on sql destinations. "delete-insert" (the default) deletes the existing records that match the loaded data and inserts all the new records. "upsert" updates the matching rows and inserts the missing ones using `MERGE` (or `UPDATE` + `INSERT` where not supported) and requires a `primary_key`.
+
         selected (bool, optional): When `True` `dlt pipeline` will extract and load this resource, if `False`, the resource will be ignored.
 
         spec (Type[BaseConfiguration], optional): A specification of configuration and secret values required by the source.
@@ -346,7 +353,8 @@ def resource(
             columns=columns,
             primary_key=primary_key,
             merge_key=merge_key,
-            table_format=table_format
+            table_format=table_format,
+            merge_strategy=merge_strategy
         )
         return DltResource.from_data(_data, _name, _section, table_template, selected, cast(DltResource, data_from), incremental=incremental)
 
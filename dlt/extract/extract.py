@@ -1,8 +1,11 @@
 import contextlib
 import os
-from typing import ClassVar, List, Set, Dict, Type, Any, Sequence, Optional
+import time
+from typing import TYPE_CHECKING, Callable, ClassVar, List, Set, Dict, Type, Any, Sequence, Optional
 from collections import defaultdict
 
+from dlt.common.configuration import configspec, with_config
+from dlt.common.configuration.accessors import config
 from dlt.common.configuration.container import Container
 from dlt.common.configuration.resolve import inject_section
 from dlt.common.configuration.specs.config_section_context import ConfigSectionContext
@@ -17,7 +20,7 @@ from dlt.common.typing import TDataItems, TDataItem
 from dlt.common.schema import Schema, utils, TSchemaUpdate
 from dlt.common.schema.typing import TColumnSchema, TTableSchemaColumns
 from dlt.common.storages import NormalizeStorageConfiguration, NormalizeStorage, DataItemStorage, FileStorage
-from dlt.common.configuration.specs import known_sections
+from dlt.common.configuration.specs import BaseConfiguration, known_sections
 
 from dlt.extract.decorators import SourceSchemaInjectableContext
 from dlt.extract.exceptions import DataItemRequiredForDynamicTableHints
@@ -57,20 +60,45 @@ class JsonLExtractorStorage(ExtractorItemStorage):
     load_file_type: TLoaderFileFormat = "puae-jsonl"
 
 
+class MsgpackExtractorStorage(ExtractorItemStorage):
+    load_file_type: TLoaderFileFormat = "msgpack"
+
+
 class ArrowExtractorStorage(ExtractorItemStorage):
     load_file_type: TLoaderFileFormat = "arrow"
 
 
+@configspec
+class ExtractorStorageConfiguration(BaseConfiguration):
+    object_file_format: TLoaderFileFormat = "puae-jsonl"
+    """Intermediate file format for python objects: `puae-jsonl` or binary `msgpack` which requires `msgpack` package"""
+
+    if TYPE_CHECKING:
+        def __init__(self, object_file_format: TLoaderFileFormat = None) -> None:
+            ...
+
+
 class ExtractorStorage(NormalizeStorage):
     EXTRACT_FOLDER: ClassVar[str] = "extract"
+    OBJECT_FILE_FORMATS: ClassVar[Set[TLoaderFileFormat]] = {"puae-jsonl", "msgpack"}
+    VOLUME_CHECK_INTERVAL: ClassVar[float] = 1.0
+    """Minimum interval in seconds between the calls to `volume_check` while items are extracted"""
 
     """Wrapper around multiple extractor storages with different file formats"""
-    def __init__(self, C: NormalizeStorageConfiguration) -> None:
+    @with_config(spec=ExtractorStorageConfiguration, sections=(known_sections.EXTRACT,))
+    def __init__(self, C: NormalizeStorageConfiguration, config: ExtractorStorageConfiguration = config.value) -> None:
         super().__init__(True, C)
+        if config.object_file_format not in self.OBJECT_FILE_FORMATS:
+            raise ValueError(config.object_file_format)
+        self.object_file_format = config.object_file_format
         self._item_storages: Dict[TLoaderFileFormat, ExtractorItemStorage] = {
             "puae-jsonl": JsonLExtractorStorage(self.storage, extract_folder=self.EXTRACT_FOLDER),
+            "msgpack": MsgpackExtractorStorage(self.storage, extract_folder=self.EXTRACT_FOLDER),
             "arrow": ArrowExtractorStorage(self.storage, extract_folder=self.EXTRACT_FOLDER)
         }
+        self.volume_check: Callable[[], None] = None
+        """Called periodically while items are extracted, may switch the storage to another volume with `switch_volume`"""
+        self._next_volume_check = time.monotonic() + self.VOLUME_CHECK_INTERVAL
 
     def _get_extract_path(self, extract_id: str) -> str:
         return os.path.join(self.EXTRACT_FOLDER, extract_id)
@@ -103,6 +131,27 @@ class ExtractorStorage(NormalizeStorage):
     def write_data_item(self, file_format: TLoaderFileFormat, load_id: str, schema_name: str, table_name: str, item: TDataItems, columns: TTableSchemaColumns) -> None:
         self.get_storage(file_format).write_data_item(load_id, schema_name, table_name, item, columns)
 
+    def check_volume(self) -> None:
+        """Calls `volume_check` if set and at least `VOLUME_CHECK_INTERVAL` passed since the last call"""
+        if self.volume_check and (now := time.monotonic()) >= self._next_volume_check:
+            self._next_volume_check = now + self.VOLUME_CHECK_INTERVAL
+            self.volume_check()
+
+    def switch_volume(self, C: NormalizeStorageConfiguration) -> None:
+        """Closes all open writers and writes the next extracted files into the normalize volume configured in `C`.
+
+           Files extracted so far stay in the current volume and must be moved to the new volume before they are committed.
+        """
+        for item_storage in self._item_storages.values():
+            for writer in item_storage.buffered_writers.values():
+                if not writer.closed:
+                    writer.close()
+            item_storage.buffered_writers.clear()
+        volume = NormalizeStorage(True, C)
+        self.storage, self.config = volume.storage, volume.config
+        for item_storage in self._item_storages.values():
+            item_storage.storage = self.storage
+
 
 
 class Extractor:
@@ -202,6 +251,11 @@ class Extractor:
 class JsonLExtractor(Extractor):
     file_format = "puae-jsonl"
 
+    @property
+    def storage(self) -> ExtractorItemStorage:
+        # python objects are written in the intermediate format selected in extractor storage
+        return self._storage.get_storage(self._storage.object_file_format)
+
 
 class ArrowExtractor(Extractor):
     file_format = "arrow"
@@ -292,6 +346,7 @@ def extract(
                     collector.update("Resources", delta)
 
                 signals.raise_if_signalled()
+                storage.check_volume()
 
                 resource = source.resources[pipe_item.pipe.name]
                 # Fallback to last item's format or default (puae-jsonl) if the current item is an empty list
@@ -3,7 +3,7 @@ from collections.abc import Mapping as C_Mapping
 from typing import List, TypedDict, cast, Any
 
 from dlt.common.schema.utils import DEFAULT_WRITE_DISPOSITION, merge_columns, new_column, new_table
-from dlt.common.schema.typing import TColumnNames, TColumnProp, TColumnSchema, TPartialTableSchema, TTableSchemaColumns, TWriteDisposition, TAnySchemaColumns, TTableFormat
+from dlt.common.schema.typing import TColumnNames, TColumnProp, TColumnSchema, TPartialTableSchema, TTableSchemaColumns, TWriteDisposition, TAnySchemaColumns, TTableFormat, TMergeStrategy
 from dlt.common.typing import TDataItem
 from dlt.common.utils import update_dict_nested
 from dlt.common.validation import validate_dict_ignoring_xkeys
@@ -105,7 +105,8 @@ class DltResourceSchema:
         columns: TTableHintTemplate[TAnySchemaColumns] = None,
         primary_key: TTableHintTemplate[TColumnNames] = None,
         merge_key: TTableHintTemplate[TColumnNames] = None,
-        incremental: Incremental[Any] = None
+        incremental: Incremental[Any] = None,
+        merge_strategy: TTableHintTemplate[TMergeStrategy] = None
     ) -> None:
         """Creates or modifies existing table schema by setting provided hints. Accepts both static and dynamic hints based on data.
 
@@ -115,6 +116,7 @@ class DltResourceSchema:
 
            parent_table_name (str, optional): A name of parent table if foreign relation is defined. Please note that if you use merge you must define `root_key` columns explicitly
            incremental (Incremental, optional): Enables the incremental loading for a resource.
+           merge_strategy (Literal["delete-insert", "upsert"], optional): Selects how the "merge" write disposition is executed on sql destinations.
 
            Please note that for efficient incremental loading, the resource must be aware of the Incremental by accepting it as one if its arguments and then using is to skip already loaded data.
            In non-aware resources, `dlt` will filter out the loaded values, however the resource will yield all the values again.
@@ -122,7 +124,7 @@ class DltResourceSchema:
         t = None
         if not self._table_schema_template:
             # if there's no template yet, create and set new one
-            t = self.new_table_template(table_name, parent_table_name, write_disposition, columns, primary_key, merge_key)
+            t = self.new_table_template(table_name, parent_table_name, write_disposition, columns, primary_key, merge_key, merge_strategy=merge_strategy)
         else:
             # set single hints
             t = deepcopy(self._table_schema_template)
@@ -162,6 +164,11 @@ class DltResourceSchema:
                     t["merge_key"] = merge_key
                 else:
                     t.pop("merge_key", None)
+            if merge_strategy is not None:
+                if merge_strategy:
+                    t["merge_strategy"] = merge_strategy
+                else:
+                    t.pop("merge_strategy", None)
 
         # set properties that cannot be passed to new_table_template
         t["incremental"] = incremental
@@ -219,7 +226,8 @@ class DltResourceSchema:
         columns: TTableHintTemplate[TAnySchemaColumns] = None,
         primary_key: TTableHintTemplate[TColumnNames] = None,
         merge_key: TTableHintTemplate[TColumnNames] = None,
-        table_format: TTableHintTemplate[TTableFormat] = None
+        table_format: TTableHintTemplate[TTableFormat] = None,
+        merge_strategy: TTableHintTemplate[TMergeStrategy] = None
         ) -> TTableSchemaTemplate:
         if columns is not None:
             validator = get_column_validator(columns)
@@ -230,7 +238,7 @@ class DltResourceSchema:
             validator = None
         # create a table schema template where hints can be functions taking TDataItem
         new_template: TTableSchemaTemplate = new_table(
-            table_name, parent_table_name, write_disposition=write_disposition, columns=columns, table_format=table_format  # type: ignore
+            table_name, parent_table_name, write_disposition=write_disposition, columns=columns, table_format=table_format, merge_strategy=merge_strategy  # type: ignore
         )
         if not table_name:
             new_template.pop("name")
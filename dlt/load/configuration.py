@@ -14,6 +14,20 @@ class LoaderConfiguration(PoolRunnerConfiguration):
     """when True, raises on terminally failed jobs immediately"""
     raise_on_max_retries: int = 5
     """When gt 0 will raise when job reaches raise_on_max_retries"""
+    min_retry_delay: float = 1.0
+    """Delay in seconds before the first retry of a job. Delay doubles with each next retry and is randomized by up to a half"""
+    max_retry_delay: float = 60.0
+    """Maximum delay in seconds before a job is retried"""
+    reuse_connections: bool = True
+    """When True, sql destination connections are kept open and reused by subsequent load jobs of a package"""
+    min_poll_interval: float = 0.1
+    """Initial interval in seconds between polls of running jobs, used again as soon as any job changes state"""
+    max_poll_interval: float = 30.0
+    """Polling interval doubles while jobs keep running, up to this many seconds"""
+    max_parallel_packages: int = 1
+    """How many load packages may be loaded concurrently. Only packages that append to tables shared with preceding packages are loaded together"""
+    skip_confirmed_schema_sync: bool = True
+    """When True, the destination dataset is not initialized and its schema is not synced if the package schema version was already confirmed there by this pipeline"""
     _load_storage_config: LoadStorageConfiguration = None
 
     def on_resolved(self) -> None:
@@ -25,6 +39,13 @@ class LoaderConfiguration(PoolRunnerConfiguration):
             pool_type: TPoolType = "thread",
             workers: int = None,
             raise_on_failed_jobs: bool = False,
+            min_retry_delay: float = 1.0,
+            max_retry_delay: float = 60.0,
+            reuse_connections: bool = True,
+            min_poll_interval: float = 0.1,
+            max_poll_interval: float = 30.0,
+            max_parallel_packages: int = 1,
+            skip_confirmed_schema_sync: bool = True,
             _load_storage_config: LoadStorageConfiguration = None
         ) -> None:
             ...
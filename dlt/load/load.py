@@ -2,27 +2,33 @@ import contextlib
 from copy import copy
 from functools import reduce
 import datetime  # noqa: 251
-from typing import Dict, List, Optional, Tuple, Set, Iterator, Iterable, Callable
-from concurrent.futures import Executor
+import random
+import time
+from typing import Dict, List, Optional, Sequence, Tuple, Set, Iterator, Iterable, Callable
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, wait as wait_for_futures, FIRST_COMPLETED
 import os
 
 from dlt.common import sleep, logger
+from dlt.common.runtime import signals
 from dlt.common.configuration import with_config, known_sections
 from dlt.common.configuration.accessors import config
 from dlt.common.pipeline import LoadInfo, SupportsPipeline
-from dlt.common.schema.utils import get_child_tables, get_top_level_table
-from dlt.common.storages.load_storage import LoadPackageInfo, ParsedLoadJobFileName, TJobState
+from dlt.common.schema.utils import get_child_tables, get_top_level_table, get_write_disposition
+from dlt.common.storages.load_storage import LoadPackageInfo, ParsedLoadJobFileName, TJobState, WORKING_FOLDERS
 from dlt.common.typing import StrAny
+from dlt.common.utils import digest128
 from dlt.common.runners import TRunMetrics, Runnable, workermethod, NullExecutor
 from dlt.common.runtime.collector import Collector, NULL_COLLECTOR
 from dlt.common.runtime.logger import pretty_format_exception
-from dlt.common.exceptions import TerminalValueError, DestinationTerminalException, DestinationTransientException
+from dlt.common.exceptions import TerminalValueError, DestinationTerminalException, DestinationTransientException, DestinationUndefinedEntity
 from dlt.common.schema import Schema, TSchemaTables
 from dlt.common.schema.typing import TTableSchema, TWriteDisposition
-from dlt.common.storages import LoadStorage
+from dlt.common.storages import FileStorage, LoadStorage
 from dlt.common.destination.reference import DestinationClientDwhConfiguration, FollowupJob, JobClientBase, WithStagingDataset, DestinationReference, LoadJob, NewLoadJob, TLoadJobState, DestinationClientConfiguration, SupportsStagingDestination
 
 from dlt.destinations.job_impl import EmptyLoadJob
+from dlt.destinations.job_client_impl import SqlJobClientBase
+from dlt.destinations.sql_client import SqlConnectionPool
 
 from dlt.load.configuration import LoaderConfiguration
 from dlt.load.exceptions import LoadClientJobFailed, LoadClientJobRetry, LoadClientUnsupportedWriteDisposition, LoadClientUnsupportedFileFormats
@@ -50,9 +56,17 @@ class Load(Runnable[Executor]):
         self.capabilities = destination.capabilities()
         self.staging_destination = staging_destination
         self.pool = NullExecutor()
+        self.connection_pool: SqlConnectionPool = None
+        """Keeps sql connections open across the jobs of packages being loaded"""
         self.load_storage: LoadStorage = self.create_storage(is_storage_owner)
         self._processed_load_ids: Dict[str, str] = {}
         """Load ids to dataset name"""
+        self._polls_jobs_in_batch: Dict[bool, bool] = {}
+        """Tells if the destination (False) or staging destination (True) client overrides `poll_jobs`"""
+        self._schema_sync_skipped: Set[str] = set()
+        """Load ids of packages that skipped the schema sync because their schema was confirmed at the destination"""
+        self._schema_resync_jobs: Dict[str, Set[str]] = {}
+        """Spool ids of jobs that found missing tables or datasets, per load id of package that must sync its schema again"""
 
 
     def create_storage(self, is_storage_owner: bool) -> LoadStorage:
@@ -70,10 +84,15 @@ class Load(Runnable[Executor]):
         return load_storage
 
     def get_destination_client(self, schema: Schema) -> JobClientBase:
-        return self.destination.client(schema, self.initial_client_config)
+        return self._with_connection_pool(self.destination.client(schema, self.initial_client_config))
 
     def get_staging_destination_client(self, schema: Schema) -> JobClientBase:
-        return self.staging_destination.client(schema, self.initial_staging_client_config)
+        return self._with_connection_pool(self.staging_destination.client(schema, self.initial_staging_client_config))
+
+    def _with_connection_pool(self, job_client: JobClientBase) -> JobClientBase:
+        if self.connection_pool is not None and isinstance(job_client, SqlJobClientBase):
+            job_client.sql_client.connection_pool = self.connection_pool
+        return job_client
 
     def is_staging_destination_job(self, file_path: str) -> bool:
         return self.staging_destination is not None and os.path.splitext(file_path)[1][1:] in self.staging_destination.capabilities().supported_loader_file_formats
@@ -112,6 +131,15 @@ class Load(Runnable[Executor]):
 
                 with self.maybe_with_staging_dataset(client, use_staging_dataset):
                     job = client.start_file_load(table, self.load_storage.storage.make_full_path(file_path), load_id)
+        except DestinationUndefinedEntity:
+            if load_id in self._schema_sync_skipped:
+                # tables or dataset were dropped at the destination after the schema was confirmed, retry after schema sync
+                logger.exception(f"Missing table or dataset when adding job {file_path}, schema will be synced again")
+                self._schema_resync_jobs.setdefault(load_id, set()).add(self._get_spool_id(LoadStorage.parse_job_file_name(file_path)))
+                job = EmptyLoadJob.from_file_path(file_path, "retry", pretty_format_exception())
+            else:
+                logger.exception(f"Terminal problem when adding job {file_path}")
+                job = EmptyLoadJob.from_file_path(file_path, "failed", pretty_format_exception())
         except (DestinationTerminalException, TerminalValueError):
             # if job irreversibly cannot be started, mark it as failed
             logger.exception(f"Terminal problem when adding job {file_path}")
@@ -123,24 +151,48 @@ class Load(Runnable[Executor]):
         self.load_storage.start_job(load_id, job.file_name())
         return job
 
-    def spool_new_jobs(self, load_id: str, schema: Schema) -> Tuple[int, List[LoadJob]]:
-        # TODO: validate file type, combine files, finalize etc., this is client specific, jsonl for single table
-        # can just be combined, insert_values must be finalized and then combined
-        # use thread based pool as jobs processing is mostly I/O and we do not want to pickle jobs
-        # TODO: combine files by providing a list of files pertaining to same table into job, so job must be
-        # extended to accept a list
-        load_files = self.load_storage.list_new_jobs(load_id)[:self.config.workers]
-        file_count = len(load_files)
-        if file_count == 0:
-            logger.info(f"No new jobs found in {load_id}")
-            return 0, []
-        logger.info(f"Will load {file_count}, creating jobs")
-        param_chunk = [(id(self), file, load_id, schema) for file in load_files]
-        # exceptions should not be raised, None as job is a temporary failure
-        # other jobs should not be affected
-        jobs = self.pool.map(Load.w_spool_job, *zip(*param_chunk))
-        # remove None jobs and check the rest
-        return file_count, [job for job in jobs if job is not None]
+    def submit_new_jobs(self, load_id: str, schema: Schema, free_slots: int, spooled_jobs: Set[str]) -> List["Future[LoadJob]"]:
+        """Submits up to `free_slots` new jobs, largest files first, to the pool without waiting for the jobs to start.
+
+           Jobs with ids in `spooled_jobs` were already started in the current run and are skipped, so retried jobs wait for the next run. Ids of submitted jobs are added to `spooled_jobs`
+        """
+        futures: List["Future[LoadJob]"] = []
+        if free_slots <= 0:
+            return futures
+        # retried jobs that are delayed keep waiting while the healthy jobs run
+        for file_path in self.load_storage.list_new_jobs(load_id, largest_first=True, ready_at=time.time()):
+            spool_id = self._get_spool_id(LoadStorage.parse_job_file_name(file_path))
+            if spool_id in spooled_jobs:
+                continue
+            spooled_jobs.add(spool_id)
+            futures.append(self.pool.submit(Load.w_spool_job, id(self), file_path, load_id, schema))
+            if len(futures) == free_slots:
+                break
+        if futures:
+            logger.info(f"Submitted {len(futures)} new jobs for {load_id}")
+        return futures
+
+    def get_retry_delay(self, retry_count: int) -> float:
+        """Returns delay before `retry_count` retry of a job: exponential backoff with jitter that spreads retries of many jobs"""
+        delay = min(self.config.min_retry_delay * 2 ** (retry_count - 1), self.config.max_retry_delay)
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def get_next_retry_at(self, load_id: str, spooled_jobs: Set[str]) -> Optional[float]:
+        """Returns the earliest time at which any of the delayed new jobs of package `load_id` may start, jobs in `spooled_jobs` are skipped"""
+        retry_at: Optional[float] = None
+        for file_path in self.load_storage.list_new_jobs(load_id):
+            file_name = FileStorage.get_file_name_from_file_path(file_path)
+            if self._get_spool_id(LoadStorage.parse_job_file_name(file_name)) in spooled_jobs:
+                continue
+            not_before = self.load_storage.get_job_not_before(load_id, file_name)
+            if not_before is not None and (retry_at is None or not_before < retry_at):
+                retry_at = not_before
+        return retry_at
+
+    @staticmethod
+    def _get_spool_id(job_info: ParsedLoadJobFileName) -> str:
+        # retry count is not part of the id so retried jobs are recognized
+        return f"{job_info.table_name}.{job_info.file_id}"
 
     def retrieve_jobs(self, client: JobClientBase, load_id: str, staging_client: JobClientBase = None) -> Tuple[int, List[LoadJob]]:
         jobs: List[LoadJob] = []
@@ -180,12 +232,12 @@ class Load(Runnable[Executor]):
         table_chain: List[TTableSchema] = []
         # make sure all the jobs for the table chain is completed
         for table in get_child_tables(schema.tables, top_merged_table["name"]):
-            table_jobs = self.load_storage.list_jobs_for_table(load_id, table["name"])
             # all jobs must be completed in order for merge to be created
-            if any(job.state not in ("failed_jobs", "completed_jobs") and job.job_file_info.job_id() != being_completed_job_id for job in table_jobs):
+            if any(self.load_storage.count_jobs_for_table(load_id, table["name"], state, being_completed_job_id) for state in ("new_jobs", "started_jobs")):
                 return None
             # if there are no jobs for the table, skip it, unless the write disposition is replace, as we need to create and clear the child tables
-            if not table_jobs and top_merged_table["write_disposition"] != "replace":
+            has_jobs = any(self.load_storage.count_jobs_for_table(load_id, table["name"], state) for state in WORKING_FOLDERS)
+            if not has_jobs and top_merged_table["write_disposition"] != "replace":
                  continue
             table_chain.append(table)
         # there must be at least table
@@ -199,7 +251,7 @@ class Load(Runnable[Executor]):
             # NOTE: we may move that logic to the interface
             starting_job_file_name = starting_job.file_name()
             if state == "completed" and not self.is_staging_destination_job(starting_job_file_name):
-                client = self.destination.client(schema, self.initial_client_config)
+                client = self.get_destination_client(schema)
                 top_job_table = get_top_level_table(schema.tables, starting_job.job_file_info().table_name)
                 # if all tables of chain completed, create follow  up jobs
                 if table_chain := self.get_completed_table_chain(load_id, schema, top_job_table, starting_job.job_file_info().job_id()):
@@ -208,13 +260,35 @@ class Load(Runnable[Executor]):
             jobs = jobs + starting_job.create_followup_jobs(state)
         return jobs
 
+    def poll_jobs(self, jobs: List[LoadJob], schema: Schema) -> List[TLoadJobState]:
+        """Gets the states of `jobs` in batches, separately for the destination and staging destination jobs"""
+        states: List[TLoadJobState] = [None] * len(jobs)
+        staging_jobs = [ii for ii, job in enumerate(jobs) if self.is_staging_destination_job(job.file_name())]
+        destination_jobs = [ii for ii, job in enumerate(jobs) if not self.is_staging_destination_job(job.file_name())]
+        for indexes, is_staging, get_client in ((destination_jobs, False, self.get_destination_client), (staging_jobs, True, self.get_staging_destination_client)):
+            if not indexes:
+                continue
+            if is_staging not in self._polls_jobs_in_batch:
+                self._polls_jobs_in_batch[is_staging] = type(get_client(schema)).poll_jobs is not JobClientBase.poll_jobs
+            if self._polls_jobs_in_batch[is_staging]:
+                # single client is used for the whole polling round
+                with get_client(schema) as client:
+                    job_states = client.poll_jobs([jobs[ii] for ii in indexes])
+            else:
+                # jobs know their states, no need to open a connection
+                job_states = [jobs[ii].state() for ii in indexes]
+            for ii, state in zip(indexes, job_states):
+                states[ii] = state
+        return states
+
     def complete_jobs(self, load_id: str, jobs: List[LoadJob], schema: Schema) -> List[LoadJob]:
         remaining_jobs: List[LoadJob] = []
         logger.info(f"Will complete {len(jobs)} for {load_id}")
+        states = self.poll_jobs(jobs, schema)
         for ii in range(len(jobs)):
             job = jobs[ii]
-            logger.debug(f"Checking state for job {job.job_id()}")
-            state: TLoadJobState = job.state()
+            state = states[ii]
+            logger.debug(f"Job {job.job_id()} has state {state}")
             if state == "running":
                 # ask again
                 logger.debug(f"job {job.job_id()} still running")
@@ -227,9 +301,10 @@ class Load(Runnable[Executor]):
             elif state == "retry":
                 # try to get exception message from job
                 retry_message = job.exception()
-                # move back to new folder to try again
-                self.load_storage.retry_job(load_id, job.file_name())
-                logger.warning(f"Job for {job.job_id()} retried in load {load_id} with message {retry_message}")
+                # move back to new folder to try again after a delay
+                retry_delay = self.get_retry_delay(job.job_file_info().retry_count + 1)
+                self.load_storage.retry_job(load_id, job.file_name(), time.time() + retry_delay)
+                logger.warning(f"Job for {job.job_id()} retried in load {load_id} in {retry_delay:.1f}s with message {retry_message}")
             elif state == "completed":
                 # create followup jobs
                 followup_jobs = self.create_followup_jobs(load_id, state, job, schema)
@@ -265,6 +340,11 @@ class Load(Runnable[Executor]):
                     self._processed_load_ids[load_id] = job_client.config.normalize_dataset_name(schema)
                 else:
                     self._processed_load_ids[load_id] = None
+        self._schema_sync_skipped.discard(load_id)
+        self._schema_resync_jobs.pop(load_id, None)
+        if aborted or self.load_storage.list_failed_jobs(load_id):
+            # failed jobs may come from a destination that does not match the confirmed schemas
+            self.load_storage.forget_confirmed_schemas()
         self.load_storage.complete_load_package(load_id, aborted)
         logger.info(f"All jobs completed, archiving package {load_id} with aborted set to {aborted}")
 
@@ -285,50 +365,135 @@ class Load(Runnable[Executor]):
                 result.add(table["name"])
         return result
 
-    @staticmethod
-    def _init_dataset_and_update_schema(job_client: JobClientBase, expected_update: TSchemaTables, update_tables: Iterable[str], truncate_tables: Iterable[str] = None, staging_info: bool = False) -> TSchemaTables:
+    def _get_confirmed_schema_key(self, job_client: JobClientBase, staging_info: bool) -> str:
+        """Identifies a destination dataset for which schema version confirmations are kept"""
+        client_config = job_client.config
+        dataset_name = client_config.normalize_dataset_name(job_client.schema) if isinstance(client_config, DestinationClientDwhConfiguration) else ""
+        # credentials are hashed so datasets in different databases or locations do not share confirmations
+        return "|".join([client_config.destination_name, digest128(str(client_config.credentials)), dataset_name, "staging" if staging_info else ""])
+
+    def _init_dataset_and_update_schema(
+        self,
+        job_client: JobClientBase,
+        load_id: str,
+        expected_update: TSchemaTables,
+        update_tables: Iterable[str],
+        confirmed_schemas: Dict[str, str],
+        truncate_tables: Iterable[str] = None,
+        staging_info: bool = False
+    ) -> TSchemaTables:
         staging_text = "for staging dataset" if staging_info else ""
+        version_hash = job_client.schema.stored_version_hash
+        confirmed_key = self._get_confirmed_schema_key(job_client, staging_info)
+        if self.config.skip_confirmed_schema_sync and self.load_storage.get_confirmed_schemas().get(confirmed_key) == version_hash:
+            logger.info(f"Client for {job_client.config.destination_name} skips schema update {staging_text}, schema version {version_hash} was already confirmed")
+            try:
+                if truncate_tables:
+                    logger.info(f"Client for {job_client.config.destination_name} will truncate tables {staging_text}")
+                    job_client.initialize_storage(truncate_tables=truncate_tables)
+                self._schema_sync_skipped.add(load_id)
+                return {}
+            except DestinationUndefinedEntity:
+                logger.warning(f"Client for {job_client.config.destination_name} could not truncate tables {staging_text}, confirmed schema version {version_hash} will be synced again")
         logger.info(f"Client for {job_client.config.destination_name} will start initialize storage {staging_text}")
         job_client.initialize_storage()
         logger.info(f"Client for {job_client.config.destination_name} will update schema to package schema {staging_text}")
         applied_update = job_client.update_stored_schema(only_tables=update_tables, expected_update=expected_update)
         logger.info(f"Client for {job_client.config.destination_name} will truncate tables {staging_text}")
         job_client.initialize_storage(truncate_tables=truncate_tables)
+        confirmed_schemas[confirmed_key] = version_hash
         return applied_update
 
 
-    def _init_client(self, job_client: JobClientBase, schema: Schema, expected_update: TSchemaTables, load_id: str, truncate_filter: Callable[[TTableSchema], bool], truncate_staging_filter: Callable[[TTableSchema], bool]) -> TSchemaTables:
+    def _init_client(
+        self,
+        job_client: JobClientBase,
+        schema: Schema,
+        expected_update: TSchemaTables,
+        load_id: str,
+        truncate_filter: Callable[[TTableSchema], bool],
+        truncate_staging_filter: Callable[[TTableSchema], bool],
+        confirmed_schemas: Dict[str, str],
+        truncate: bool = True
+    ) -> TSchemaTables:
 
         tables_with_jobs = set(job.table_name for job in self.get_new_jobs_info(load_id))
         dlt_tables = set(t["name"] for t in schema.dlt_tables())
 
         # update the default dataset
         truncate_tables = self._get_table_chain_tables_with_filter(schema, truncate_filter, tables_with_jobs)
-        applied_update = self._init_dataset_and_update_schema(job_client, expected_update, tables_with_jobs | dlt_tables, truncate_tables)
+        applied_update = self._init_dataset_and_update_schema(
+            job_client, load_id, expected_update, tables_with_jobs | dlt_tables, confirmed_schemas, truncate_tables if truncate else None
+        )
 
         # update the staging dataset if client supports this
         if isinstance(job_client, WithStagingDataset):
             if staging_tables := self._get_table_chain_tables_with_filter(schema, truncate_staging_filter, tables_with_jobs):
                 with job_client.with_staging_dataset():
-                    self._init_dataset_and_update_schema(job_client, expected_update, staging_tables | {schema.version_table_name}, staging_tables, staging_info=True)
+                    self._init_dataset_and_update_schema(
+                        job_client, load_id, expected_update, staging_tables | {schema.version_table_name}, confirmed_schemas, staging_tables if truncate else None, staging_info=True
+                    )
 
         return applied_update
 
 
     def load_single_package(self, load_id: str, schema: Schema) -> None:
+        self.load_packages([(load_id, schema)])
+
+    def load_packages(self, packages: Sequence[Tuple[str, Schema]]) -> None:
+        """Loads `packages` concurrently. Schema updates of all packages are applied in package order before jobs of any package are started.
+
+           The `workers` are split between the packages that have jobs to run.
+        """
+        if self.config.reuse_connections:
+            self.connection_pool = SqlConnectionPool()
+        try:
+            started_packages: List[Tuple[str, Schema, List[LoadJob]]] = []
+            for load_id, schema in packages:
+                if (jobs := self._init_package(load_id, schema)) is not None:
+                    started_packages.append((load_id, schema, jobs))
+                elif not started_packages:
+                    # packages are completed in load order, a package that follows a started package is completed in the next run
+                    self.complete_package(load_id, schema, False)
+            if not started_packages:
+                return
+            # update counter we only care about the jobs that are scheduled to be loaded
+            total_jobs = no_completed_jobs = no_failed_jobs = 0
+            for load_id, _, _ in started_packages:
+                package_info = self.load_storage.get_load_package_info(load_id)
+                total_jobs += reduce(lambda p, c: p + len(c), package_info.jobs.values(), 0)
+                no_failed_jobs += len(package_info.jobs["failed_jobs"])
+                no_completed_jobs += len(package_info.jobs["completed_jobs"]) + len(package_info.jobs["failed_jobs"])
+            self.collector.update("Jobs", no_completed_jobs, total_jobs)
+            if no_failed_jobs > 0:
+                self.collector.update("Jobs", no_failed_jobs, message="WARNING: Some of the jobs failed!", label="Failed")
+            workers = max(1, self.config.workers // len(started_packages))
+            if len(started_packages) == 1:
+                self._run_package_jobs(*started_packages[0], workers)
+            else:
+                logger.info(f"Will load jobs of {len(started_packages)} packages concurrently with {workers} workers each")
+                with ThreadPoolExecutor(len(started_packages), thread_name_prefix="dlt_load_package") as packages_pool:
+                    futures = [packages_pool.submit(self._run_package_jobs, load_id, schema, jobs, workers) for load_id, schema, jobs in started_packages]
+                # raise the exception of the first failed package
+                for future in futures:
+                    future.result()
+        except Exception:
+            # sync schemas again when the load is retried
+            self.load_storage.forget_confirmed_schemas()
+            raise
+        finally:
+            # close all pooled connections when packages complete or loading is interrupted
+            if self.connection_pool is not None:
+                self.connection_pool.close()
+                self.connection_pool = None
+
+    def _init_package(self, load_id: str, schema: Schema) -> Optional[List[LoadJob]]:
+        """Applies schema update of package `load_id` and retrieves the jobs that were already started. Returns None if package has no jobs left"""
         # initialize analytical storage ie. create dataset required by passed schema
         with self.get_destination_client(schema) as job_client:
 
             if (expected_update := self.load_storage.begin_schema_update(load_id)) is not None:
-
-                # init job client
-                applied_update = self._init_client(job_client, schema, expected_update, load_id, job_client.should_truncate_table_before_load, job_client.should_load_data_to_staging_dataset if isinstance(job_client, WithStagingDataset) else None)
-
-                # init staging client
-                if self.staging_destination and isinstance(job_client, SupportsStagingDestination):
-                    with self.get_staging_destination_client(schema) as staging_client:
-                        self._init_client(staging_client, schema, expected_update, load_id, job_client.should_truncate_table_before_load_on_staging_destination, job_client.should_load_data_to_staging_dataset_on_staging_destination)
-
+                applied_update = self._update_package_schema(job_client, load_id, schema, expected_update)
                 self.load_storage.commit_schema_update(load_id, applied_update)
 
             # initialize staging destination and spool or retrieve unfinished jobs
@@ -338,26 +503,90 @@ class Load(Runnable[Executor]):
             else:
                 jobs_count, jobs = self.retrieve_jobs(job_client, load_id)
 
-        if not jobs:
-            # jobs count is a total number of jobs including those that could not be initialized
-            jobs_count, jobs = self.spool_new_jobs(load_id, schema)
-        # if there are no existing or new jobs we complete the package
-        if jobs_count == 0:
-            self.complete_package(load_id, schema, False)
-            return
-        # update counter we only care about the jobs that are scheduled to be loaded
-        package_info = self.load_storage.get_load_package_info(load_id)
-        total_jobs = reduce(lambda p, c: p + len(c), package_info.jobs.values(), 0)
-        no_failed_jobs = len(package_info.jobs["failed_jobs"])
-        no_completed_jobs = len(package_info.jobs["completed_jobs"]) + no_failed_jobs
-        self.collector.update("Jobs", no_completed_jobs, total_jobs)
-        if no_failed_jobs > 0:
-            self.collector.update("Jobs", no_failed_jobs, message="WARNING: Some of the jobs failed!", label="Failed")
+        # if there are no existing or new jobs the package may be completed
+        if jobs_count == 0 and not self.load_storage.list_new_jobs(load_id):
+            logger.info(f"No new jobs found in {load_id}")
+            return None
+        return jobs
+
+    def _update_package_schema(self, job_client: JobClientBase, load_id: str, schema: Schema, expected_update: TSchemaTables, truncate: bool = True) -> TSchemaTables:
+        """Initializes datasets and updates schema of package `load_id` on the destination and staging destination, confirms the synced schemas.
+
+           Tables are not truncated if `truncate` is not set
+        """
+        # schema versions confirmed at the destination datasets
+        confirmed_schemas: Dict[str, str] = {}
+        # init job client
+        applied_update = self._init_client(
+            job_client,
+            schema,
+            expected_update,
+            load_id,
+            job_client.should_truncate_table_before_load,
+            job_client.should_load_data_to_staging_dataset if isinstance(job_client, WithStagingDataset) else None,
+            confirmed_schemas,
+            truncate
+        )
+
+        # init staging client
+        if self.staging_destination and isinstance(job_client, SupportsStagingDestination):
+            with self.get_staging_destination_client(schema) as staging_client:
+                self._init_client(
+                    staging_client,
+                    schema,
+                    expected_update,
+                    load_id,
+                    job_client.should_truncate_table_before_load_on_staging_destination,
+                    job_client.should_load_data_to_staging_dataset_on_staging_destination,
+                    confirmed_schemas,
+                    truncate
+                )
+
+        self.load_storage.confirm_schemas(confirmed_schemas)
+        return applied_update
+
+    def _resync_package_schema(self, load_id: str, schema: Schema, spooled_jobs: Set[str]) -> None:
+        """Syncs schema of package `load_id` again after its jobs found tables or datasets missing. Jobs retried due to missing entities may start again in this run"""
+        logger.warning(f"Tables or datasets of package {load_id} are missing at the destination, schema will be synced again")
+        self.load_storage.forget_confirmed_schemas()
+        with self.get_destination_client(schema) as job_client:
+            # tables were truncated when package was started and may already hold data of the completed jobs
+            self._update_package_schema(job_client, load_id, schema, {}, truncate=False)
+        self._schema_sync_skipped.discard(load_id)
+        spooled_jobs.difference_update(self._schema_resync_jobs.pop(load_id))
+
+    def _run_package_jobs(self, load_id: str, schema: Schema, jobs: List[LoadJob], workers: int) -> None:
+        """Runs jobs of package `load_id` keeping up to `workers` jobs in flight, `jobs` were already started"""
+        # keep `workers` jobs in flight: a new job is submitted as soon as any job completes
+        pending_jobs: Set["Future[LoadJob]"] = set()
+        # retrieved jobs were started in this run as well
+        spooled_jobs: Set[str] = set(self._get_spool_id(job.job_file_info()) for job in jobs)
+        # poll often while jobs change state, back off while they keep running
+        poll_interval = self.config.min_poll_interval
         # loop until all jobs are processed
         while True:
             try:
-                remaining_jobs = self.complete_jobs(load_id, jobs, schema)
-                if len(remaining_jobs) == 0:
+                # jobs that got started are moved to the completion queue
+                started_futures = [f for f in pending_jobs if f.done()]
+                for future in started_futures:
+                    pending_jobs.remove(future)
+                    if (job := future.result()) is not None:
+                        jobs.append(job)
+                running_jobs = set(job.file_name() for job in jobs)
+                jobs = self.complete_jobs(load_id, jobs, schema)
+                # sync the schema when no new jobs are in flight
+                if load_id in self._schema_resync_jobs and not pending_jobs:
+                    self._resync_package_schema(load_id, schema, spooled_jobs)
+                # do not start new jobs if the package will be aborted or waits for schema sync
+                submitted_futures: List["Future[LoadJob]"] = []
+                if not (self.config.raise_on_failed_jobs and self.load_storage.list_failed_jobs(load_id)) and load_id not in self._schema_resync_jobs:
+                    submitted_futures = self.submit_new_jobs(load_id, schema, workers - len(pending_jobs) - len(jobs), spooled_jobs)
+                    pending_jobs.update(submitted_futures)
+                if started_futures or submitted_futures or running_jobs != set(job.file_name() for job in jobs):
+                    poll_interval = self.config.min_poll_interval
+                else:
+                    poll_interval = min(poll_interval * 2, self.config.max_poll_interval)
+                if len(jobs) == 0 and len(pending_jobs) == 0:
                     # get package status
                     package_info = self.load_storage.get_load_package_info(load_id)
                     # possibly raise on failed jobs
@@ -365,22 +594,62 @@ class Load(Runnable[Executor]):
                         if package_info.jobs["failed_jobs"]:
                             failed_job = package_info.jobs["failed_jobs"][0]
                             raise LoadClientJobFailed(load_id, failed_job.job_file_info.job_id(), failed_job.failed_message)
-                    # possibly raise on too many retires
-                    if self.config.raise_on_max_retries:
-                        for new_job in package_info.jobs["new_jobs"]:
-                            r_c = new_job.job_file_info.retry_count
-                            if r_c > 0 and r_c % self.config.raise_on_max_retries == 0:
-                                raise LoadClientJobRetry(load_id, new_job.job_file_info.job_id(), r_c, self.config.raise_on_max_retries)
-                    break
-                # process remaining jobs again
-                jobs = remaining_jobs
-                # this will raise on signal
-                sleep(1)
+                    # wait for the delayed retries that were not yet started in this run
+                    retry_at = self.get_next_retry_at(load_id, spooled_jobs)
+                    if retry_at is None:
+                        # possibly raise on too many retires
+                        if self.config.raise_on_max_retries:
+                            for new_job in package_info.jobs["new_jobs"]:
+                                r_c = new_job.job_file_info.retry_count
+                                if r_c > 0 and r_c % self.config.raise_on_max_retries == 0:
+                                    raise LoadClientJobRetry(load_id, new_job.job_file_info.job_id(), r_c, self.config.raise_on_max_retries)
+                        break
+                    poll_interval = min(max(retry_at - time.time(), 0), self.config.max_poll_interval)
+                if pending_jobs:
+                    # wake up as soon as any of the submitted jobs starts
+                    wait_for_futures(pending_jobs, timeout=poll_interval, return_when=FIRST_COMPLETED)
+                    signals.raise_if_signalled()
+                else:
+                    # this will raise on signal
+                    sleep(poll_interval)
             except LoadClientJobFailed:
                 # the package is completed and skipped
                 self.complete_package(load_id, schema, True)
                 raise
 
+    def get_concurrent_packages(self, first_load_id: str, first_schema: Schema, load_ids: Sequence[str]) -> List[Tuple[str, Schema]]:
+        """Selects packages from `load_ids` that may be loaded together with package `first_load_id`, in order.
+
+           Packages are taken until the first package that writes to a table of any preceding package with write disposition other than append.
+           Tables are identified by schema and table name.
+        """
+        packages: List[Tuple[str, Schema]] = []
+        tables = self._get_package_tables(first_load_id, first_schema)
+        for load_id in load_ids:
+            schema = self.load_storage.load_package_schema(load_id)
+            package_tables = self._get_package_tables(load_id, schema)
+            if any(tables[key] != "append" or write_disposition != "append" for key, write_disposition in package_tables.items() if key in tables):
+                break
+            tables.update(package_tables)
+            packages.append((load_id, schema))
+        return packages
+
+    def _get_package_tables(self, load_id: str, schema: Schema) -> Dict[Tuple[str, str], Optional[TWriteDisposition]]:
+        """Gets write dispositions of all tables that jobs of package `load_id` may write to, including whole table chains. Tables are keyed by (schema name, table name)"""
+        tables: Dict[Tuple[str, str], Optional[TWriteDisposition]] = {}
+        job_files = list(self.load_storage.list_new_jobs(load_id)) + list(self.load_storage.list_started_jobs(load_id))
+        for table_name in set(LoadStorage.parse_job_file_name(job_file).table_name for job_file in job_files):
+            if table_name not in schema.tables:
+                # jobs for unknown tables will fail, do not load such package concurrently
+                tables[(schema.name, table_name)] = None
+                continue
+            top_job_table = get_top_level_table(schema.tables, table_name)
+            # replace and merge may truncate or write to all tables in the chain
+            write_disposition = get_write_disposition(schema.tables, top_job_table["name"])
+            for table in get_child_tables(schema.tables, top_job_table["name"]):
+                tables[(schema.name, table["name"])] = write_disposition
+        return tables
+
     def run(self, pool: Optional[Executor]) -> TRunMetrics:
         # store pool
         self.pool = pool or NullExecutor()
@@ -397,12 +666,15 @@ class Load(Runnable[Executor]):
         logger.info(f"Loading schema from load package in {load_id}")
         schema = self.load_storage.load_package_schema(load_id)
         logger.info(f"Loaded schema name {schema.name} and version {schema.stored_version}")
+        packages = [(load_id, schema)] + self.get_concurrent_packages(load_id, schema, loads[1:self.config.max_parallel_packages])
 
         # get top load id and mark as being processed
         # TODO: another place where tracing must be refactored
-        self._processed_load_ids[load_id] = None
-        with self.collector(f"Load {schema.name} in {load_id}"):
-            self.load_single_package(load_id, schema)
+        for load_id, _ in packages:
+            self._processed_load_ids[load_id] = None
+        packages_msg = f" and {len(packages) - 1} more packages" if len(packages) > 1 else ""
+        with self.collector(f"Load {schema.name} in {packages[0][0]}{packages_msg}"):
+            self.load_packages(packages)
 
         return TRunMetrics(False, len(self.load_storage.list_normalized_packages()))
 
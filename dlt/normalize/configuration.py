@@ -30,6 +30,9 @@ class NormalizeConfiguration(PoolRunnerConfiguration):
 
     parquet_normalizer: ItemsNormalizerConfiguration = ItemsNormalizerConfiguration(add_dlt_id=False, add_dlt_load_id=False)
 
+    max_compacted_file_size: Optional[int] = None
+    """When set, new job files of the same table in a load package are concatenated into files up to this size in bytes before package is committed"""
+
     def on_resolved(self) -> None:
         self.pool_type = "none" if self.workers == 1 else "process"
 
@@ -38,6 +41,7 @@ class NormalizeConfiguration(PoolRunnerConfiguration):
             self,
             pool_type: TPoolType = "process",
             workers: int = None,
+            max_compacted_file_size: Optional[int] = None,
             _schema_storage_config: SchemaStorageConfiguration = None,
             _normalize_storage_config: NormalizeStorageConfiguration = None,
             _load_storage_config: LoadStorageConfiguration = None
@@ -1,5 +1,5 @@
 import os
-from typing import List, Dict, Tuple, Protocol, Any
+from typing import List, Dict, Tuple, Protocol, Any, Iterator
 from pathlib import Path
 from abc import abstractmethod
 
@@ -44,6 +44,9 @@ class ItemsNormalizer:
 
 
 class JsonLItemsNormalizer(ItemsNormalizer):
+    DECODE_PUA_TYPES = True
+    """Values in extracted files carry types encoded with PUA characters"""
+
     def _normalize_chunk(self, root_table_name: str, items: List[TDataItem]) -> Tuple[TSchemaUpdate, int, TRowCount]:
         column_schemas: Dict[
             str, TTableSchemaColumns
@@ -63,8 +66,9 @@ class JsonLItemsNormalizer(ItemsNormalizer):
                 # do not process empty rows
                 if row:
                     # decode pua types
-                    for k, v in row.items():
-                        row[k] = custom_pua_decode(v)  # type: ignore
+                    if self.DECODE_PUA_TYPES:
+                        for k, v in row.items():
+                            row[k] = custom_pua_decode(v)  # type: ignore
                     # coerce row of values into schema table, generating partial table with new columns if any
                     row, partial_table = schema.coerce_row(
                         table_name, parent_table, row
@@ -102,20 +106,43 @@ class JsonLItemsNormalizer(ItemsNormalizer):
     ) -> Tuple[List[TSchemaUpdate], int, TRowCount]:
         schema_updates: List[TSchemaUpdate] = []
         row_counts: TRowCount = {}
-        with self.normalize_storage.storage.open_file(extracted_items_file) as f:
-            # enumerate jsonl file line by line
-            items_count = 0
-            for line_no, line in enumerate(f):
-                items: List[TDataItem] = json.loads(line)
-                partial_update, items_count, r_counts = self._normalize_chunk(root_table_name, items)
-                schema_updates.append(partial_update)
-                merge_row_count(row_counts, r_counts)
-                logger.debug(
-                    f"Processed {line_no} items from file {extracted_items_file}, items {items_count}"
-                )
+        items_count = 0
+        for line_no, items in enumerate(self._read_chunks(extracted_items_file)):
+            partial_update, items_count, r_counts = self._normalize_chunk(root_table_name, items)
+            schema_updates.append(partial_update)
+            merge_row_count(row_counts, r_counts)
+            logger.debug(
+                f"Processed {line_no} items from file {extracted_items_file}, items {items_count}"
+            )
 
         return schema_updates, items_count, row_counts
 
+    def _read_chunks(self, extracted_items_file: str) -> Iterator[List[TDataItem]]:
+        full_path = self.normalize_storage.storage.make_full_path(extracted_items_file)
+        if FileStorage.is_gzipped(full_path):
+            with self.normalize_storage.storage.open_file(extracted_items_file) as f:
+                # enumerate jsonl file line by line
+                for line in f:
+                    yield json.loads(line)
+        else:
+            # parse lines straight from the memory mapped file without decoding and copying them into str
+            with FileStorage.open_mmap_ro(full_path) as buffer:
+                for line in FileStorage.iter_mmap_lines(buffer):
+                    if line:
+                        yield json.loadb(line)
+
+
+class MsgpackItemsNormalizer(JsonLItemsNormalizer):
+    DECODE_PUA_TYPES = False
+    """Msgpack preserves python types so values are not decoded"""
+
+    def _read_chunks(self, extracted_items_file: str) -> Iterator[List[TDataItem]]:
+        from dlt.common.libs.msgpack import typed_load_stream
+
+        with self.normalize_storage.storage.open_file(extracted_items_file, "rb") as f:
+            # each chunk is a list of items written by a single flush
+            yield from typed_load_stream(f)
+
 
 class ParquetItemsNormalizer(ItemsNormalizer):
     REWRITE_ROW_GROUPS = 1
@@ -1,5 +1,5 @@
 import os
-from typing import Callable, List, Dict, Sequence, Tuple, Set, Optional
+from typing import Callable, List, Dict, Sequence, Tuple, Set, Optional, Type
 from concurrent.futures import Future, Executor
 
 from dlt.common import pendulum, json, logger, sleep
@@ -21,7 +21,7 @@ from dlt.common.pipeline import NormalizeInfo
 from dlt.common.utils import chunks, TRowCount, merge_row_count, increase_row_count
 
 from dlt.normalize.configuration import NormalizeConfiguration
-from dlt.normalize.items_normalizers import ParquetItemsNormalizer, JsonLItemsNormalizer, ItemsNormalizer
+from dlt.normalize.items_normalizers import ParquetItemsNormalizer, JsonLItemsNormalizer, MsgpackItemsNormalizer, ItemsNormalizer
 
 # normalize worker wrapping function (map_parallel, map_single) return type
 TMapFuncRV = Tuple[Sequence[TSchemaUpdate], TRowCount]
@@ -109,7 +109,12 @@ class Normalize(Runnable[Executor]):
                 load_storage = _get_load_storage(file_format)
                 if file_format in item_normalizers:
                     return item_normalizers[file_format], load_storage
-                klass = ParquetItemsNormalizer if file_format == "parquet" else JsonLItemsNormalizer
+                # pick the reader from the extension of extracted file
+                klass: Type[ItemsNormalizer] = JsonLItemsNormalizer
+                if file_format == "parquet":
+                    klass = ParquetItemsNormalizer
+                elif file_format == "msgpack":
+                    klass = MsgpackItemsNormalizer
                 norm = item_normalizers[file_format] = klass(
                     load_storage, normalize_storage, schema, load_id, config
                 )
@@ -254,6 +259,10 @@ class Normalize(Runnable[Executor]):
             logger.info(f"Saving schema {schema_name} with version {schema.version}, writing manifest files")
             # schema is updated, save it to schema volume
             self.schema_storage.save_schema(schema)
+        # combine small files of the same table so fewer jobs are loaded
+        if self.config.max_compacted_file_size:
+            removed_files = self.load_storage.compact_temp_load_package(load_id, self.config.max_compacted_file_size)
+            logger.info(f"Compacted load package {load_id}, removed {removed_files} job files")
         # save schema to temp load folder
         self.load_storage.save_temp_schema(schema, load_id)
         # save schema updates even if empty
@@ -25,6 +25,10 @@ class PipelineConfiguration(BaseConfiguration):
     full_refresh: bool = False
     """When set to True, each instance of the pipeline with the `pipeline_name` starts from scratch when run and loads the data to a separate dataset."""
     progress: Optional[str] = None
+    volumes_dir: Optional[str] = None
+    """A directory, ie. on tmpfs, where extract, normalize and load volumes of the pipeline are kept instead of the pipeline working dir. State, schemas and traces stay in working dir."""
+    volumes_dir_max_bytes: Optional[int] = None
+    """When pending data in `volumes_dir` exceeds this size during extract or normalize, it is moved to the volumes in working dir which are used until it is processed"""
     runtime: RunConfiguration
 
     def on_resolved(self) -> None:
@@ -1,5 +1,6 @@
 import contextlib
 import os
+import shutil
 import datetime  # noqa: 251
 from contextlib import contextmanager
 from functools import wraps
@@ -270,8 +271,13 @@ class Pipeline(SupportsPipeline):
         workers: int = None
     ) -> ExtractInfo:
         """Extracts the `data` and prepare it for the normalization. Does not require destination or credentials to be configured. See `run` method for the arguments' description."""
+        # volumes may be switched if there's no pending data
+        self._configure_volumes()
+        self._spill_volumes_if_full()
         # create extract storage to which all the sources will be extracted
         storage = ExtractorStorage(self._normalize_storage_config)
+        # spill over to working dir if volumes_dir gets full during extraction
+        storage.volume_check = lambda: self._spill_volumes_if_full(storage)
         extract_ids: List[str] = []
         try:
             with self._maybe_destination_capabilities():
@@ -307,6 +313,8 @@ class Pipeline(SupportsPipeline):
 
         # make sure destination capabilities are available
         self._get_destination_capabilities()
+        # load packages take about as much space as the extracted files
+        self._spill_volumes_if_full(bytes_to_write=self._get_normalize_storage().storage.get_folder_size(NormalizeStorage.EXTRACTED_FOLDER))
         # create default normalize config
         normalize_config = NormalizeConfiguration(
             workers=workers,
@@ -626,11 +634,11 @@ class Pipeline(SupportsPipeline):
         return self._get_load_storage().list_normalized_packages()
 
     def list_completed_load_packages(self) -> Sequence[str]:
-        """Returns a list of all load package ids that are completely loaded"""
+        """Returns a list of all load package ids that are completely loaded. When `volumes_dir` is used, only the packages in the currently used volumes are listed"""
         return self._get_load_storage().list_completed_packages()
 
     def get_load_package_info(self, load_id: str) -> LoadPackageInfo:
-        """Returns information on normalized/completed package with given load_id, all jobs and their statuses."""
+        """Returns information on normalized/completed package with given load_id, all jobs and their statuses. When `volumes_dir` is used, the package is looked up in the currently used volumes"""
         return self._get_load_storage().get_load_package_info(load_id)
 
     def list_failed_jobs_in_package(self, load_id: str) -> Sequence[LoadJobInfo]:
@@ -761,8 +769,7 @@ class Pipeline(SupportsPipeline):
             export_schema_path=export_schema_path
         )
         # create default configs
-        self._normalize_storage_config = NormalizeStorageConfiguration(normalize_volume_path=os.path.join(self.working_dir, "normalize"))
-        self._load_storage_config = LoadStorageConfiguration(load_volume_path=os.path.join(self.working_dir, "load"),)
+        self._configure_volumes()
 
         # are we running again?
         has_state = self._pipeline_storage.has_file(Pipeline.STATE_FILE)
@@ -780,6 +787,92 @@ class Pipeline(SupportsPipeline):
         # create schema storage
         self._schema_storage = LiveSchemaStorage(self._schema_storage_config, makedirs=True)
 
+    def _configure_volumes(self) -> None:
+        """Creates normalize and load storage configs with volumes in the working dir or in the optional `volumes_dir`
+
+        Volumes in `volumes_dir` (ie. on tmpfs) are used unless the working dir contains spilled data which must be processed first.
+        When pending data in `volumes_dir` exceeds `volumes_dir_max_bytes`, the pipeline spills over to the working dir, see `_spill_volumes_if_full`.
+        Completed load packages stay in the volumes where they were loaded.
+        """
+        volumes_dir = self.working_dir
+        if self.config.volumes_dir:
+            volumes_storage = FileStorage(self.config.volumes_dir, makedirs=False)
+            # spilled data must be processed first
+            if not self._volumes_have_pending_data(self._pipeline_storage, ""):
+                volumes_dir = volumes_storage.make_full_path(self.pipeline_name)
+        self._set_volumes_dir(volumes_dir)
+
+    def _set_volumes_dir(self, volumes_dir: str) -> None:
+        self._normalize_storage_config = NormalizeStorageConfiguration(normalize_volume_path=os.path.join(volumes_dir, "normalize"))
+        self._load_storage_config = LoadStorageConfiguration(load_volume_path=os.path.join(volumes_dir, "load"),)
+
+    def _spill_volumes_if_full(self, extractor_storage: ExtractorStorage = None, bytes_to_write: int = 0) -> None:
+        """Switches to volumes in the working dir if pending data in `volumes_dir` together with `bytes_to_write` exceeds `volumes_dir_max_bytes`
+
+        All pending data is moved to the working dir so it is processed from a single place and in order. Writers of `extractor_storage` that
+        extracts at the moment are switched to the working dir as well.
+        """
+        if self.config.volumes_dir_max_bytes is None or not self.config.volumes_dir:
+            return
+        if self._normalize_storage_config.normalize_volume_path == os.path.join(self.working_dir, "normalize"):
+            return
+        volumes_storage = FileStorage(self.config.volumes_dir, makedirs=False)
+        volumes_size = self._get_volumes_pending_size(volumes_storage, self.pipeline_name)
+        if volumes_size + bytes_to_write <= self.config.volumes_dir_max_bytes:
+            return
+        logger.warning(
+            f"Pipeline volumes in {volumes_storage.make_full_path(self.pipeline_name)} have {volumes_size} bytes of pending data and {bytes_to_write} bytes to be written "
+            f"which exceeds volumes_dir_max_bytes. Pending data is moved to volumes in working dir {self.working_dir} which will be used."
+        )
+        self._set_volumes_dir(self.working_dir)
+        if extractor_storage:
+            # closes the writers so partially extracted files may be moved
+            extractor_storage.switch_volume(self._normalize_storage_config)
+        for path in self._list_volumes_pending_paths(volumes_storage, self.pipeline_name):
+            dest_path = self._pipeline_storage.make_full_path(os.path.relpath(path, self.pipeline_name))
+            os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+            shutil.move(volumes_storage.make_full_path(path), dest_path)
+
+    @staticmethod
+    def _volumes_have_pending_data(storage: FileStorage, volumes_path: str) -> bool:
+        """Checks if there are extracted files or normalized packages in volumes at `volumes_path`, without creating the storages"""
+        for folder in (os.path.join(volumes_path, "normalize", NormalizeStorage.EXTRACTED_FOLDER), os.path.join(volumes_path, "load", LoadStorage.NORMALIZED_FOLDER)):
+            if storage.has_folder(folder) and len(os.listdir(storage.make_full_path(folder))) > 0:
+                return True
+        return False
+
+    @staticmethod
+    def _get_volumes_pending_size(storage: FileStorage, volumes_path: str) -> int:
+        """Gets size of pending data in volumes at `volumes_path`, see `_list_volumes_pending_paths`"""
+        size = 0
+        for path in Pipeline._list_volumes_pending_paths(storage, volumes_path):
+            if storage.has_folder(path):
+                size += storage.get_folder_size(path)
+            else:
+                with contextlib.suppress(FileNotFoundError):
+                    size += os.path.getsize(storage.make_full_path(path))
+        return size
+
+    @staticmethod
+    def _list_volumes_pending_paths(storage: FileStorage, volumes_path: str) -> List[str]:
+        """Lists files being extracted, extracted files, load packages being normalized and normalized packages in volumes at `volumes_path`. Completed packages are not listed"""
+        paths: List[str] = []
+        load_path = os.path.join(volumes_path, "load")
+        for folder in (
+            os.path.join(volumes_path, "normalize", ExtractorStorage.EXTRACT_FOLDER),
+            os.path.join(volumes_path, "normalize", NormalizeStorage.EXTRACTED_FOLDER),
+            load_path,
+            os.path.join(load_path, LoadStorage.NORMALIZED_FOLDER)
+        ):
+            if storage.has_folder(folder):
+                for name in os.listdir(storage.make_full_path(folder)):
+                    path = os.path.join(folder, name)
+                    # temporary load packages are folders in the root of load volume
+                    if folder == load_path and (name in (LoadStorage.NORMALIZED_FOLDER, LoadStorage.LOADED_FOLDER) or not storage.has_folder(path)):
+                        continue
+                    paths.append(path)
+        return paths
+
     def _create_pipeline(self) -> None:
         self._wipe_working_folder()
         self._pipeline_storage.create_folder("", exists_ok=False)
@@ -791,6 +884,11 @@ class Pipeline(SupportsPipeline):
         # kill everything inside the working folder
         if self._pipeline_storage.has_folder(""):
             self._pipeline_storage.delete_folder("", recursively=True, delete_ro=True)
+        # and in volumes dir
+        if self.config.volumes_dir:
+            volumes_storage = FileStorage(self.config.volumes_dir, makedirs=False)
+            if volumes_storage.has_folder(self.pipeline_name):
+                volumes_storage.delete_folder(self.pipeline_name, recursively=True, delete_ro=True)
 
     def _attach_pipeline(self) -> None:
         pass
@@ -15,7 +15,7 @@ from tests.utils import TEST_STORAGE_ROOT, write_version, autouse_test_storage
 import datetime  # noqa: 251
 
 
-ALL_WRITERS: Set[Literal[TLoaderFileFormat]] = {"insert_values", "jsonl", "parquet", "arrow", "puae-jsonl"}
+ALL_WRITERS: Set[Literal[TLoaderFileFormat]] = {"insert_values", "jsonl", "parquet", "arrow", "puae-jsonl", "msgpack"}
 
 
 def get_writer(_format: TLoaderFileFormat = "insert_values", buffer_max_items: int = 10, disable_compression: bool = False) -> BufferedDataWriter[DataWriter]:
@@ -179,6 +179,8 @@ def test_writer_optional_schema(disable_compression: bool) -> None:
 
 @pytest.mark.parametrize("writer_format", ALL_WRITERS - {"arrow"})
 def test_writer_items_count(writer_format: TLoaderFileFormat) -> None:
+    if writer_format == "msgpack":
+        pytest.importorskip("msgpack")
     c1 = {"col1": new_column("col1", "bigint")}
     with get_writer(_format=writer_format) as writer:
         assert writer._buffered_items_count == 0
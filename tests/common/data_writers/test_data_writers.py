@@ -7,8 +7,9 @@ from dlt.common.typing import AnyFun
 # from dlt.destinations.postgres import capabilities
 from dlt.destinations.redshift import capabilities as redshift_caps
 from dlt.common.data_writers.escape import escape_redshift_identifier, escape_bigquery_identifier, escape_redshift_literal, escape_postgres_literal, escape_duckdb_literal
-from dlt.common.data_writers.writers import DataWriter, InsertValuesWriter, JsonlWriter, ParquetDataWriter
+from dlt.common.data_writers.writers import DataWriter, InsertValuesWriter, JsonlWriter, MsgpackWriter, ParquetDataWriter
 
+from tests.cases import JSON_TYPED_DICT_NESTED
 from tests.common.utils import load_json_case, row_to_column_schemas
 
 ALL_LITERAL_ESCAPE = [escape_redshift_literal, escape_postgres_literal, escape_duckdb_literal]
@@ -52,6 +53,26 @@ def test_simple_jsonl_writer(jsonl_writer: _BytesIOWriter) -> None:
     assert len(lines) == 3
 
 
+def test_msgpack_writer_preserves_types() -> None:
+    pytest.importorskip("msgpack")
+    from dlt.common.libs.msgpack import typed_load_stream
+
+    with io.BytesIO() as f:
+        writer = MsgpackWriter(f)
+        writer.write_all(None, [JSON_TYPED_DICT_NESTED])
+        writer.write_data([JSON_TYPED_DICT_NESTED, JSON_TYPED_DICT_NESTED])
+        assert writer.items_count == 3
+        f.seek(0)
+        chunks = list(typed_load_stream(f))
+    # each write is a separate chunk
+    assert len(chunks) == 2
+    assert chunks[1] == [JSON_TYPED_DICT_NESTED, JSON_TYPED_DICT_NESTED]
+    # exact types are preserved, including nested values
+    for k, v in chunks[0][0]["dict"].items():
+        assert v == JSON_TYPED_DICT_NESTED["dict"][k]
+        assert type(v) is type(JSON_TYPED_DICT_NESTED["dict"][k])
+
+
 def test_bytes_insert_writer(insert_writer: _StringIOWriter) -> None:
     rows = [{"bytes": b"bytes"}]
     insert_writer.write_all(row_to_column_schemas(rows[0]), rows)
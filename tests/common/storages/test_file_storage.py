@@ -236,3 +236,23 @@ def test_open_compressed() -> None:
         content = f.read()
         assert isinstance(content, str)
         assert content == bstr.decode("utf-8")
+
+
+def test_open_mmap() -> None:
+    tstr = "data'ऄअआइ''ईउऊऋऌऍऎए');\n\nline2\nlast"
+    FileStorage.save_atomic(TEST_STORAGE_ROOT, "file.txt", tstr)
+    storage = FileStorage(TEST_STORAGE_ROOT)
+    with FileStorage.open_mmap_ro(storage.make_full_path("file.txt")) as buffer:
+        assert buffer[:] == tstr.encode("utf-8")
+        lines = [str(line, "utf-8") for line in FileStorage.iter_mmap_lines(buffer)]
+        assert lines == tstr.split("\n")
+        # slice outlives the generator
+        line = next(FileStorage.iter_mmap_lines(buffer))
+    # mapping is kept until slice is collected
+    assert line.tobytes() == "data'ऄअआइ''ईउऊऋऌऍऎए');".encode("utf-8")
+
+    # empty files can be mapped
+    FileStorage.save_atomic(TEST_STORAGE_ROOT, "empty.txt", "")
+    with FileStorage.open_mmap_ro(storage.make_full_path("empty.txt")) as buffer:
+        assert len(buffer) == 0
+        assert list(FileStorage.iter_mmap_lines(buffer)) == []
@@ -182,6 +182,113 @@ def test_retry_job(storage: LoadStorage) -> None:
     assert LoadStorage.parse_job_file_name(new_fp).retry_count == 2
 
 
+def test_jobs_journal(storage: LoadStorage) -> None:
+    storage.config.use_jobs_journal = True
+    load_id, fn = start_loading_file(storage, [{"content": "a"}, {"content": "b"}])
+    package_path = storage.get_normalized_package_path(load_id)
+    # job file was not moved
+    new_jobs_fp = storage._get_job_file_path(load_id, "new_jobs", fn)
+    assert storage.storage.has_file(new_jobs_fp)
+    assert not storage.storage.has_file(storage._get_job_file_path(load_id, "started_jobs", fn))
+    assert storage.list_started_jobs(load_id) == [new_jobs_fp]
+    assert storage.list_new_jobs(load_id) == []
+    # retry renames the file in place
+    new_fp = storage.retry_job(load_id, fn)
+    assert new_fp == storage.storage.make_full_path(storage._get_job_file_path(load_id, "new_jobs", Path(new_fp).name))
+    assert_package_info(storage, load_id, "normalized", "new_jobs")
+    fn = Path(new_fp).name
+    storage.start_job(load_id, fn)
+    storage.fail_job(load_id, fn, "EXCEPTION")
+    package_info = assert_package_info(storage, load_id, "normalized", "failed_jobs")
+    assert package_info.jobs["failed_jobs"][0].failed_message == "EXCEPTION"
+    # journal survives config change
+    storage.config.use_jobs_journal = False
+    assert len(storage.list_failed_jobs(load_id)) == 2
+    # partially written entry is ignored on recovery
+    storage.storage.append(os.path.join(package_path, LoadStorage.JOBS_JOURNAL_FILE_NAME), '{"file_name": "')
+    assert_package_info(storage, load_id, "normalized", "failed_jobs")
+    # journal is compacted into manifest on completion
+    storage.complete_load_package(load_id, False)
+    completed_path = storage.get_completed_package_path(load_id)
+    assert not storage.storage.has_file(os.path.join(completed_path, LoadStorage.JOBS_JOURNAL_FILE_NAME))
+    assert storage.storage.has_file(os.path.join(completed_path, LoadStorage.JOBS_MANIFEST_FILE_NAME))
+    package_info = assert_package_info(storage, load_id, "loaded", "failed_jobs")
+    assert package_info.jobs["failed_jobs"][0].failed_message == "EXCEPTION"
+    assert len(storage.list_completed_failed_jobs(load_id)) == 2
+    assert storage.list_failed_jobs_in_completed_package(load_id) == package_info.jobs["failed_jobs"]
+
+    # completed jobs are deleted
+    storage.config.use_jobs_journal = True
+    storage.config.delete_completed_jobs = True
+    load_id, fn = start_loading_file(storage, [{"content": "a"}, {"content": "b"}])
+    storage.complete_job(load_id, fn)
+    assert_package_info(storage, load_id, "normalized", "completed_jobs")
+    storage.complete_load_package(load_id, False)
+    assert_package_info(storage, load_id, "loaded", "completed_jobs", jobs_count=0)
+    assert not storage.storage.has_file(os.path.join(storage.get_completed_package_path(load_id), "new_jobs", fn))
+
+
+def test_jobs_journal_append_after_torn_entry(storage: LoadStorage) -> None:
+    storage.config.use_jobs_journal = True
+    load_id, fn = start_loading_file(storage, [{"content": "a"}, {"content": "b"}])
+    journal_path = os.path.join(storage.get_normalized_package_path(load_id), LoadStorage.JOBS_JOURNAL_FILE_NAME)
+    # process is killed while writing an entry
+    storage.storage.append(journal_path, '{"file_name": "')
+    # recover in new storage instance and record a transition
+    storage = LoadStorage(False, "jsonl", LoadStorage.ALL_SUPPORTED_FILE_FORMATS, storage.config)
+    assert_package_info(storage, load_id, "normalized", "started_jobs")
+    storage.complete_job(load_id, fn)
+    # transition is not lost on the next recovery
+    storage = LoadStorage(False, "jsonl", LoadStorage.ALL_SUPPORTED_FILE_FORMATS, storage.config)
+    assert_package_info(storage, load_id, "normalized", "completed_jobs")
+    assert storage.storage.load(journal_path).endswith("\n")
+
+
+def test_jobs_index(storage: LoadStorage) -> None:
+    load_id, fn = start_loading_file(storage, [{"content": "a"}, {"content": "b"}], start_job=False)
+    listed_folders = []
+    list_folder_files = storage.storage.list_folder_files
+
+    def _list_folder_files(relative_path: str, to_root: bool = True) -> Sequence[str]:
+        listed_folders.append(relative_path)
+        return list_folder_files(relative_path, to_root)
+
+    storage.storage.list_folder_files = _list_folder_files  # type: ignore[method-assign]
+    # index was created when package info was asserted
+    assert storage.list_new_jobs(load_id) == [storage._get_job_file_path(load_id, "new_jobs", fn)]
+    storage.start_job(load_id, fn)
+    assert storage.list_started_jobs(load_id) == [storage._get_job_file_path(load_id, "started_jobs", fn)]
+    # add followup job
+    followup_path = os.path.join(storage.storage.make_full_path(load_id + "_followup"))
+    followup_fn = storage.build_job_file_name("mock_table", uniq_id())
+    os.makedirs(followup_path)
+    with open(os.path.join(followup_path, followup_fn), "w", encoding="utf-8") as f:
+        f.write("{}")
+    storage.add_new_job(load_id, os.path.join(followup_path, followup_fn))
+    assert storage.list_new_jobs(load_id) == [storage._get_job_file_path(load_id, "new_jobs", followup_fn)]
+    storage.fail_job(load_id, fn, "EXCEPTION")
+    assert len(storage.list_failed_jobs(load_id)) == 2
+    package_info = storage.get_load_package_info(load_id)
+    assert package_info.jobs["failed_jobs"][0].failed_message == "EXCEPTION"
+    assert package_info.jobs["failed_jobs"][0].file_size == 32
+    assert len(package_info.jobs["new_jobs"]) == 1
+    assert sorted(job.job_file_info.job_id() for job in storage.list_jobs_for_table(load_id, "mock_table")) == sorted([followup_fn, fn])
+    # table jobs are counted per state
+    assert storage.count_jobs_for_table(load_id, "mock_table", "new_jobs") == 1
+    assert storage.count_jobs_for_table(load_id, "mock_table", "new_jobs", exclude_job_id=followup_fn) == 0
+    assert storage.count_jobs_for_table(load_id, "mock_table", "failed_jobs") == 1
+    assert storage.count_jobs_for_table(load_id, "mock_table", "started_jobs") == 0
+    assert storage.count_jobs_for_table(load_id, "other_table", "new_jobs") == 0
+    # package folders were never listed
+    assert listed_folders == []
+    # index is rebuilt from package folders
+    storage._jobs_indexes.clear()
+    rebuilt_jobs = storage.get_load_package_info(load_id).jobs
+    for state, jobs in package_info.jobs.items():
+        assert [job._replace(elapsed=0) for job in rebuilt_jobs[state]] == [job._replace(elapsed=0) for job in jobs]
+    assert len(listed_folders) == 4
+
+
 def test_build_parse_job_path(storage: LoadStorage) -> None:
     file_id = uniq_id(5)
     f_n_t = ParsedLoadJobFileName("test_table", file_id, 0, "jsonl")
@@ -235,6 +342,19 @@ def test_process_schema_update(storage: LoadStorage) -> None:
     assert package_info.schema_update == applied_update
 
 
+def test_confirm_schemas_from_threads(storage: LoadStorage) -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    # packages loaded in parallel confirm their datasets at the same time
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda i: storage.confirm_schemas({f"dataset_{i}": f"hash_{i}"}), range(64)))
+    assert storage.get_confirmed_schemas() == {f"dataset_{i}": f"hash_{i}" for i in range(64)}
+    storage.confirm_schemas({"dataset_0": "hash_new"})
+    assert storage.get_confirmed_schemas()["dataset_0"] == "hash_new"
+    storage.forget_confirmed_schemas()
+    assert storage.get_confirmed_schemas() == {}
+
+
 def test_get_unknown_package_info(storage: LoadStorage) -> None:
     with pytest.raises(LoadPackageNotFound):
         storage.get_load_package_info("UNKNOWN LOAD ID")
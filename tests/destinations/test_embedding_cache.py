@@ -0,0 +1,49 @@
+import os
+import time
+
+import numpy as np
+
+from dlt.common.utils import uniq_id
+from dlt.destinations.embedding_cache import EmbeddingCache
+
+from tests.utils import TEST_STORAGE_ROOT, autouse_test_storage
+
+
+def make_cache_path() -> str:
+    return os.path.join(TEST_STORAGE_ROOT, "embeddings", uniq_id() + ".db")
+
+
+def test_get_put() -> None:
+    path = make_cache_path()
+    with EmbeddingCache(path, "model", max_items=100) as cache:
+        assert cache.get(["a", "b"]) == [None, None]
+        cache.put(["a"], [np.array([1.0, 2.0], dtype=np.float32)])
+        embedding_a, embedding_b = cache.get(["a", "b"])
+        assert embedding_b is None
+        assert embedding_a.dtype == np.float32
+        assert embedding_a.tolist() == [1.0, 2.0]
+
+    # embeddings survive reopening but are not shared between models
+    with EmbeddingCache(path, "model", max_items=100) as cache:
+        assert cache.get(["a"])[0].tolist() == [1.0, 2.0]
+    with EmbeddingCache(path, "other_model", max_items=100) as cache:
+        assert cache.get(["a"]) == [None]
+
+
+def test_many_keys() -> None:
+    docs = [str(i) for i in range(EmbeddingCache.MAX_KEYS_PER_QUERY * 2 + 1)]
+    with EmbeddingCache(make_cache_path(), "model", max_items=len(docs)) as cache:
+        cache.put(docs, [np.array([i], dtype=np.float64) for i in range(len(docs))])
+        assert [embedding.tolist() for embedding in cache.get(docs)] == [[i] for i in range(len(docs))]
+
+
+def test_evict_least_recently_used() -> None:
+    path = make_cache_path()
+    with EmbeddingCache(path, "model", max_items=2) as cache:
+        for doc, value in [("a", 1.0), ("b", 2.0), ("c", 3.0)]:
+            cache.put([doc], [np.array([value])])
+            time.sleep(0.01)
+        # access "a" so "b" is least recently used
+        cache.get(["a"])
+    with EmbeddingCache(path, "model", max_items=2) as cache:
+        assert [embedding is not None for embedding in cache.get(["a", "b", "c"])] == [True, False, True]
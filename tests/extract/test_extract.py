@@ -1,3 +1,5 @@
+import os
+import pytest
 import dlt
 from dlt.common import json
 from dlt.common.storages import NormalizeStorageConfiguration
@@ -110,3 +112,22 @@ def test_extract_renamed_clone_and_parent():
     assert "tx_clone" in schema_update
     # mind that pipe name of the evaluated parent will have different name than the resource
     assert source.tx_clone._pipe.parent.name == "input_gen_tx_clone"
+
+
+def test_extract_objects_to_msgpack() -> None:
+    pytest.importorskip("msgpack")
+    from dlt.common.libs.msgpack import typed_load_stream
+
+    clean_test_storage()
+    source = DltSource("selectables", "module", dlt.Schema("selectables"), [DltResource.from_data([{"a": 1}, {"a": 2}], name="items")])
+    os.environ["EXTRACT__OBJECT_FILE_FORMAT"] = "msgpack"
+    storage = ExtractorStorage(NormalizeStorageConfiguration())
+    assert storage.object_file_format == "msgpack"
+    extract_id = storage.create_extract_id()
+    extract(extract_id, source, storage)
+    storage.commit_extract_files(extract_id)
+    files = storage.list_files_to_normalize_sorted()
+    assert len(files) == 1
+    assert storage.parse_normalize_file_name(files[0]).file_format == "msgpack"
+    with storage.storage.open_file(files[0], "rb") as f:
+        assert list(typed_load_stream(f)) == [[{"a": 1}, {"a": 2}]]
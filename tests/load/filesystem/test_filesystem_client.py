@@ -1,11 +1,15 @@
 import posixpath
 import os
+from unittest import mock
 
 import pytest
 
 from dlt.common.utils import digest128, uniq_id
+from dlt.common.configuration import resolve_configuration
+from dlt.common.configuration.exceptions import ConfigurationValueError
 from dlt.common.storages import LoadStorage, FileStorage
 
+from dlt.destinations.filesystem import filesystem
 from dlt.destinations.filesystem.filesystem import LoadFilesystemJob, FilesystemDestinationClientConfiguration
 
 from tests.load.filesystem.utils import perform_load
@@ -40,6 +44,28 @@ def test_filesystem_destination_configuration() -> None:
     assert FilesystemDestinationClientConfiguration(bucket_url="s3://cool").fingerprint() == digest128("s3://cool")
 
 
+def test_partitioned_datasets_layout_configuration() -> None:
+    config = resolve_configuration(FilesystemDestinationClientConfiguration(bucket_url="file:///tmp", dataset_name="test", partition_parquet_datasets=True))
+    assert config.layout == "{table_name}/{load_id}.{file_id}.{ext}"
+    # partition folders would be shared by all tables
+    with pytest.raises(ConfigurationValueError):
+        resolve_configuration(FilesystemDestinationClientConfiguration(
+            bucket_url="file:///tmp", dataset_name="test", partition_parquet_datasets=True, layout="{schema_name}.{table_name}.{load_id}.{file_id}.{ext}"
+        ))
+
+
+
+def test_load_job_reuses_client_filesystem(default_buckets_env: str) -> None:
+    """Load jobs must upload with the filesystem instance of the client instead of creating their own"""
+    dataset_name = 'test_' + uniq_id()
+    with mock.patch.object(filesystem, "fsspec_from_config", wraps=filesystem.fsspec_from_config) as fsspec_mock:
+        with perform_load(dataset_name, NORMALIZED_FILES) as load_info:
+            _, jobs, _, _ = load_info
+            assert all(job.state() == 'completed' for job in jobs)
+            # one filesystem per client: the loader init, the client used by the test and one per spooled job
+            assert fsspec_mock.call_count == len(jobs) + 2
+
+
 @pytest.mark.parametrize('write_disposition', ('replace', 'append', 'merge'))
 @pytest.mark.parametrize('layout', ALL_LAYOUTS)
 def test_successful_load(write_disposition: str, layout: str, default_buckets_env: str) -> None:
@@ -2,6 +2,7 @@ import pytest
 import os
 
 import dlt
+from dlt.common.utils import uniq_id
 from dlt.destinations.exceptions import DatabaseTerminalException
 from dlt.pipeline.exceptions import PipelineStepFailed
 
@@ -40,3 +41,95 @@ def test_duck_case_names(destination_config: DestinationTestConfiguration) -> No
     assert tables["column_name"].tolist() == ["🐾Feet", "1+1", "hey", "_dlt_load_id", "_dlt_id"]
 
 
+
+
+@pytest.mark.parametrize("destination_config", destinations_configs(default_sql_configs=True, subset=["duckdb"]), ids=lambda x: x.name)
+def test_duck_dataset_dropped_after_confirmed_schema(destination_config: DestinationTestConfiguration) -> None:
+    os.environ["LOAD__MIN_RETRY_DELAY"] = "0.1"
+    pipeline = destination_config.setup_pipeline("test_duck_dataset_dropped", full_refresh=True)
+    pipeline.run([{"id": 1}], table_name="numbers").raise_on_failed_jobs()
+    # dataset is dropped behind the back of the pipeline, schema version does not change
+    with pipeline.sql_client() as client:
+        client.drop_dataset()
+    info = pipeline.run([{"id": 2}], table_name="numbers")
+    info.raise_on_failed_jobs()
+    assert load_table_counts(pipeline, "numbers") == {"numbers": 1}
+
+
+@pytest.mark.parametrize("destination_config", destinations_configs(default_sql_configs=True, subset=["duckdb"]), ids=lambda x: x.name)
+def test_duck_parquet_many_files(destination_config: DestinationTestConfiguration) -> None:
+    # rotate files often so there are many parquet jobs per table
+    os.environ["DATA_WRITER__FILE_MAX_ITEMS"] = "10"
+    pipeline = destination_config.setup_pipeline("test_duck_parquet_many_files", full_refresh=True)
+    # new column appears in the middle of the data so files have different columns
+    data = [{"id": i} for i in range(50)] + [{"id": i, "value": str(i)} for i in range(50, 100)]
+    info = pipeline.run(data, table_name="numbers", loader_file_format="parquet")
+    info.raise_on_failed_jobs()
+    jobs = [job for job in info.load_packages[0].jobs["completed_jobs"] if job.job_file_info.table_name == "numbers"]
+    assert len(jobs) > 1
+    assert load_table_counts(pipeline, "numbers") == {"numbers": 100}
+    with pipeline.sql_client() as client:
+        rows = client.execute_sql("SELECT id, value FROM numbers WHERE value IS NOT NULL ORDER BY id")
+    assert [tuple(row) for row in rows] == [(i, str(i)) for i in range(50, 100)]
+
+
+@pytest.mark.parametrize("destination_config", destinations_configs(default_sql_configs=True, subset=["duckdb"]), ids=lambda x: x.name)
+def test_duck_parquet_failed_batch(destination_config: DestinationTestConfiguration) -> None:
+    from dlt.common.libs.pyarrow import pyarrow
+    from dlt.destinations.duckdb.duck import DuckDbCopyJob, ParquetTableBatches
+
+    pipeline = destination_config.setup_pipeline("test_duck_parquet_failed_batch", full_refresh=True)
+    pipeline.run([{"id": 0}], table_name="numbers").raise_on_failed_jobs()
+    pipeline_dir = pipeline.working_dir
+
+    def write_file(name: str, values: list) -> str:
+        path = os.path.join(pipeline_dir, f"numbers.{name}.0.parquet")
+        columns = {"id": values, "_dlt_load_id": ["0"] * len(values), "_dlt_id": [uniq_id() for _ in values]}
+        pyarrow.parquet.write_table(pyarrow.table(columns), path)
+        return path
+
+    good_1, good_2, good_3 = write_file("good1", [1, 2]), write_file("good2", [3]), write_file("good3", [4])
+    # text cannot be cast to bigint so a batch containing this file fails
+    bad = write_file("bad", ["not a number"])
+
+    with pipeline.destination_client() as client:
+        sql_client = client.sql_client
+        batches = ParquetTableBatches.for_credentials(sql_client.credentials)
+        # batches are scoped to the credentials of the loader
+        assert ParquetTableBatches.for_credentials(client.config.credentials) is batches
+        table_name = sql_client.make_qualified_table_name("numbers")
+        # other jobs are waiting for the table lock
+        batches.pending_files[table_name] = {good_2, bad}
+        # batch fails so the job ingests only its own file
+        DuckDbCopyJob("numbers", good_1, sql_client)
+        assert batches.pending_files[table_name] == {good_2, bad}
+        DuckDbCopyJob("numbers", good_2, sql_client)
+        assert batches.pending_files[table_name] == {bad}
+        with pytest.raises(DatabaseTerminalException):
+            DuckDbCopyJob("numbers", bad, sql_client)
+        assert table_name not in batches.pending_files
+        # successful batch ingests the files of the waiting jobs that complete without loading again
+        batches.pending_files[table_name] = {good_3}
+        DuckDbCopyJob("numbers", write_file("good4", [5]), sql_client)
+        assert batches.ingested_files == {good_3}
+        DuckDbCopyJob("numbers", good_3, sql_client)
+        assert not batches.ingested_files
+
+    assert load_table_counts(pipeline, "numbers") == {"numbers": 6}
+
+
+def test_duck_parquet_batches_released_with_credentials() -> None:
+    import gc
+    from dlt.destinations.duckdb.configuration import DuckDbCredentials
+    from dlt.destinations.duckdb.duck import ParquetTableBatches, PARQUET_BATCHES
+
+    credentials = DuckDbCredentials()
+    key = id(credentials)
+    batches = ParquetTableBatches.for_credentials(credentials)
+    assert ParquetTableBatches.for_credentials(credentials) is batches
+    assert PARQUET_BATCHES[key] is batches
+    # batches are not kept on credentials and go away with them
+    assert not hasattr(credentials, "_parquet_batches")
+    del credentials
+    gc.collect()
+    assert key not in PARQUET_BATCHES
@@ -5,6 +5,7 @@ import dlt, os
 from dlt.common.utils import uniq_id
 from dlt.common.storages.load_storage import LoadJobInfo
 from dlt.destinations.filesystem.filesystem import FilesystemClient, LoadFilesystemJob
+from dlt.destinations.filesystem.manifest import get_pending_path
 from dlt.common.schema.typing import LOADS_TABLE_NAME
 
 from tests.utils import skip_if_not_active
@@ -135,3 +136,92 @@ def test_pipeline_parquet_filesystem_destination() -> None:
     with open(other_data_files[0], "rb") as f:
         table = pq.read_table(f)
         assert table.column("value").to_pylist() == [1, 2, 3, 4, 5]
+
+
+def test_pipeline_partitioned_parquet_filesystem_destination() -> None:
+    import pyarrow.dataset as ds  # Module is evaluated by other tests
+
+    # store locally
+    os.environ['DESTINATION__FILESYSTEM__BUCKET_URL'] = "file://_storage"
+    os.environ['DESTINATION__FILESYSTEM__PARTITION_PARQUET_DATASETS'] = "true"
+    pipeline = dlt.pipeline(pipeline_name='parquet_test_' + uniq_id(), destination="filesystem",  dataset_name='parquet_test_' + uniq_id())
+
+    @dlt.resource(columns={"day": {"data_type": "text", "partition": True}})
+    def some_data():
+        yield [{'id': 1, 'day': '2023-01-01'}, {'id': 2, 'day': '2023-01-02'}, {'id': 3, 'day': '2023-01-01'}]
+
+    info = pipeline.run(some_data(), loader_file_format="parquet")
+    info.raise_on_failed_jobs()
+    pipeline.run(some_data(), loader_file_format="parquet")
+
+    client: FilesystemClient = pipeline.destination_client()  # type: ignore[assignment]
+    table_dir = posixpath.join(client.dataset_path, "some_data")
+    # one file per partition and load
+    assert len(client.fs_client.glob(posixpath.join(table_dir, "day=2023-01-01/*.parquet"))) == 2
+    assert len(client.fs_client.glob(posixpath.join(table_dir, "day=2023-01-02/*.parquet"))) == 2
+
+    table = ds.dataset(table_dir, format="parquet", partitioning="hive").to_table()
+    assert sorted(table.column("id").to_pylist()) == [1, 1, 2, 2, 3, 3]
+    assert sorted(table.column("day").to_pylist()) == ['2023-01-01'] * 4 + ['2023-01-02'] * 2
+
+    # replace removes the partition folders
+    pipeline.run(some_data(), loader_file_format="parquet", write_disposition="replace")
+    table = ds.dataset(table_dir, format="parquet", partitioning="hive").to_table()
+    assert sorted(table.column("id").to_pylist()) == [1, 2, 3]
+
+
+def test_pipeline_filesystem_table_manifests() -> None:
+    # store locally
+    os.environ['DESTINATION__FILESYSTEM__BUCKET_URL'] = "file://_storage"
+    os.environ['DESTINATION__FILESYSTEM__WRITE_TABLE_MANIFESTS'] = "true"
+    os.environ['DESTINATION__FILESYSTEM__PARTITION_PARQUET_DATASETS'] = "true"
+    pipeline = dlt.pipeline(pipeline_name='manifest_test_' + uniq_id(), destination="filesystem",  dataset_name='manifest_test_' + uniq_id())
+
+    @dlt.resource
+    def some_data():
+        yield [{'id': 1}, {'id': 2}, {'id': 3}]
+
+    @dlt.resource(columns={"day": {"data_type": "text", "partition": True}})
+    def partitioned_data():
+        yield [{'id': 1, 'day': '2023-01-01'}, {'id': 2, 'day': '2023-01-02'}, {'id': 3, 'day': '2023-01-01'}]
+
+    info1 = pipeline.run(some_data())
+    info2 = pipeline.run([some_data(), partitioned_data()], loader_file_format="parquet")
+    client: FilesystemClient = pipeline.destination_client()  # type: ignore[assignment]
+
+    # manifest lists files of both loads with row counts
+    some_data_manifest = client.get_table_manifest("some_data")
+    assert some_data_manifest["version"] == 2
+    assert [entry["load_id"] for entry in some_data_manifest["files"]] == [info1.loads_ids[0], info2.loads_ids[0]]
+    assert [entry["file_format"] for entry in some_data_manifest["files"]] == ["jsonl", "parquet"]
+    for entry in some_data_manifest["files"]:
+        assert entry["row_count"] == 3
+        assert client.fs_client.isfile(posixpath.join(client.dataset_path, entry["path"]))
+    # only parquet files have statistics
+    assert some_data_manifest["files"][1]["stats"]["id"] == {"min": 1, "max": 3}
+
+    # partitioned files have an entry per partition
+    partitioned_manifest = client.get_table_manifest("partitioned_data")
+    entries = {entry["partition_values"]["day"]: entry for entry in partitioned_manifest["files"]}
+    assert entries["2023-01-01"]["row_count"] == 2
+    assert entries["2023-01-01"]["stats"]["id"] == {"min": 1, "max": 3}
+    assert entries["2023-01-02"]["row_count"] == 1
+    for entry in partitioned_manifest["files"]:
+        assert client.fs_client.isfile(posixpath.join(client.dataset_path, entry["path"]))
+
+    # pending entries are removed when load completes
+    assert not client.fs_client.isdir(get_pending_path(client.dataset_path, info2.loads_ids[0]))
+
+    # replace drops files of previous loads
+    info3 = pipeline.run(some_data(), write_disposition="replace")
+    some_data_manifest = client.get_table_manifest("some_data")
+    assert some_data_manifest["version"] == 4
+    assert [entry["load_id"] for entry in some_data_manifest["files"]] == [info3.loads_ids[0]]
+    assert client.get_table_manifest("other_data") is None
+
+    # insert_values files have header lines that are not counted as rows
+    info4 = pipeline.run(some_data(), loader_file_format="insert_values")
+    some_data_manifest = client.get_table_manifest("some_data")
+    assert [entry["load_id"] for entry in some_data_manifest["files"]] == [info3.loads_ids[0], info4.loads_ids[0]]
+    assert some_data_manifest["files"][1]["file_format"] == "insert_values"
+    assert some_data_manifest["files"][1]["row_count"] == 3
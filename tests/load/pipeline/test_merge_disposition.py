@@ -400,3 +400,50 @@ def test_no_deduplicate_only_merge_key(destination_config: DestinationTestConfig
     assert_load_info(info)
     counts = load_table_counts(p, "duplicates_no_child")
     assert counts["duplicates_no_child"] == 2
+
+
+@pytest.mark.parametrize("destination_config", destinations_configs(default_sql_configs=True), ids=lambda x: x.name)
+def test_merge_upsert_strategy(destination_config: DestinationTestConfiguration) -> None:
+    if not destination_config.supports_merge:
+        pytest.skip("destination does not support merge")
+    p = destination_config.setup_pipeline("abstract", full_refresh=True)
+
+    @dlt.resource(write_disposition="merge", primary_key="id", merge_strategy="upsert")
+    def upserted(data):
+        yield data
+
+    info = p.run(upserted([{"id": 1, "name": "row1", "child": [1, 2, 3]}, {"id": 2, "name": "row2", "child": [4, 5]}]))
+    assert_load_info(info)
+    assert p.default_schema.get_table("upserted")["merge_strategy"] == "upsert"
+    counts = load_table_counts(p, "upserted", "upserted__child")
+    assert counts == {"upserted": 2, "upserted__child": 5}
+
+    # child row that does not belong to any loaded record is not removed
+    child_name = p.sql_client().make_qualified_table_name("upserted__child")
+    with p.sql_client() as client:
+        client.execute_sql(f"INSERT INTO {child_name} (value, _dlt_root_id, _dlt_parent_id, _dlt_list_idx, _dlt_id) VALUES (99, 'orphan', 'orphan', 0, 'orphan')")
+    # update row 1 twice (deduplicated), leave row 2 untouched, insert row 3
+    info = p.run(upserted([
+        {"id": 1, "name": "row1_a", "child": [7]},
+        {"id": 1, "name": "row1_b", "child": [8]},
+        {"id": 3, "name": "row3", "child": [9, 10]}
+    ]))
+    assert_load_info(info)
+    counts = load_table_counts(p, "upserted", "upserted__child")
+    assert counts == {"upserted": 3, "upserted__child": 6}
+    qual_name = p.sql_client().make_qualified_table_name("upserted")
+    rows = {row[0]: row[1] for row in select_data(p, f"SELECT id, name FROM {qual_name}")}
+    assert rows[1] in ("row1_a", "row1_b")
+    assert rows[2] == "row2"
+    assert rows[3] == "row3"
+    # child rows follow the upserted parent row
+    children = select_data(p, f"SELECT p.id, c.value FROM {child_name} AS c JOIN {qual_name} AS p ON c._dlt_root_id = p._dlt_id")
+    assert sorted(children) == sorted([(1, 7 if rows[1] == "row1_a" else 8), (2, 4), (2, 5), (3, 9), (3, 10)])
+
+    # upsert requires primary key and does not allow merge key
+    @dlt.resource(write_disposition="merge", merge_key="id", merge_strategy="upsert")
+    def upserted_merge_key():
+        yield {"id": 1, "name": "row1"}
+
+    info = p.run(upserted_merge_key())
+    assert info.has_failed_jobs
@@ -4,6 +4,9 @@ import pytest
 
 from dlt.common import pendulum, Wei
 from dlt.common.configuration.resolve import resolve_configuration, ConfigFieldMissingException
+from dlt.common.data_writers import DataWriter
+from dlt.common.schema.utils import new_table
+from dlt.common.storages.load_storage import ParsedLoadJobFileName
 from dlt.common.storages import FileStorage
 from dlt.common.utils import uniq_id
 
@@ -12,7 +15,7 @@ from dlt.destinations.postgres.postgres import PostgresClient
 from dlt.destinations.postgres.sql_client import psycopg2
 
 from tests.utils import TEST_STORAGE_ROOT, delete_test_storage, skipifpypy, preserve_environ
-from tests.load.utils import expect_load_file, prepare_table, yield_client_with_storage
+from tests.load.utils import TABLE_UPDATE, TABLE_UPDATE_COLUMNS_SCHEMA, TABLE_ROW_ALL_DATA_TYPES, assert_all_data_types_row, expect_load_file, prepare_table, yield_client_with_storage
 from tests.common.configuration.utils import environment
 
 
@@ -79,3 +82,20 @@ def test_wei_value(client: PostgresClient, file_storage: FileStorage) -> None:
     insert_sql = "INSERT INTO {}(_dlt_id, _dlt_root_id, sender_id, timestamp, parse_data__metadata__rasa_x_id)\nVALUES\n"
     insert_values = f"('{uniq_id()}', '{uniq_id()}', '90238094809sajlkjxoiewjhduuiuehd', '{str(pendulum.now())}', {Wei.from_int256(2*256-1, 78)});"
     expect_load_file(client, file_storage, insert_sql+insert_values, user_table_name)
+
+
+def test_copy_jsonl(client: PostgresClient, file_storage: FileStorage) -> None:
+    table_name = "event_test_table" + uniq_id()
+    client.schema.update_table(new_table(table_name, columns=TABLE_UPDATE))
+    client.schema.bump_version()
+    client.update_stored_schema()
+    # write the row with all data types, including nulls and escaped characters, into jsonl file
+    file_name = ParsedLoadJobFileName(table_name, uniq_id(), 0, "jsonl").job_id()
+    with file_storage.open_file(file_name, "wb") as f:
+        writer = DataWriter.from_file_format("jsonl", f)
+        writer.write_all(TABLE_UPDATE_COLUMNS_SCHEMA, [TABLE_ROW_ALL_DATA_TYPES])
+    job = client.start_file_load(client.get_load_table(table_name), file_storage.make_full_path(file_name), uniq_id())
+    assert job.state() == "completed"
+    canonical_name = client.sql_client.make_qualified_table_name(table_name)
+    db_row = list(client.sql_client.execute_sql(f"SELECT * FROM {canonical_name}")[0])
+    assert_all_data_types_row(db_row)
@@ -1,3 +1,4 @@
+import os
 import pytest
 from typing import Iterator
 
@@ -7,7 +8,9 @@ from dlt.common.utils import uniq_id
 
 from dlt.destinations.qdrant.qdrant_adapter import qdrant_adapter, VECTORIZE_HINT
 from dlt.destinations.qdrant.qdrant_client import QdrantClient
+from dlt.destinations.embedding_cache import EmbeddingCache
 from tests.pipeline.utils import assert_load_info
+from tests.utils import TEST_STORAGE_ROOT
 from tests.load.qdrant.utils import drop_active_pipeline_data, assert_collection
 
 @pytest.fixture(autouse=True)
@@ -346,3 +349,59 @@ def test_empty_dataset_allowed() -> None:
     assert client.sentinel_collection == "DltSentinelCollection"
     assert_collection(p, "content", expected_items_count=3)
 
+
+
+def test_load_in_chunks() -> None:
+    # file is embedded and uploaded in chunks smaller than the number of rows
+    os.environ["DESTINATION__QDRANT__LOAD_CHUNK_SIZE"] = "4"
+    data = [{"doc_id": i, "content": str(i)} for i in range(10)]
+
+    @dlt.resource(primary_key="doc_id", write_disposition="merge")
+    def some_data():
+        yield data
+
+    qdrant_adapter(
+        some_data,
+        embed=["content"],
+    )
+
+    pipeline = dlt.pipeline(
+        pipeline_name="test_load_in_chunks",
+        destination="qdrant",
+        dataset_name="TestLoadInChunks" + uniq_id(),
+    )
+    info = pipeline.run(
+        some_data(),
+    )
+    assert_load_info(info)
+    assert_collection(pipeline, "some_data", items=data)
+
+
+def test_embedding_cache() -> None:
+    cache_path = os.path.join(TEST_STORAGE_ROOT, "embeddings_" + uniq_id() + ".db")
+    os.environ["DESTINATION__QDRANT__EMBEDDING_CACHE_PATH"] = cache_path
+    data = [{"doc_id": i, "content": str(i)} for i in range(3)]
+
+    @dlt.resource(primary_key="doc_id", write_disposition="merge")
+    def some_data():
+        yield data
+
+    qdrant_adapter(
+        some_data,
+        embed=["content"],
+    )
+
+    pipeline = dlt.pipeline(
+        pipeline_name="test_embedding_cache",
+        destination="qdrant",
+        dataset_name="TestEmbeddingCache" + uniq_id(),
+    )
+    assert_load_info(pipeline.run(some_data()))
+    # embedding document is the content of the embedded field
+    with EmbeddingCache(cache_path, pipeline.destination_client().config.model, 100) as cache:  # type: ignore[attr-defined]
+        cached = cache.get([item["content"] for item in data])
+    assert all(embedding is not None for embedding in cached)
+
+    # second load takes embeddings from cache
+    assert_load_info(pipeline.run(some_data()))
+    assert_collection(pipeline, "some_data", items=data)
@@ -1,12 +1,13 @@
 import shutil
 import os
 from concurrent.futures import ThreadPoolExecutor
+import time
 from time import sleep
-from typing import List, Sequence, Tuple
+from typing import Any, List, Sequence, Set, Tuple
 import pytest
 from unittest.mock import patch
 
-from dlt.common.exceptions import TerminalException, TerminalValueError
+from dlt.common.exceptions import DestinationUndefinedEntity, TerminalException, TerminalValueError
 from dlt.common.schema import Schema
 from dlt.common.storages import FileStorage, LoadStorage
 from dlt.common.storages.load_storage import JobWithUnsupportedWriterException
@@ -220,12 +221,17 @@ def test_spool_job_retry_spool_new() -> None:
         load.load_storage,
         NORMALIZED_FILES
     )
-    # call higher level function that returns jobs and counts
+    # call higher level function that submits jobs to the pool
     with ThreadPoolExecutor() as pool:
         load.pool = pool
-        jobs_count, jobs = load.spool_new_jobs(load_id, schema)
-        assert jobs_count == 2
-        assert len(jobs) == 2
+        spooled_jobs: Set[str] = set()
+        futures = load.submit_new_jobs(load_id, schema, load.config.workers, spooled_jobs)
+        assert len(futures) == 2
+        assert len(spooled_jobs) == 2
+        for future in futures:
+            assert future.result().state() == "retry"
+        # jobs spooled in this run are not submitted again
+        assert load.submit_new_jobs(load_id, schema, load.config.workers, spooled_jobs) == []
 
 
 def test_spool_job_retry_started() -> None:
@@ -287,8 +293,8 @@ def test_try_retrieve_job() -> None:
         NORMALIZED_FILES
     )
     load.pool = ThreadPoolExecutor()
-    jobs_count, jobs = load.spool_new_jobs(load_id, schema)
-    assert jobs_count == 2
+    futures = load.submit_new_jobs(load_id, schema, load.config.workers, set())
+    assert len([future.result() for future in futures]) == 2
     # now jobs are known
     with load.destination.client(schema, load.initial_client_config) as c:
         job_count, jobs = load.retrieve_jobs(c, load_id)
@@ -349,6 +355,7 @@ def test_retry_on_new_loop() -> None:
 
 
 def test_retry_exceptions() -> None:
+    os.environ["LOAD__MAX_RETRY_DELAY"] = "0.1"
     load = setup_loader(client_config=DummyClientConfiguration(retry_prob=1.0))
     prepare_load_package(
         load.load_storage,
@@ -370,6 +377,35 @@ def test_retry_exceptions() -> None:
         assert py_ex.value.max_retry_count * 2 == py_ex.value.retry_count == 10
 
 
+def test_retry_delay() -> None:
+    os.environ["LOAD__MIN_RETRY_DELAY"] = "1.0"
+    os.environ["LOAD__MAX_RETRY_DELAY"] = "4.0"
+    load = setup_loader(client_config=DummyClientConfiguration(retry_prob=1.0))
+    # delay doubles with each retry up to max, jitter takes up to a half
+    for retry_count, max_delay in [(1, 1.0), (2, 2.0), (3, 4.0), (10, 4.0)]:
+        assert max_delay / 2 <= load.get_retry_delay(retry_count) <= max_delay
+    load_id, _ = prepare_load_package(
+        load.load_storage,
+        NORMALIZED_FILES
+    )
+    with ThreadPoolExecutor() as pool:
+        load.run(pool)
+    # retried jobs are not ready to start before the delay passes
+    assert len(load.load_storage.list_new_jobs(load_id)) == 2
+    assert len(load.load_storage.list_new_jobs(load_id, ready_at=time.time())) == 0
+    for fn in load.load_storage.list_new_jobs(load_id):
+        not_before = load.load_storage.get_job_not_before(load_id, FileStorage.get_file_name_from_file_path(fn))
+        assert time.time() < not_before <= time.time() + 1.0
+    assert len(load.load_storage.list_new_jobs(load_id, ready_at=time.time() + 1.0)) == 2
+    # next run waits for the delayed jobs and retries them again
+    started_at = time.time()
+    with ThreadPoolExecutor() as pool:
+        load.run(pool)
+    assert time.time() - started_at >= 0.4
+    for fn in load.load_storage.list_new_jobs(load_id):
+        assert LoadStorage.parse_job_file_name(fn).retry_count == 2
+
+
 def test_load_single_thread() -> None:
     os.environ["LOAD__WORKERS"] = "1"
     load = setup_loader(client_config=DummyClientConfiguration(completed_prob=1.0))
@@ -385,6 +421,201 @@ def test_load_single_thread() -> None:
     assert not load.load_storage.storage.has_folder(load.load_storage.get_normalized_package_path(load_id))
 
 
+def test_sliding_window_spool() -> None:
+    os.environ["LOAD__WORKERS"] = "1"
+    load = setup_loader(client_config=DummyClientConfiguration(completed_prob=1.0))
+    load_id, _ = prepare_load_package(
+        load.load_storage,
+        NORMALIZED_FILES
+    )
+    # largest files are started first
+    files = load.load_storage.list_new_jobs(load_id, largest_first=True)
+    sizes = [os.path.getsize(load.load_storage.storage.make_full_path(f)) for f in files]
+    assert sizes == sorted(sizes, reverse=True)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        # single worker slot is reused within one run so all jobs get loaded
+        load.run(pool)
+        package_info = load.load_storage.get_load_package_info(load_id)
+        assert len(package_info.jobs["new_jobs"]) == 0
+        assert len(package_info.jobs["started_jobs"]) == 0
+        assert len(package_info.jobs["completed_jobs"]) == 2
+        # complete package
+        load.run(pool)
+    assert not load.load_storage.storage.has_folder(load.load_storage.get_normalized_package_path(load_id))
+
+
+def test_poll_jobs_in_batch() -> None:
+    load = setup_loader(client_config=DummyClientConfiguration(completed_prob=1.0))
+    load_id, schema = prepare_load_package(
+        load.load_storage,
+        NORMALIZED_FILES
+    )
+    jobs = [Load.w_spool_job(load, f, load_id, schema) for f in load.load_storage.list_new_jobs(load_id)]
+    with patch.object(dummy_impl.DummyClient, "poll_jobs", autospec=True, side_effect=lambda client, jobs: [job.state() for job in jobs]) as poll_jobs:
+        with patch.object(dummy_impl.DummyClient, "__enter__", autospec=True, side_effect=lambda client: client) as enter_client:
+            remaining_jobs = load.complete_jobs(load_id, jobs, schema)
+    assert len(remaining_jobs) == 0
+    # all jobs polled with a single call
+    poll_jobs.assert_called_once()
+    assert poll_jobs.call_args[0][1] == jobs
+    # jobs are polled within the client context
+    enter_client.assert_called_once()
+    assert enter_client.call_args[0][0] is poll_jobs.call_args[0][0]
+
+
+def test_poll_jobs_without_client() -> None:
+    load = setup_loader(client_config=DummyClientConfiguration(completed_prob=1.0))
+    load_id, schema = prepare_load_package(
+        load.load_storage,
+        NORMALIZED_FILES
+    )
+    jobs = [Load.w_spool_job(load, f, load_id, schema) for f in load.load_storage.list_new_jobs(load_id)]
+    # client that does not poll in batch is not entered to poll the jobs
+    with patch.object(dummy_impl.DummyClient, "__enter__", autospec=True, side_effect=lambda client: client) as enter_client:
+        remaining_jobs = load.complete_jobs(load_id, jobs, schema)
+    assert len(remaining_jobs) == 0
+    enter_client.assert_not_called()
+
+
+def test_poll_interval_backoff() -> None:
+    os.environ["LOAD__MIN_POLL_INTERVAL"] = "0.05"
+    os.environ["LOAD__MAX_POLL_INTERVAL"] = "0.4"
+    # jobs keep running until they time out
+    load = setup_loader(client_config=DummyClientConfiguration(timeout=1.0))
+    prepare_load_package(
+        load.load_storage,
+        NORMALIZED_FILES
+    )
+    intervals: List[float] = []
+
+    def _wait(*args: Any, timeout: float = None, **kwargs: Any) -> Any:
+        intervals.append(timeout)
+        sleep(timeout)
+        return set(), set()
+
+    with patch("dlt.load.load.wait_for_futures", side_effect=_wait):
+        with patch("dlt.load.load.sleep", side_effect=lambda interval: _wait(timeout=interval)):
+            with ThreadPoolExecutor() as pool:
+                load.run(pool)
+    # interval doubles while jobs keep running and stops at max, it is reset when jobs get started
+    assert intervals[-1] == 0.4
+    for prev, interval in zip(intervals, intervals[1:]):
+        assert interval in (0.05, min(prev * 2, 0.4))
+
+
+def test_parallel_packages() -> None:
+    os.environ["LOAD__MAX_PARALLEL_PACKAGES"] = "3"
+    load = setup_loader(client_config=DummyClientConfiguration(completed_prob=1.0))
+    load_ids = sorted(prepare_load_package(load.load_storage, NORMALIZED_FILES)[0] for _ in range(3))
+    with ThreadPoolExecutor() as pool:
+        # append only packages are loaded together
+        load.run(pool)
+        for load_id in load_ids:
+            package_info = load.load_storage.get_load_package_info(load_id)
+            assert len(package_info.jobs["completed_jobs"]) == 2
+        # all packages are completed in the next run
+        metrics = load.run(pool)
+    assert metrics.pending_items == 0
+    assert load.load_storage.list_normalized_packages() == []
+    assert list(load._processed_load_ids.keys()) == load_ids
+
+
+def test_parallel_packages_ordering() -> None:
+    os.environ["LOAD__MAX_PARALLEL_PACKAGES"] = "3"
+    load = setup_loader()
+    load_id, schema = prepare_load_package(load.load_storage, NORMALIZED_FILES)
+    append_load_id, _ = prepare_load_package(load.load_storage, NORMALIZED_FILES)
+    replace_load_id, _ = prepare_load_package(load.load_storage, NORMALIZED_FILES, write_disposition="replace")
+    later_load_id, _ = prepare_load_package(load.load_storage, NORMALIZED_FILES)
+    # packages that replace the same tables are not loaded together, later packages wait as well
+    assert [p[0] for p in load.get_concurrent_packages(load_id, schema, [append_load_id, replace_load_id, later_load_id])] == [append_load_id]
+    # tables of the whole chain are taken into account
+    package_tables = load._get_package_tables(replace_load_id, load.load_storage.load_package_schema(replace_load_id))
+    assert package_tables[(schema.name, "event_user")] == "replace"
+    assert package_tables[(schema.name, "event_loop_interrupted")] == "replace"
+
+
+def test_parallel_packages_complete_in_order() -> None:
+    os.environ["LOAD__MAX_PARALLEL_PACKAGES"] = "3"
+    load = setup_loader(client_config=DummyClientConfiguration(completed_prob=1.0))
+    load_id, completed_load_id = sorted(prepare_load_package(load.load_storage, NORMALIZED_FILES)[0] for _ in range(2))
+    # all jobs of the second package are already completed
+    for job_file in load.load_storage.list_new_jobs(completed_load_id):
+        file_name = FileStorage.get_file_name_from_file_path(job_file)
+        load.load_storage.start_job(completed_load_id, file_name)
+        load.load_storage.complete_job(completed_load_id, file_name)
+    completed_packages: List[str] = []
+    complete_package = load.complete_package
+
+    def _complete_package(load_id: str, schema: Schema, aborted: bool = False) -> None:
+        completed_packages.append(load_id)
+        complete_package(load_id, schema, aborted)
+
+    with patch.object(load, "complete_package", side_effect=_complete_package):
+        run_all(load)
+    assert completed_packages == [load_id, completed_load_id]
+
+
+def test_skip_confirmed_schema_sync() -> None:
+    load = setup_loader(client_config=DummyClientConfiguration(completed_prob=1.0))
+    with patch.object(dummy_impl.DummyClient, "update_stored_schema", return_value={}) as update_stored_schema:
+        prepare_load_package(load.load_storage, NORMALIZED_FILES)
+        run_all(load)
+        assert update_stored_schema.call_count == 1
+        confirmed_schemas = load.load_storage.get_confirmed_schemas()
+        assert len(confirmed_schemas) == 1
+        # package with the same schema version does not sync the schema
+        load_id, schema = prepare_load_package(load.load_storage, NORMALIZED_FILES)
+        assert list(confirmed_schemas.values()) == [schema.stored_version_hash]
+        run_all(load)
+        assert update_stored_schema.call_count == 1
+        # schema update was still committed
+        assert load.load_storage.get_load_package_info(load_id).schema_update == {}
+
+    # failed jobs invalidate the confirmations
+    load = setup_loader(client_config=DummyClientConfiguration(fail_prob=1.0))
+    prepare_load_package(load.load_storage, NORMALIZED_FILES)
+    run_all(load)
+    assert load.load_storage.get_confirmed_schemas() == {}
+
+
+def test_resync_schema_on_missing_tables() -> None:
+    os.environ["LOAD__MIN_RETRY_DELAY"] = "0.1"
+    load = setup_loader(client_config=DummyClientConfiguration(completed_prob=1.0))
+    prepare_load_package(load.load_storage, NORMALIZED_FILES)
+    run_all(load)
+    start_file_load = dummy_impl.DummyClient.start_file_load
+    missing_tables = set(NORMALIZED_FILES)
+
+    def _start_file_load(client: dummy_impl.DummyClient, table: Any, file_path: str, load_id: str) -> LoadJob:
+        # tables were dropped at the destination until the schema is synced again
+        if update_stored_schema.call_count == 0 and FileStorage.get_file_name_from_file_path(file_path) in missing_tables:
+            missing_tables.remove(FileStorage.get_file_name_from_file_path(file_path))
+            raise DestinationUndefinedEntity("table dropped")
+        return start_file_load(client, table, file_path, load_id)
+
+    with patch.object(dummy_impl.DummyClient, "update_stored_schema", return_value={}) as update_stored_schema:
+        with patch.object(dummy_impl.DummyClient, "start_file_load", autospec=True, side_effect=_start_file_load):
+            load_id, _ = prepare_load_package(load.load_storage, NORMALIZED_FILES)
+            run_all(load)
+    # jobs were retried after the schema sync and did not fail
+    assert not missing_tables
+    assert update_stored_schema.call_count == 1
+    package_info = load.load_storage.get_load_package_info(load_id)
+    assert package_info.state == "loaded"
+    assert len(package_info.jobs["completed_jobs"]) == len(NORMALIZED_FILES)
+    assert len(package_info.jobs["failed_jobs"]) == 0
+    assert len(load.load_storage.get_confirmed_schemas()) == 1
+
+    # missing tables of a package that synced its schema fail the jobs
+    load = setup_loader(client_config=DummyClientConfiguration(completed_prob=1.0))
+    with patch.object(dummy_impl.DummyClient, "start_file_load", side_effect=DestinationUndefinedEntity("table dropped")):
+        load_id, _ = prepare_load_package(load.load_storage, NORMALIZED_FILES)
+        run_all(load)
+    package_info = load.load_storage.get_load_package_info(load_id)
+    assert len(package_info.jobs["failed_jobs"]) == len(NORMALIZED_FILES)
+
+
 def test_wrong_writer_type() -> None:
     load = setup_loader()
     load_id, _ = prepare_load_package(
@@ -124,9 +124,10 @@ def test_query_split(client: InsertValuesJobClient, file_storage: FileStorage) -
     assert mocked_fragments.call_count == 10
     for idx, call in enumerate(mocked_fragments.call_args_list):
         fragment:List[str] = call.args[0]
-        # last elem of fragment is a data list, first element is id, and must end with ;\n
-        assert fragment[-1].startswith(f"'{idx}'")
-        assert fragment[-1].endswith(");")
+        # values start with id and statement must end with ;
+        statement = "".join(fragment)
+        assert f"VALUES\n('{idx}'" in statement
+        assert statement.endswith(");")
     assert_load_with_max_query(client, file_storage, 10, 2)
 
     start_idx = insert_sql.find("S\n(")
@@ -157,6 +158,24 @@ def test_query_split(client: InsertValuesJobClient, file_storage: FileStorage) -
     assert mocked_fragments.call_count == 1
 
 
+@pytest.mark.parametrize("client", destinations_configs(default_sql_configs=True, subset=["duckdb"]), indirect=True, ids=lambda x: x.name)
+def test_max_rows_split(client: InsertValuesJobClient, file_storage: FileStorage) -> None:
+    mocked_caps = client.sql_client.__class__.capabilities
+    insert_sql = prepare_insert_statement(10)
+    # each INSERT gets at most 3 rows, single query contains all statements
+    with patch.object(mocked_caps, "max_rows_per_insert", 4), patch.object(client.sql_client, "execute_fragments") as mocked_fragments:
+        user_table_name = prepare_table(client)
+        expect_load_file(client, file_storage, insert_sql, user_table_name)
+    assert mocked_fragments.call_count == 1
+    statements = "".join(mocked_fragments.call_args.args[0]).split("INSERT INTO ")[1:]
+    assert [statement.count("\n(") for statement in statements] == [3, 3, 3, 1]
+    assert all(statement.rstrip().endswith(");") for statement in statements)
+    # load and check for real
+    with patch.object(mocked_caps, "max_rows_per_insert", 4):
+        assert_load_with_max_query(client, file_storage, 10, 2)
+        assert_load_with_max_query(client, file_storage, 10, mocked_caps.max_query_length)
+
+
 def assert_load_with_max_query(client: InsertValuesJobClient, file_storage: FileStorage, insert_lines: int, max_query_length: int) -> None:
     # load and check for real
     mocked_caps = client.sql_client.__class__.capabilities
@@ -241,6 +241,35 @@ def test_schema_update_alter_table(client: SqlJobClientBase) -> None:
         assert storage_table["col4"]["data_type"] == "timestamp"
 
 
+@pytest.mark.parametrize("client", destinations_configs(default_sql_configs=True), indirect=True, ids=lambda x: x.name)
+def test_get_storage_tables(client: SqlJobClientBase) -> None:
+    schema = client.schema
+    table_names = ["event_test_table" + uniq_id() for _ in range(3)]
+    schema.update_table(new_table(table_names[0], columns=[schema._infer_column("col1", "string")]))
+    schema.update_table(new_table(table_names[1], columns=[schema._infer_column("col1", "string"), schema._infer_column("col2", 1)]))
+    schema.bump_version()
+    client.update_stored_schema()
+    # all tables are retrieved with a single query
+    with patch.object(client.sql_client, "execute_sql", wraps=client.sql_client.execute_sql) as execute_sql:
+        storage_tables = client.get_storage_tables(table_names)
+        if client.config.destination_name != "bigquery":
+            assert execute_sql.call_count == 1
+    assert list(storage_tables.keys()) == table_names
+    assert list(storage_tables[table_names[0]].keys()) == ["col1"]
+    assert list(storage_tables[table_names[1]].keys()) == ["col1", "col2"]
+    assert storage_tables[table_names[1]]["col2"]["data_type"] == "bigint"
+    # table does not exist
+    assert storage_tables[table_names[2]] == {}
+    assert client.get_storage_tables([]) == {}
+    if client.config.destination_name != "bigquery":
+        # table names are split into chunks to not exceed max query parameters
+        db_params_count = len(client.sql_client.fully_qualified_dataset_name(escape=False).split(".", 2))
+        with patch.object(client.capabilities, "max_query_parameters", db_params_count + 1):
+            with patch.object(client.sql_client, "execute_sql", wraps=client.sql_client.execute_sql) as execute_sql:
+                assert client.get_storage_tables(table_names) == storage_tables
+                assert execute_sql.call_count == len(table_names)
+
+
 @pytest.mark.parametrize("client", destinations_configs(default_sql_configs=True), indirect=True, ids=lambda x: x.name)
 def test_drop_tables(client: SqlJobClientBase) -> None:
     schema = client.schema
@@ -1,6 +1,7 @@
 import pytest
 import datetime  # noqa: I251
 from typing import Iterator, Any
+from unittest.mock import patch
 from threading import Thread, Event
 from time import sleep
 
@@ -11,7 +12,7 @@ from dlt.common.storages import FileStorage
 from dlt.common.utils import derives_from_class_of_name, uniq_id
 from dlt.destinations.exceptions import DatabaseException, DatabaseTerminalException, DatabaseTransientException, DatabaseUndefinedRelation
 
-from dlt.destinations.sql_client import DBApiCursor, SqlClientBase
+from dlt.destinations.sql_client import DBApiCursor, SqlClientBase, SqlConnectionPool
 from dlt.destinations.job_client_impl import SqlJobClientBase
 from dlt.destinations.typing import TNativeConn
 from dlt.common.time import ensure_pendulum_datetime
@@ -452,6 +453,60 @@ def test_recover_on_explicit_tx(client: SqlJobClientBase) -> None:
     assert_load_id(client.sql_client, "HJK")
 
 
+@pytest.mark.parametrize("client", destinations_configs(default_sql_configs=True), indirect=True, ids=lambda x: x.name)
+def test_connection_pool(client: SqlJobClientBase) -> None:
+    client_type = type(client.sql_client)
+    if not client_type.supports_connection_pooling:
+        pytest.skip("Destination does not support connection pooling")
+
+    def _pooled_client(dataset_name: str) -> SqlClientBase[Any]:
+        sql_client = client_type(dataset_name, client.sql_client.credentials)
+        sql_client.connection_pool = pool
+        return sql_client
+
+    pool = SqlConnectionPool()
+    dataset_name = client.sql_client.dataset_name
+    c1 = _pooled_client(dataset_name)
+    with c1:
+        native_connection = c1.native_connection
+        assert c1.execute_sql("SELECT 1") == [(1,)]
+    # connection is kept in the pool
+    assert c1.native_connection is None
+    c2 = _pooled_client(dataset_name)
+    with c2:
+        # connection is reused
+        assert c2.native_connection is native_connection
+        assert c2.execute_sql("SELECT 1") == [(1,)]
+        # pool is empty so new connection is opened
+        with _pooled_client(dataset_name) as c3:
+            assert c3.native_connection is not native_connection
+    # connections are not shared between datasets
+    with _pooled_client("other_" + dataset_name) as c4:
+        assert c4.native_connection is not native_connection
+    # broken connections are not reused
+    with patch.object(client_type, "is_connection_alive", return_value=False):
+        with _pooled_client(dataset_name) as c5:
+            assert c5.native_connection is not native_connection
+            reused_connection = c5.native_connection
+    # client that released a connection to the pool uses another connection
+    c7 = _pooled_client(dataset_name)
+    with c7:
+        pooled_connection = c7.native_connection
+    c7.open_connection()
+    in_use_connection = c7.native_connection
+    assert in_use_connection is not pooled_connection
+    # close all connections, new ones are not pooled
+    pool.close()
+    # connection in use is not closed by the pool
+    assert c7.native_connection is in_use_connection
+    assert c7.execute_sql("SELECT 1") == [(1,)]
+    c7.close_connection()
+    with _pooled_client(dataset_name) as c6:
+        assert c6.native_connection is not reused_connection
+    assert c6.native_connection is None
+    assert pool._idle == {}
+
+
 def assert_load_id(sql_client: SqlClientBase[TNativeConn], load_id: str) -> None:
     # and data is actually committed when connection reopened
     sql_client.close_connection()
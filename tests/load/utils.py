@@ -196,8 +196,16 @@ def load_table(name: str) -> Dict[str, TTableSchemaColumns]:
         return json.load(f)
 
 
+def text_loader_file_format(client: JobClientBase) -> TLoaderFileFormat:
+    """Returns preferred loader file format of `client` or `insert_values` if binary parquet is preferred. Tests write load files as text."""
+    caps = client.capabilities
+    if caps.preferred_loader_file_format == "parquet" and "insert_values" in caps.supported_loader_file_formats:
+        return "insert_values"
+    return caps.preferred_loader_file_format
+
+
 def expect_load_file(client: JobClientBase, file_storage: FileStorage, query: str, table_name: str, status = "completed") -> LoadJob:
-    file_name = ParsedLoadJobFileName(table_name, uniq_id(), 0, client.capabilities.preferred_loader_file_format).job_id()
+    file_name = ParsedLoadJobFileName(table_name, uniq_id(), 0, text_loader_file_format(client)).job_id()
     file_storage.save(file_name, query.encode("utf-8"))
     table = client.get_load_table(table_name)
     job = client.start_file_load(table, file_storage.make_full_path(file_name), uniq_id())
@@ -312,11 +320,12 @@ def cm_yield_client_with_storage(
 
 
 def write_dataset(client: JobClientBase, f: IO[bytes], rows: Union[List[Dict[str, Any]], List[StrAny]], columns_schema: TTableSchemaColumns) -> None:
-    data_format = DataWriter.data_format_from_file_format(client.capabilities.preferred_loader_file_format)
+    file_format = text_loader_file_format(client)
+    data_format = DataWriter.data_format_from_file_format(file_format)
     # adapt bytes stream to text file format
     if not data_format.is_binary_format and isinstance(f.read(0), bytes):
         f = codecs.getwriter("utf-8")(f)  # type: ignore[assignment]
-    writer = DataWriter.from_destination_capabilities(client.capabilities, f)
+    writer = DataWriter.from_file_format(file_format, f, client.capabilities)
     # remove None values
     for idx, row in enumerate(rows):
         rows[idx] = {k:v for k, v in row.items() if v is not None}
@@ -10,7 +10,7 @@ from dlt.common.schema.typing import TWriteDisposition, TColumnSchema, TTableSch
 
 from dlt.destinations import weaviate
 from dlt.destinations.weaviate.exceptions import PropertyNameConflict
-from dlt.destinations.weaviate.weaviate_client import WeaviateClient
+from dlt.destinations.weaviate.weaviate_client import WeaviateClient, generate_uuid5
 
 from dlt.common.storages.file_storage import FileStorage
 from dlt.common.schema.utils import new_table
@@ -59,6 +59,14 @@ def file_storage() -> FileStorage:
     return FileStorage(TEST_STORAGE_ROOT, file_type="b", makedirs=True)
 
 
+def test_generate_uuid5() -> None:
+    from weaviate.util import generate_uuid5 as weaviate_generate_uuid5
+
+    # uuids must stay identical to weaviate ones so merge keeps replacing existing objects
+    for identifier, namespace in [("1", "Class"), ("1_a", "Class"), ("żółw", "ClassŁ"), ("", "")]:
+        assert generate_uuid5(identifier, namespace) == weaviate_generate_uuid5(identifier, namespace)
+
+
 @pytest.mark.parametrize('write_disposition', ["append", "replace", "merge"])
 def test_all_data_types(client: WeaviateClient, write_disposition: TWriteDisposition, file_storage: FileStorage) -> None:
     class_name = "AllTypes"
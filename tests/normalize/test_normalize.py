@@ -1,3 +1,4 @@
+import gzip
 import pytest
 from fnmatch import fnmatch
 from typing import Dict, Iterator, List, Sequence, Tuple
@@ -10,7 +11,8 @@ from dlt.common.schema.schema import Schema
 from dlt.common.utils import uniq_id
 from dlt.common.typing import StrAny
 from dlt.common.data_types import TDataType
-from dlt.common.storages import NormalizeStorage, LoadStorage
+from dlt.common.destination import TLoaderFileFormat
+from dlt.common.storages import NormalizeStorage, LoadStorage, FileStorage
 from dlt.common.destination import DestinationCapabilitiesContext
 from dlt.common.configuration.container import Container
 
@@ -243,8 +245,11 @@ def test_normalize_many_schemas(caps: DestinationCapabilitiesContext, rasa_norma
 
 
 @pytest.mark.parametrize("caps", ALL_CAPABILITIES, indirect=True)
-def test_normalize_typed_json(caps: DestinationCapabilitiesContext, raw_normalize: Normalize) -> None:
-    extract_items(raw_normalize.normalize_storage, [JSON_TYPED_DICT], "special", "special")
+@pytest.mark.parametrize("file_format", ["puae-jsonl", "msgpack"])
+def test_normalize_typed_json(caps: DestinationCapabilitiesContext, raw_normalize: Normalize, file_format: TLoaderFileFormat) -> None:
+    if file_format == "msgpack":
+        pytest.importorskip("msgpack")
+    extract_items(raw_normalize.normalize_storage, [JSON_TYPED_DICT], "special", "special", file_format)
     with ThreadPoolExecutor(max_workers=1) as pool:
         raw_normalize.run(pool)
     loads = raw_normalize.load_storage.list_normalized_packages()
@@ -332,6 +337,50 @@ def test_normalize_twice_with_flatten(caps: DestinationCapabilitiesContext, raw_
     assert_schema(schema)
 
 
+@pytest.mark.parametrize("caps", ALL_CAPABILITIES, indirect=True)
+def test_compact_load_package(caps: DestinationCapabilitiesContext, raw_normalize: Normalize) -> None:
+    raw_normalize.config.max_compacted_file_size = 1024 * 1024
+    for idx in range(3):
+        extract_items(raw_normalize.normalize_storage, [{"str": "text", "int": idx}, {"str": "more text", "int": idx}], "compaction", "doc")
+    # each worker writes own files
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        raw_normalize.run(pool)
+    load_id = raw_normalize.load_storage.list_normalized_packages()[0]
+    _, table_files = expect_load_package(raw_normalize.load_storage, load_id, ["doc"])
+    assert len(table_files["doc"]) == 1
+    with raw_normalize.load_storage.storage.open_file(table_files["doc"][0]) as f:
+        lines = f.read().splitlines()
+    if caps.preferred_loader_file_format == "insert_values":
+        # single INSERT statement with all the values
+        assert lines[0].startswith("INSERT INTO {}(")
+        assert lines[1] == "VALUES"
+        assert all(line.endswith(",") for line in lines[2:-1])
+        assert lines[-1].endswith(";")
+        lines = lines[2:]
+    assert len(lines) == 6
+
+    if caps.preferred_loader_file_format == "insert_values":
+        # files of tables without rows have just a header and may be concatenated with other files in any order
+        storage = raw_normalize.load_storage.storage
+        data_file = storage.make_full_path(table_files["doc"][0])
+        with FileStorage.open_zipsafe_ro(data_file, "r", encoding="utf-8") as f:
+            header = f.readline()
+        empty_file = storage.make_full_path("empty.insert_values")
+        open_f = gzip.open if FileStorage.is_gzipped(data_file) else open
+        with open_f(empty_file, "wt", encoding="utf-8") as f:
+            f.write(header + "VALUES\n")
+        compacted_file = storage.make_full_path("compacted.insert_values")
+        for file_paths in ([empty_file, data_file], [data_file, empty_file], [empty_file, data_file, empty_file]):
+            LoadStorage._concat_job_files("insert_values", file_paths, compacted_file)
+            with FileStorage.open_zipsafe_ro(compacted_file, "r", encoding="utf-8") as f:
+                compacted_lines = f.read().splitlines()
+            assert compacted_lines[1] == "VALUES"
+            assert all(line.startswith("(") for line in compacted_lines[2:])
+            assert all(line.endswith(",") for line in compacted_lines[2:-1])
+            assert compacted_lines[-1].endswith(");")
+            assert len(compacted_lines) == 8
+
+
 def test_group_worker_files() -> None:
 
     files = ["f%03d" % idx for idx in range(0, 100)]
@@ -361,10 +410,10 @@ EXPECTED_USER_TABLES = ["event", "event__parse_data__intent_ranking", "event__pa
          "event__parse_data__response_selector__default__response__responses"]
 
 
-def extract_items(normalize_storage: NormalizeStorage, items: Sequence[StrAny], schema_name: str, table_name: str) -> None:
+def extract_items(normalize_storage: NormalizeStorage, items: Sequence[StrAny], schema_name: str, table_name: str, file_format: TLoaderFileFormat = "puae-jsonl") -> None:
     extractor = ExtractorStorage(normalize_storage.config)
     extract_id = extractor.create_extract_id()
-    extractor.write_data_item("puae-jsonl", extract_id, schema_name, table_name, items, None)
+    extractor.write_data_item(file_format, extract_id, schema_name, table_name, items, None)
     extractor.close_writers(extract_id)
     extractor.commit_extract_files(extract_id)
 
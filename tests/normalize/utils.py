@@ -1,12 +1,20 @@
 from typing import Mapping, cast
 
-from dlt.destinations.duckdb import capabilities as duck_insert_caps
+from dlt.common.destination import DestinationCapabilitiesContext
+from dlt.destinations.duckdb import capabilities as duck_caps
 from dlt.destinations.redshift import capabilities as rd_insert_caps
 from dlt.destinations.postgres import capabilities as pg_insert_caps
 from dlt.destinations.bigquery import capabilities as jsonl_caps
 from dlt.destinations.filesystem import capabilities as filesystem_caps
 
 
+def duck_insert_caps() -> DestinationCapabilitiesContext:
+    # duckdb prefers parquet if pyarrow is installed
+    caps = duck_caps()
+    caps.preferred_loader_file_format = "insert_values"
+    return caps
+
+
 DEFAULT_CAPS = pg_insert_caps
 INSERT_CAPS = [duck_insert_caps, rd_insert_caps, pg_insert_caps]
 JSONL_CAPS = [jsonl_caps, filesystem_caps]
@@ -3,6 +3,7 @@ import logging
 import os
 import random
 from typing import Any, Optional, Iterator, Dict, Any, cast
+from unittest.mock import patch
 from tenacity import retry_if_exception, Retrying, stop_after_attempt
 from pydantic import BaseModel
 
@@ -18,6 +19,7 @@ from dlt.common.destination import DestinationCapabilitiesContext
 from dlt.common.destination.capabilities import TLoaderFileFormat
 from dlt.common.exceptions import DestinationHasFailedJobs, DestinationTerminalException, PipelineStateNotAvailable, UnknownDestinationModule
 from dlt.common.pipeline import PipelineContext
+from dlt.common.storages import FileStorage, LoadStorage, NormalizeStorage
 from dlt.common.runtime.collector import AliveCollector, EnlightenCollector, LogCollector, TqdmCollector
 from dlt.common.schema.utils import new_column, new_table
 from dlt.common.utils import uniq_id
@@ -29,6 +31,7 @@ from dlt.load.exceptions import LoadClientJobFailed
 from dlt.pipeline.exceptions import InvalidPipelineName, PipelineNotActive, PipelineStepFailed
 from dlt.pipeline.helpers import retry_load
 from dlt.pipeline import TCollectorArg
+from dlt.pipeline.pipeline import Pipeline
 
 from tests.common.utils import TEST_SENTRY_DSN
 from tests.load.pipeline.utils import destinations_configs, DestinationTestConfiguration
@@ -371,6 +374,81 @@ def test_has_pending_data_flag() -> None:
     assert p.has_pending_data is False
 
 
+def test_pipeline_volumes_dir() -> None:
+    volumes_dir = os.path.join(TEST_STORAGE_ROOT, "volumes")
+    pipeline_name = "pipe_" + uniq_id()
+    os.environ["VOLUMES_DIR"] = volumes_dir
+    p = dlt.pipeline(pipeline_name=pipeline_name, destination="dummy")
+    p.extract([1, 2, 3], table_name="dummy_table")
+    # extracted files are in volumes dir, state stays in working dir
+    assert p._normalize_storage_config.normalize_volume_path == os.path.join(os.path.abspath(volumes_dir), pipeline_name, "normalize")
+    assert p.has_pending_data is True
+    assert p._pipeline_storage.has_file(p.STATE_FILE)
+    assert not p._pipeline_storage.has_folder("normalize")
+    p.normalize()
+    assert p._load_storage_config.load_volume_path == os.path.join(os.path.abspath(volumes_dir), pipeline_name, "load")
+    p.load()
+    assert p.has_pending_data is False
+
+    # volumes are wiped on drop
+    p = p.drop()
+    assert not os.path.isdir(os.path.join(volumes_dir, pipeline_name))
+
+
+def test_pipeline_volumes_dir_spill_over() -> None:
+    volumes_dir = os.path.join(TEST_STORAGE_ROOT, "volumes")
+    pipeline_name = "pipe_" + uniq_id()
+    os.environ["VOLUMES_DIR"] = volumes_dir
+    os.environ["VOLUMES_DIR_MAX_BYTES"] = "8000"
+    os.environ["COMPLETED_PROB"] = "1.0"
+    # flush extracted items often and keep file sizes predictable
+    os.environ["DATA_WRITER__BUFFER_MAX_ITEMS"] = "10"
+    os.environ["DATA_WRITER__DISABLE_COMPRESSION"] = "True"
+    volumes_path = os.path.join(os.path.abspath(volumes_dir), pipeline_name)
+    volumes_storage = FileStorage(volumes_dir)
+    p = dlt.pipeline(pipeline_name=pipeline_name, destination="dummy")
+
+    # completed packages do not count towards the limit
+    for _ in range(3):
+        p.run([{"id": i} for i in range(10)], table_name="small")
+    assert len(p.list_completed_load_packages()) == 3
+    assert volumes_storage.get_folder_size(os.path.join(pipeline_name, "load", LoadStorage.LOADED_FOLDER)) > p.config.volumes_dir_max_bytes
+    p.extract([{"id": i} for i in range(10)], table_name="small")
+    assert p._normalize_storage_config.normalize_volume_path == os.path.join(volumes_path, "normalize")
+    p.normalize()
+    p.load()
+
+    # extract spills over when extracted data exceeds the limit
+    with patch.object(ExtractorStorage, "VOLUME_CHECK_INTERVAL", 0):
+        p.extract([{"id": i, "value": uniq_id()} for i in range(1000)], table_name="big")
+    assert p._normalize_storage_config.normalize_volume_path == os.path.join(p.working_dir, "normalize")
+    assert p._load_storage_config.load_volume_path == os.path.join(p.working_dir, "load")
+    assert Pipeline._get_volumes_pending_size(volumes_storage, pipeline_name) == 0
+    # files written before and after the spill over were moved to the working dir
+    extracted_files = [f for f in p._get_normalize_storage().list_files_to_normalize_sorted() if NormalizeStorage.parse_normalize_file_name(f).table_name == "big"]
+    assert len(extracted_files) > 1
+    # all the items are normalized and loaded from the working dir
+    info = p.normalize()
+    assert info.row_counts["big"] == 1000
+    p.load()
+    assert p.has_pending_data is False
+    assert len(p.list_completed_load_packages()) == 1
+
+    # volumes dir is used again after spilled data was loaded
+    p.extract([{"id": i, "value": uniq_id()} for i in range(100)], table_name="big")
+    assert p._normalize_storage_config.normalize_volume_path == os.path.join(volumes_path, "normalize")
+    # normalize spills over if load packages will not fit
+    extracted_size = Pipeline._get_volumes_pending_size(volumes_storage, pipeline_name)
+    assert extracted_size < p.config.volumes_dir_max_bytes
+    p.config.volumes_dir_max_bytes = extracted_size + extracted_size // 2
+    p.normalize()
+    assert p._load_storage_config.load_volume_path == os.path.join(p.working_dir, "load")
+    assert Pipeline._get_volumes_pending_size(volumes_storage, pipeline_name) == 0
+    assert len(p.list_normalized_load_packages()) == 1
+    p.load()
+    assert p.has_pending_data is False
+
+
 def test_sentry_tracing() -> None:
     import sentry_sdk
 